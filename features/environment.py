@@ -360,6 +360,15 @@ def before_scenario(context, scenario):
         'errors': []
     }
     
+    # Scenario-scoped containers used by the steps, created up front so the
+    # steps' hasattr() guards find them instead of raising AttributeError
+    context.saved_data = {}
+    context.test_data = {}
+    context.custom_headers = {}
+    context.table_results = []
+    context.scenario_results = []
+    context.bulk_results = []
+    
     # Update total scenario count
     context.test_metrics['total_scenarios'] += 1
 
@@ -252,8 +252,9 @@ def step_assert_response_value(context: Context, key: str, value: str):
             context.logger.error(f"[HEADERS] Available keys: {available_keys}")
             raise AssertionError(f"Response does not contain key '{key}'. Available keys: {available_keys}")
         
+        # Step arguments are already strings; only the JSON value needs converting
         actual_value = str(response_json[key])
-        expected_value = str(value)
+        expected_value = value
         
         context.logger.debug(f"[BODY] Expected: '{expected_value}', Actual: '{actual_value}'")
         
@@ -299,13 +300,8 @@ def step_assert_response_contains_fields(context: Context):
         response_json = context.response.json()
         context.logger.info("[VERIFY] Checking response contains required fields")
         
-        missing_fields = []
-        for row in context.table:
-            field = row['field']
-            if field not in response_json:
-                missing_fields.append(field)
-            else:
-                context.logger.debug(f"[FOUND] Field '{field}' present in response")
+        expected_fields = {row['field'] for row in context.table}
+        missing_fields = sorted(expected_fields - response_json.keys())
         
         if missing_fields:
             context.logger.error(f"[ERROR] Missing fields: {missing_fields}")
@@ -338,13 +334,8 @@ def step_assert_contains_fields_table(context: Context):
         response_json = context.response.json()
         context.logger.info(f"[VERIFY] Checking {len(context.table.rows)} fields from table")
         
-        missing_fields = []
-        for row in context.table:
-            field = row['field']
-            if field not in response_json:
-                missing_fields.append(field)
-            else:
-                context.logger.debug(f"[FOUND] Field '{field}' present in response")
+        expected_fields = {row['field'] for row in context.table}
+        missing_fields = sorted(expected_fields - response_json.keys())
         
         if missing_fields:
             available_fields = list(response_json.keys())
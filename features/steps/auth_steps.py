@@ -5,11 +5,31 @@ Handles bearer token authentication, authorization scenarios, and security testi
 
 import json
 import os
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from behave import given, when, then
 from behave.runner import Context
 
 
+# Protected resource requested when probing how a token is treated
+AUTH_PROBE_PATH = '/customers/CUST001'
+
+# Keywords (already lowercase) that identify authentication error messages
+MISSING_AUTH_KEYWORDS = ('authorization', 'authenticate', 'token', 'unauthorized', 'missing')
+MISSING_AUTH_TEXT_KEYWORDS = ('authorization', 'authenticate', 'token', 'unauthorized')
+INVALID_TOKEN_KEYWORDS = ('invalid', 'token', 'forbidden', 'expired', 'malformed')
+INVALID_TOKEN_TEXT_KEYWORDS = ('invalid', 'token', 'forbidden', 'expired')
+
+# Each keyword set compiled into one alternation so a message is scanned once
+MISSING_AUTH_PATTERN = re.compile('|'.join(map(re.escape, MISSING_AUTH_KEYWORDS)))
+INVALID_TOKEN_PATTERN = re.compile('|'.join(map(re.escape, INVALID_TOKEN_KEYWORDS)))
+
+# Byte patterns for scanning raw non-JSON bodies without decoding them
+MISSING_AUTH_TEXT_PATTERN = re.compile(b'|'.join(re.escape(k.encode()) for k in MISSING_AUTH_TEXT_KEYWORDS))
+INVALID_TOKEN_TEXT_PATTERN = re.compile(b'|'.join(re.escape(k.encode()) for k in INVALID_TOKEN_TEXT_KEYWORDS))
+
+
 # ============================================================================
 # GIVEN Steps - Authentication Setup
 # ============================================================================
@@ -145,12 +165,14 @@ def step_concurrent_requests(context: Context):
     timeout = getattr(context, 'request_timeout', 30)
     
     try:
-        response = requests.get(f"{base_url}/customers/CUST001", headers=headers, timeout=timeout)
+        response = requests.get(f"{base_url}{AUTH_PROBE_PATH}", headers=headers, timeout=timeout)
         context.response = response
+        context.concurrent_status_codes = [response.status_code]
         context.logger.info(f"[RESPONSE] Concurrent request status: {response.status_code}")
     except Exception as e:
         context.logger.error(f"[ERROR] Concurrent request failed: {e}")
         context.response = None
+        context.concurrent_status_codes = []
 
 
 # ============================================================================
@@ -291,21 +313,19 @@ def step_assert_missing_auth_error(context: Context):
         response_json = context.response.json()
         error_message = response_json.get('error', response_json.get('message', ''))
         
-        auth_keywords = ['authorization', 'authenticate', 'token', 'unauthorized', 'missing']
         message_lower = error_message.lower()
         
-        if any(keyword in message_lower for keyword in auth_keywords):
+        if MISSING_AUTH_PATTERN.search(message_lower):
             context.logger.info(f"[SUCCESS] Authorization error message found: {error_message}")
         else:
             context.logger.error(f"[ERROR] Error message doesn't indicate missing authorization: {error_message}")
             raise AssertionError(f"Error message doesn't indicate authorization issue: {error_message}")
             
     except json.JSONDecodeError:
-        # Check raw text for authorization keywords
-        response_text = context.response.text.lower()
-        auth_keywords = ['authorization', 'authenticate', 'token', 'unauthorized']
+        # Check raw body bytes for authorization keywords
+        response_text = context.response.content.lower()
         
-        if any(keyword in response_text for keyword in auth_keywords):
+        if MISSING_AUTH_TEXT_PATTERN.search(response_text):
             context.logger.info(f"[SUCCESS] Authorization error found in response text")
         else:
             context.logger.error(f"[ERROR] No authorization error indication found")
@@ -336,21 +356,19 @@ def step_assert_invalid_token_error(context: Context):
         response_json = context.response.json()
         error_message = response_json.get('error', response_json.get('message', ''))
         
-        token_keywords = ['invalid', 'token', 'forbidden', 'expired', 'malformed']
         message_lower = error_message.lower()
         
-        if any(keyword in message_lower for keyword in token_keywords):
+        if INVALID_TOKEN_PATTERN.search(message_lower):
             context.logger.info(f"[SUCCESS] Invalid token error message found: {error_message}")
         else:
             context.logger.error(f"[ERROR] Error message doesn't indicate invalid token: {error_message}")
             raise AssertionError(f"Error message doesn't indicate token issue: {error_message}")
             
     except json.JSONDecodeError:
-        # Check raw text for token keywords
-        response_text = context.response.text.lower()
-        token_keywords = ['invalid', 'token', 'forbidden', 'expired']
+        # Check raw body bytes for token keywords
+        response_text = context.response.content.lower()
         
-        if any(keyword in response_text for keyword in token_keywords):
+        if INVALID_TOKEN_TEXT_PATTERN.search(response_text):
             context.logger.info(f"[SUCCESS] Invalid token error found in response text")
         else:
             context.logger.error(f"[ERROR] No invalid token error indication found")
@@ -393,10 +411,39 @@ def step_assert_case_sensitive_auth(context: Context):
     
     context.logger.info("[VERIFY] Verifying authentication is case-sensitive")
     
-    # This step should test that changing the case of the auth token fails
-    # For now, we'll just log and pass since this requires specific test setup
-    context.logger.info("[INFO] Case-sensitivity verification completed")
-    context.logger.warning("[WARNING] Case-sensitivity test requires specific token variants")
+    token = getattr(context, 'auth_token', None) or getattr(context, 'original_auth_token', None)
+    if not token:
+        context.logger.warning("[WARNING] Case-sensitivity test requires specific token variants")
+        return
+    
+    # Only probe variants that actually differ from the configured token
+    variants = {token.upper(), token.lower(), token.capitalize()} - {token}
+    if not variants:
+        context.logger.warning("[WARNING] Token has no case variants to probe")
+        return
+    
+    base_url = getattr(context, 'base_url', 'https://your-wiremock-app.railway.app')
+    base_headers = getattr(context, 'auth_headers', {})
+    timeout = getattr(context, 'request_timeout', 30)
+    
+    probe_url = f"{base_url}{AUTH_PROBE_PATH}"
+    
+    # Variants are independent, so send them concurrently over one pooled session
+    with requests.Session() as session:
+        def probe(variant: str) -> int:
+            # Per-request headers so the shared auth headers are never mutated
+            headers = {**base_headers, 'Authorization': f'Bearer {variant}'}
+            return session.get(probe_url, headers=headers, timeout=timeout).status_code
+        
+        with ThreadPoolExecutor(max_workers=len(variants)) as executor:
+            status_codes = list(executor.map(probe, variants))
+    
+    context.logger.info(f"[INFO] Case variant statuses: {status_codes}")
+    if not all(code in (401, 403) for code in status_codes):
+        context.logger.error(f"[ERROR] Case variant of token was accepted: {status_codes}")
+        raise AssertionError(f"Expected 401/403 for case variants of the token, got {status_codes}")
+    
+    context.logger.info("[SUCCESS] Case-sensitivity verification completed")
 
 
 @then('all concurrent requests should succeed')
@@ -409,13 +456,15 @@ def step_assert_concurrent_success(context: Context):
     
     context.logger.info("[VERIFY] Verifying all concurrent requests succeeded")
     
-    # Check if we have a response from the concurrent request step
-    if hasattr(context, 'response') and context.response:
-        if context.response.status_code in [200, 201]:
-            context.logger.info(f"[SUCCESS] Concurrent request succeeded: {context.response.status_code}")
+    # Check the status codes collected by the concurrent request step in one pass
+    status_codes = getattr(context, 'concurrent_status_codes', None)
+    if status_codes:
+        unexpected = set(status_codes) - {200, 201}
+        if not unexpected:
+            context.logger.info(f"[SUCCESS] Concurrent requests succeeded: {len(status_codes)} responses")
         else:
-            context.logger.error(f"[ERROR] Concurrent request failed: {context.response.status_code}")
-            raise AssertionError(f"Concurrent request failed with status {context.response.status_code}")
+            context.logger.error(f"[ERROR] Concurrent request failed: {sorted(unexpected)}")
+            raise AssertionError(f"Concurrent request failed with status {sorted(unexpected)}")
     else:
         context.logger.warning("[WARNING] No concurrent request response to verify")
         context.logger.info("[INFO] Assuming concurrent requests succeeded")
@@ -431,13 +480,15 @@ def step_assert_concurrent_unauthorized(context: Context):
     
     context.logger.info("[VERIFY] Verifying all concurrent requests were unauthorized")
     
-    # Check if we have a response from the concurrent request step
-    if hasattr(context, 'response') and context.response:
-        if context.response.status_code == 401:
-            context.logger.info(f"[SUCCESS] Concurrent requests were properly unauthorized: {context.response.status_code}")
+    # Check the status codes collected by the concurrent request step in one pass
+    status_codes = getattr(context, 'concurrent_status_codes', None)
+    if status_codes:
+        unexpected = set(status_codes) - {401}
+        if not unexpected:
+            context.logger.info(f"[SUCCESS] Concurrent requests were properly unauthorized: {len(status_codes)} responses")
         else:
-            context.logger.error(f"[ERROR] Expected 401 for concurrent request, got: {context.response.status_code}")
-            raise AssertionError(f"Expected 401 Unauthorized for concurrent request, got {context.response.status_code}")
+            context.logger.error(f"[ERROR] Expected 401 for concurrent request, got: {sorted(unexpected)}")
+            raise AssertionError(f"Expected 401 Unauthorized for concurrent request, got {sorted(unexpected)}")
     else:
         context.logger.warning("[WARNING] No concurrent request response to verify")
         context.logger.info("[INFO] Assuming concurrent requests were unauthorized")
\ No newline at end of file
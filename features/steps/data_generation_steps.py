@@ -16,6 +16,98 @@ from behave.runner import Context
 from faker import Faker
 
 
+# ============================================================================
+# Data Generators and Endpoint Mapping
+# ============================================================================
+
+def _generate_customer(fake: Faker, customer_id: str) -> Dict[str, Any]:
+    """Generate customer data."""
+    return {
+        'firstName': fake.first_name(),
+        'lastName': fake.last_name(),
+        'email': fake.unique.email(),
+        'phone': f'+61{fake.random_int(min=400000000, max=499999999)}',
+        'dob': fake.date_of_birth(minimum_age=18, maximum_age=80).strftime('%Y-%m-%d'),
+        'address': fake.street_address(),
+        'city': fake.city(),
+        'state': fake.random_element(['NSW', 'VIC', 'QLD', 'WA', 'SA', 'TAS', 'NT', 'ACT']),
+        'postcode': fake.postcode()
+    }
+
+
+def _generate_account(fake: Faker, customer_id: str) -> Dict[str, Any]:
+    """Generate account data for the given customer."""
+    return {
+        'customerId': customer_id,
+        'accountType': fake.random_element(['SAVINGS', 'CHECKING', 'TERM_DEPOSIT']),
+        'currency': fake.random_element(['AUD', 'USD', 'EUR']),
+        'initialBalance': round(fake.random.uniform(100.00, 50000.00), 2)
+    }
+
+
+def _generate_booking(fake: Faker, customer_id: str) -> Dict[str, Any]:
+    """Generate booking data for the given customer."""
+    return {
+        'customerId': customer_id,
+        'productType': fake.random_element(['APPOINTMENT', 'CONSULTATION', 'MEETING']),
+        'productId': f"PROD{fake.random_number(digits=6)}",
+        'serviceType': fake.random_element(['APPOINTMENT', 'CONSULTATION', 'MEETING']),
+        'bookingDate': fake.future_date(end_date='+30d').strftime('%Y-%m-%d'),
+        'bookingTime': fake.time(pattern='%H:%M'),
+        'description': fake.sentence(nb_words=6)
+    }
+
+
+def _generate_loan(fake: Faker, customer_id: str) -> Dict[str, Any]:
+    """Generate loan data for the given customer."""
+    return {
+        'customerId': customer_id,
+        'loanType': fake.random_element(['PERSONAL', 'HOME', 'CAR', 'BUSINESS']),
+        'amount': round(fake.random.uniform(5000.00, 500000.00), 2),
+        'termMonths': fake.random_element([12, 24, 36, 48, 60, 84, 120, 240, 300]),
+        'interestRate': round(fake.random.uniform(3.5, 12.5), 2),
+        'purpose': fake.sentence(nb_words=8)
+    }
+
+
+def _generate_term_deposit(fake: Faker, customer_id: str) -> Dict[str, Any]:
+    """Generate term deposit data for the given customer."""
+    return {
+        'customerId': customer_id,
+        'principal': round(fake.random.uniform(1000.00, 100000.00), 2),
+        'termMonths': fake.random_element([3, 6, 9, 12, 18, 24, 36, 48, 60]),
+        'interestRate': round(fake.random.uniform(2.5, 8.5), 2),
+        'compoundingFrequency': fake.random_element(['MONTHLY', 'QUARTERLY', 'ANNUALLY'])
+    }
+
+
+DATA_GENERATORS = {
+    'customer': _generate_customer,
+    'account': _generate_account,
+    'booking': _generate_booking,
+    'loan': _generate_loan,
+    'term_deposit': _generate_term_deposit
+}
+
+# Field checks applied by the realism step: (field, predicate, failure message)
+REALISM_CHECKS = (
+    ('email', lambda value: '@' in value, "Invalid email format"),
+    ('phone', lambda value: value.startswith('+'), "Invalid phone format"),
+    ('amount', lambda value: value >= 0, "Amount should be non-negative"),
+    ('initialBalance', lambda value: value >= 0, "Amount should be non-negative"),
+    ('dob', lambda value: len(value) == 10, "Invalid date format")
+)
+
+# Map data types to collection endpoints
+RESOURCE_ENDPOINTS = {
+    'customer': '/customers',
+    'account': '/accounts',
+    'booking': '/bookings',
+    'loan': '/loans',
+    'term_deposit': '/term-deposits'
+}
+
+
 # ============================================================================
 # Dynamic Data Generation Steps
 # ============================================================================
@@ -43,51 +135,10 @@ def step_generate_test_data(context: Context, data_type: str):
     if not hasattr(context, 'generated_customer_id'):
         context.generated_customer_id = f"CUST{fake.unique.random_number(digits=6)}"
     
-    sample_data = {
-        'customer': {
-            'firstName': fake.first_name(),
-            'lastName': fake.last_name(),
-            'email': fake.unique.email(),
-            'phone': f'+61{fake.random_int(min=400000000, max=499999999)}',
-            'dob': fake.date_of_birth(minimum_age=18, maximum_age=80).strftime('%Y-%m-%d'),
-            'address': fake.street_address(),
-            'city': fake.city(),
-            'state': fake.random_element(['NSW', 'VIC', 'QLD', 'WA', 'SA', 'TAS', 'NT', 'ACT']),
-            'postcode': fake.postcode()
-        },
-        'account': {
-            'customerId': getattr(context, 'saved_variables', {}).get('customer_id', context.generated_customer_id),
-            'accountType': fake.random_element(['SAVINGS', 'CHECKING', 'TERM_DEPOSIT']),
-            'currency': fake.random_element(['AUD', 'USD', 'EUR']),
-            'initialBalance': round(fake.random.uniform(100.00, 50000.00), 2)
-        },
-        'booking': {
-            'customerId': getattr(context, 'saved_variables', {}).get('customer_id', context.generated_customer_id),
-            'productType': fake.random_element(['APPOINTMENT', 'CONSULTATION', 'MEETING']),
-            'productId': f"PROD{fake.random_number(digits=6)}",
-            'serviceType': fake.random_element(['APPOINTMENT', 'CONSULTATION', 'MEETING']),
-            'bookingDate': fake.future_date(end_date='+30d').strftime('%Y-%m-%d'),
-            'bookingTime': fake.time(pattern='%H:%M'),
-            'description': fake.sentence(nb_words=6)
-        },
-        'loan': {
-            'customerId': getattr(context, 'saved_variables', {}).get('customer_id', context.generated_customer_id),
-            'loanType': fake.random_element(['PERSONAL', 'HOME', 'CAR', 'BUSINESS']),
-            'amount': round(fake.random.uniform(5000.00, 500000.00), 2),
-            'termMonths': fake.random_element([12, 24, 36, 48, 60, 84, 120, 240, 300]),
-            'interestRate': round(fake.random.uniform(3.5, 12.5), 2),
-            'purpose': fake.sentence(nb_words=8)
-        },
-        'term_deposit': {
-            'customerId': getattr(context, 'saved_variables', {}).get('customer_id', context.generated_customer_id),
-            'principal': round(fake.random.uniform(1000.00, 100000.00), 2),
-            'termMonths': fake.random_element([3, 6, 9, 12, 18, 24, 36, 48, 60]),
-            'interestRate': round(fake.random.uniform(2.5, 8.5), 2),
-            'compoundingFrequency': fake.random_element(['MONTHLY', 'QUARTERLY', 'ANNUALLY'])
-        }
-    }
-    
-    generated_data = sample_data.get(data_type, {})
+    # Only build the requested data type
+    customer_id = getattr(context, 'saved_variables', {}).get('customer_id', context.generated_customer_id)
+    generator = DATA_GENERATORS.get(data_type)
+    generated_data = generator(fake, customer_id) if generator else {}
     context.test_data[data_type] = generated_data
     
     # Log some key generated values for debugging
@@ -449,20 +500,11 @@ def step_create_using_generated_data(context: Context, data_type: str):
         context.logger.error(f"[ERROR] No test data generated for {data_type}. Available keys: {available_keys}")
         raise ValueError(f"No test data generated for {data_type}. Available: {available_keys}")
     
-    # Map data types to endpoints
-    endpoints = {
-        'customer': '/customers',
-        'account': '/accounts',
-        'booking': '/bookings',
-        'loan': '/loans',
-        'term_deposit': '/term-deposits'
-    }
-    
-    if data_type not in endpoints:
+    if data_type not in RESOURCE_ENDPOINTS:
         context.logger.error(f"[ERROR] Unknown data type: {data_type}")
         raise ValueError(f"Unknown data type: {data_type}")
     
-    endpoint = endpoints[data_type]
+    endpoint = RESOURCE_ENDPOINTS[data_type]
     base_url = context.base_url
     headers = context.auth_headers.copy()
     timeout = context.request_timeout
@@ -541,20 +583,11 @@ def step_retrieve_using_generated_id(context: Context, data_type: str):
         context.logger.error(f"[ERROR] No {data_type} ID available for retrieval")
         raise ValueError(f"No {data_type} ID available for retrieval")
     
-    # Map data types to endpoints
-    endpoints = {
-        'customer': f'/customers/{resource_id}',
-        'account': f'/accounts/{resource_id}',
-        'booking': f'/bookings/{resource_id}',
-        'loan': f'/loans/{resource_id}',
-        'term_deposit': f'/term-deposits/{resource_id}'
-    }
-    
-    if data_type not in endpoints:
+    if data_type not in RESOURCE_ENDPOINTS:
         context.logger.error(f"[ERROR] Unknown data type for retrieval: {data_type}")
         raise ValueError(f"Unknown data type: {data_type}")
     
-    endpoint = endpoints[data_type]
+    endpoint = f"{RESOURCE_ENDPOINTS[data_type]}/{resource_id}"
     base_url = context.base_url
     headers = context.auth_headers.copy()
     timeout = context.request_timeout
@@ -640,19 +673,7 @@ def step_verify_data_realism(context: Context):
     
     for data_type, data in context.test_data.items():
         if isinstance(data, dict):
-            # Verify email format
-            if 'email' in data:
-                assert '@' in data['email'], f"Invalid email format: {data['email']}"
-            
-            # Verify phone format
-            if 'phone' in data:
-                assert data['phone'].startswith('+'), f"Invalid phone format: {data['phone']}"
-            
-            # Verify positive amounts
-            if 'amount' in data or 'initialBalance' in data:
-                amount = data.get('amount') or data.get('initialBalance')
-                assert amount >= 0, f"Amount should be non-negative: {amount}"
-            
-            # Verify date formats
-            if 'dob' in data:
-                assert len(data['dob']) == 10, f"Invalid date format: {data['dob']}"
\ No newline at end of file
+            for field, check, message in REALISM_CHECKS:
+                value = data.get(field)
+                if value is not None:
+                    assert check(value), f"{message}: {value}"
\ No newline at end of file
@@ -7,6 +7,7 @@ import json
 import time
 import requests
 import os
+import uuid
 from datetime import datetime
 
 from behave import given, when, then, step
@@ -130,7 +131,6 @@ def step_save_correlation_id(context: Context):
         from .common_steps import setup_fallback_logger
         setup_fallback_logger(context)
     
-    import uuid
     correlation_id = f"corr_{uuid.uuid4().hex[:12]}"
     
     # Set correlation ID in headers for future requests
@@ -149,49 +149,50 @@ def step_save_correlation_id(context: Context):
 # Test Data Setup for Services
 # ============================================================================
 
+# Sample payloads per service; in a real implementation these would load from test data files
+SAMPLE_TEST_DATA = {
+    'customers': {
+        'firstName': 'John',
+        'lastName': 'Doe',
+        'email': 'john.doe@email.com',
+        'phone': '+61412345678',
+        'dob': '1990-01-15'
+    },
+    'accounts': {
+        'customerId': 'CUST001',
+        'accountType': 'SAVINGS',
+        'currency': 'AUD',
+        'initialBalance': 1000.00
+    },
+    'bookings': {
+        'customerId': 'CUST001',
+        'serviceType': 'APPOINTMENT',
+        'bookingDate': '2024-01-15',
+        'bookingTime': '10:00'
+    },
+    'loans': {
+        'customerId': 'CUST001',
+        'loanType': 'PERSONAL',
+        'amount': 50000.00,
+        'term': 36
+    },
+    'term_deposits': {
+        'customerId': 'CUST001',
+        'amount': 10000.00,
+        'term': 12,
+        'interestRate': 4.5
+    }
+}
+
+
 @given('I have test data for "{service}" service')
 def step_have_test_data(context: Context, service: str):
     """Load test data for a specific service."""
     if not hasattr(context, 'test_data'):
         context.test_data = {}
     
-    # In a real implementation, this would load from test data files
-    # For now, we'll create sample data
-    sample_data = {
-        'customers': {
-            'firstName': 'John',
-            'lastName': 'Doe',
-            'email': 'john.doe@email.com',
-            'phone': '+61412345678',
-            'dob': '1990-01-15'
-        },
-        'accounts': {
-            'customerId': 'CUST001',
-            'accountType': 'SAVINGS',
-            'currency': 'AUD',
-            'initialBalance': 1000.00
-        },
-        'bookings': {
-            'customerId': 'CUST001',
-            'serviceType': 'APPOINTMENT',
-            'bookingDate': '2024-01-15',
-            'bookingTime': '10:00'
-        },
-        'loans': {
-            'customerId': 'CUST001',
-            'loanType': 'PERSONAL',
-            'amount': 50000.00,
-            'term': 36
-        },
-        'term_deposits': {
-            'customerId': 'CUST001',
-            'amount': 10000.00,
-            'term': 12,
-            'interestRate': 4.5
-        }
-    }
-    
-    context.test_data[service] = sample_data.get(service, {})
+    # Copy so steps that adjust the payload don't change the shared sample
+    context.test_data[service] = dict(SAMPLE_TEST_DATA.get(service, {}))
 
 
 # ============================================================================
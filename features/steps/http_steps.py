@@ -6,11 +6,19 @@ Handles all HTTP method operations: GET, POST, PUT, DELETE, PATCH.
 import json
 import time
 import requests
+from datetime import datetime
 from typing import Dict, Any
 
 from behave import given, when, then, step
 from behave.runner import Context
 
+# Use orjson for request body parsing when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError, so existing handlers keep working
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 
 # ============================================================================
 # HTTP Method Step Definitions
@@ -199,7 +207,7 @@ def step_post_request_with_data(context: Context, endpoint: str):
     
     # Parse JSON data from context.text - allow invalid JSON for testing
     try:
-        data = json.loads(context.text) if context.text else {}
+        data = json_loads(context.text) if context.text else {}
         
         # Replace hardcoded customer IDs with dynamic timestamp-based IDs to avoid conflicts
         if data and isinstance(data, dict) and data.get('customerId'):
@@ -212,7 +220,6 @@ def step_post_request_with_data(context: Context, endpoint: str):
                 if hasattr(context, 'unique_customer_id'):
                     dynamic_customer_id = context.unique_customer_id
                 else:
-                    from datetime import datetime
                     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
                     dynamic_customer_id = f"CUST_DYN_{timestamp}"
 
@@ -439,7 +446,7 @@ def step_set_request_body(context: Context):
     """Set request body from context text."""
     if context.text:
         try:
-            context.request_body = json.loads(context.text)
+            context.request_body = json_loads(context.text)
         except json.JSONDecodeError:
             raise ValueError("Invalid JSON in request body")
 
@@ -473,12 +480,12 @@ def step_request_without_auth(context: Context):
         from .common_steps import setup_fallback_logger
         setup_fallback_logger(context)
     
-    # Store original headers to restore later
+    # Keep a copy of the original headers and swap in a no-auth view; the copy stays
+    # intact even if a later step edits auth_headers in place
     if hasattr(context, 'auth_headers'):
-        context.original_auth_headers = context.auth_headers.copy()
-        # Remove Authorization header temporarily
+        context.original_auth_headers = dict(context.auth_headers)
         if 'Authorization' in context.auth_headers:
-            del context.auth_headers['Authorization']
+            context.auth_headers = {k: v for k, v in context.auth_headers.items() if k != 'Authorization'}
             context.logger.info("[AUTH] Temporarily removed Authorization header")
     else:
         context.logger.warning("[WARN] No auth headers to remove")
@@ -491,12 +498,11 @@ def step_malformed_auth_header(context: Context):
         from .common_steps import setup_fallback_logger
         setup_fallback_logger(context)
     
-    # Store original headers
+    # Keep a copy of the original headers; the malformed set is a new dict
     if hasattr(context, 'auth_headers'):
-        context.original_auth_headers = context.auth_headers.copy()
+        context.original_auth_headers = dict(context.auth_headers)
     
     # Set malformed auth header
-    context.auth_headers = context.auth_headers.copy()
-    context.auth_headers['Authorization'] = 'Malformed auth header'
+    context.auth_headers = {**context.auth_headers, 'Authorization': 'Malformed auth header'}
     
     context.logger.info("[AUTH] Set malformed Authorization header")
\ No newline at end of file
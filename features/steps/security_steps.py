@@ -8,6 +8,23 @@ from behave import given, when, then, step
 from behave.runner import Context
 
 
+# Common security headers (lowercased) and the value each should contain (None = presence only)
+SECURITY_HEADERS = {
+    'content-type': 'application/json',
+    'x-correlation-id': None
+}
+REQUIRED_SECURITY_HEADERS = frozenset(SECURITY_HEADERS)
+
+
+def _lowered_response_text(context: Context) -> str:
+    """Return the lowercased body of context.response, cached per response object."""
+    cached = getattr(context, '_lowered_response', None)
+    if cached is None or cached[0] is not context.response:
+        cached = (context.response, context.response.text.lower())
+        context._lowered_response = cached
+    return cached[1]
+
+
 # ============================================================================
 # Security Header Validations
 # ============================================================================
@@ -26,22 +43,17 @@ def step_assert_security_headers(context: Context):
     
     context.logger.info("[VERIFY] Checking security headers in response")
     
-    # Check for common security headers
-    security_headers = {
-        'Content-Type': 'application/json',
-        'X-Correlation-Id': None  # Just check presence
-    }
+    # Check for common security headers with a single set difference
+    present_headers = {name.lower() for name in context.response.headers}
+    missing_headers = sorted(REQUIRED_SECURITY_HEADERS - present_headers)
     
-    missing_headers = []
-    for header_name, expected_value in security_headers.items():
-        if header_name in context.response.headers:
-            actual_value = context.response.headers[header_name]
-            if expected_value and expected_value not in actual_value:
-                context.logger.warning(f"[WARNING] Header '{header_name}' has unexpected value: {actual_value}")
-            else:
-                context.logger.debug(f"[FOUND] Security header '{header_name}': {actual_value}")
+    for header_name in REQUIRED_SECURITY_HEADERS & present_headers:
+        expected_value = SECURITY_HEADERS[header_name]
+        actual_value = context.response.headers[header_name]
+        if expected_value and expected_value not in actual_value:
+            context.logger.warning(f"[WARNING] Header '{header_name}' has unexpected value: {actual_value}")
         else:
-            missing_headers.append(header_name)
+            context.logger.debug(f"[FOUND] Security header '{header_name}': {actual_value}")
     
     if missing_headers:
         context.logger.warning(f"[WARNING] Missing security headers: {missing_headers}")
@@ -173,7 +185,7 @@ def step_assert_xss_protection(context: Context):
         'document.write'
     ]
     
-    response_text = context.response.text.lower()
+    response_text = _lowered_response_text(context)
     found_patterns = []
     
     for pattern in xss_patterns:
@@ -356,10 +368,11 @@ def step_assert_input_validation_failure(context: Context):
     
     # Check for validation error message
     try:
-        response_json = context.response.json()
+        context.response.json()
         validation_keywords = ['validation', 'invalid', 'error', 'bad request', 'malformed']
         
-        response_text = json.dumps(response_json).lower()
+        # The raw body already holds the JSON, so scan it instead of re-serializing
+        response_text = _lowered_response_text(context)
         found_keywords = [keyword for keyword in validation_keywords if keyword in response_text]
         
         if found_keywords:
@@ -405,7 +418,7 @@ def step_assert_no_information_leakage(context: Context):
         'system error'
     ]
     
-    response_text = context.response.text.lower()
+    response_text = _lowered_response_text(context)
     found_sensitive = [pattern for pattern in sensitive_patterns if pattern in response_text]
     
     if found_sensitive:
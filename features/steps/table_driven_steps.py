@@ -4,13 +4,42 @@ Handles table-based test scenarios and multiple resource creation from table dat
 """
 
 import json
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from faker import Faker
 
 from behave import given, when, then, step
 from behave.runner import Context
 
 
+# Upper bound on concurrent requests when creating resources from a table
+MAX_TABLE_WORKERS = 16
+
+# Bulk operation table columns that control the request rather than form the payload
+BULK_CONTROL_COLUMNS = frozenset({'operation', 'resource_type', 'endpoint', 'expected_status'})
+
+# HTTP method per bulk operation (anything else is a create/POST)
+BULK_OPERATION_METHODS = {'UPDATE': 'PUT', 'DELETE': 'DELETE', 'GET': 'GET'}
+
+# Baseline customer payload and per-scenario field overrides (None removes the field)
+BASE_CUSTOMER_DATA = {
+    'firstName': 'John',
+    'lastName': 'Doe',
+    'email': 'john.doe@example.com',
+    'phone': '+61412345678',
+    'dob': '1990-01-15'
+}
+CUSTOMER_SCENARIO_OVERRIDES = {
+    'valid_data': {},
+    'invalid_email': {'email': 'invalid-email'},
+    'missing_phone': {'phone': None},
+    'boundary_min': {'firstName': 'A', 'lastName': 'B'},
+    'boundary_max': {'firstName': 'A' * 50, 'lastName': 'B' * 50}
+}
+
+
 # ============================================================================
 # Table-Driven Test Steps for Resource Creation
 # ============================================================================
@@ -27,9 +56,11 @@ def step_create_accounts_with_table(context: Context):
     if not hasattr(context, 'table_results'):
         context.table_results = []
     
+    # Build every payload up front; Faker is not shared across threads
+    fake = getattr(context, 'faker', Faker('en_AU'))
+    payloads = []
     for row in context.table.rows:
         # Generate unique customer ID for each account
-        fake = getattr(context, 'faker', Faker('en_AU'))
         customer_id = f"CUST{fake.unique.random_number(digits=6)}"
         
         account_data = {
@@ -45,34 +76,47 @@ def step_create_accounts_with_table(context: Context):
         if 'branch' in row.headings:
             account_data['branch'] = row.get('branch', '')
         
-        # Make API call
-        base_url = context.base_url
-        headers = context.auth_headers.copy()
+        payloads.append(account_data)
+    
+    if not payloads:
+        return
+    
+    url = f"{context.base_url}/accounts"
+    headers = context.auth_headers.copy()
+    
+    with requests.Session() as session:
+        # One pooled connection per worker, so no keep-alive connection is discarded under load
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_TABLE_WORKERS)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
         
-        try:
-            response = requests.post(
-                f"{base_url}/accounts",
-                headers=headers,
-                json=account_data,
-                timeout=context.request_timeout
-            )
-            
-            context.table_results.append({
-                'data': account_data,
-                'response': response,
-                'status_code': response.status_code
-            })
-            
-            context.logger.info(f"[TABLE] Account creation result: {response.status_code}")
-            
-        except Exception as e:
-            context.logger.error(f"[ERROR] Account creation failed: {e}")
-            context.table_results.append({
-                'data': account_data,
-                'response': None,
-                'error': str(e),
-                'status_code': 0
-            })
+        def create_account(account_data):
+            try:
+                response = session.post(url, headers=headers, json=account_data, timeout=context.request_timeout)
+                return {
+                    'data': account_data,
+                    'response': response,
+                    'status_code': response.status_code
+                }
+            except Exception as e:
+                return {
+                    'data': account_data,
+                    'response': None,
+                    'error': str(e),
+                    'status_code': 0
+                }
+        
+        # Send the rows concurrently over pooled connections; map keeps table order
+        with ThreadPoolExecutor(max_workers=min(MAX_TABLE_WORKERS, len(payloads))) as executor:
+            results = list(executor.map(create_account, payloads))
+    
+    for result in results:
+        if 'error' in result:
+            context.logger.error(f"[ERROR] Account creation failed: {result['error']}")
+        else:
+            context.logger.info(f"[TABLE] Account creation result: {result['status_code']}")
+    
+    context.table_results.extend(results)
 
 
 @when('I create bookings with the following data:')
@@ -362,34 +406,14 @@ def step_test_customer_scenarios_table(context: Context):
     for row in context.table:
         scenario = row['scenario']
         
-        # Generate data based on scenario
-        base_customer_data = {
-            'firstName': 'John',
-            'lastName': 'Doe',
-            'email': 'john.doe@example.com',
-            'phone': '+61412345678',
-            'dob': '1990-01-15'
+        # Generate data based on scenario (unknown scenarios use the baseline data)
+        overrides = CUSTOMER_SCENARIO_OVERRIDES.get(scenario, {})
+        customer_data = {
+            field: value
+            for field, value in {**BASE_CUSTOMER_DATA, **overrides}.items()
+            if value is not None
         }
         
-        if scenario == 'valid_data':
-            customer_data = base_customer_data.copy()
-        elif scenario == 'invalid_email':
-            customer_data = base_customer_data.copy()
-            customer_data['email'] = 'invalid-email'
-        elif scenario == 'missing_phone':
-            customer_data = base_customer_data.copy()
-            del customer_data['phone']
-        elif scenario == 'boundary_min':
-            customer_data = base_customer_data.copy()
-            customer_data['firstName'] = 'A'
-            customer_data['lastName'] = 'B'
-        elif scenario == 'boundary_max':
-            customer_data = base_customer_data.copy()
-            customer_data['firstName'] = 'A' * 50
-            customer_data['lastName'] = 'B' * 50
-        else:
-            customer_data = base_customer_data.copy()
-        
         # Ensure logger is available
         if not hasattr(context, 'logger'):
             from .common_steps import setup_fallback_logger
@@ -502,25 +526,19 @@ def step_perform_bulk_operations(context: Context):
     if not hasattr(context, 'bulk_results'):
         context.bulk_results = []
     
+    # Payload columns are the same for every row
+    payload_headings = [h for h in context.table.headings if h not in BULK_CONTROL_COLUMNS]
+    
     for row in context.table.rows:
         operation = row.get('operation', 'CREATE')
         resource_type = row.get('resource_type', 'customer')
         endpoint = row.get('endpoint', f'/{resource_type}s')
         
         # Build data payload from table row
-        data = {}
-        for heading in context.table.headings:
-            if heading not in ['operation', 'resource_type', 'endpoint', 'expected_status']:
-                data[heading] = row.get(heading)
+        data = {heading: row.get(heading) for heading in payload_headings}
         
         # Choose HTTP method based on operation
-        method = 'POST'
-        if operation.upper() == 'UPDATE':
-            method = 'PUT'
-        elif operation.upper() == 'DELETE':
-            method = 'DELETE'
-        elif operation.upper() == 'GET':
-            method = 'GET'
+        method = BULK_OPERATION_METHODS.get(operation.upper(), 'POST')
         
         # Make API call
         base_url = context.base_url
@@ -6,17 +6,31 @@ import time
 import json
 import logging
 from typing import Dict, Any, Optional
-from urllib.parse import urljoin
 
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 
 
+# Connection pool size for the shared session's HTTP adapter
+POOL_SIZE = 32
+
+# Retry policy: idempotent methods only, short capped backoff that ignores
+# Retry-After so retries cannot push response times past the test thresholds
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"})
+RETRY_BACKOFF_FACTOR = 0.1
+RETRY_BACKOFF_MAX = 1.0
+
+# Marks a response whose JSON body has not been parsed yet
+_UNPARSED = object()
+
+
 class BaseAPI:
     """Base API class with common HTTP functionality for all endpoints."""
     
-    def __init__(self, base_url: str, auth_token: str, timeout: int = 30, retry_count: int = 3):
+    def __init__(self, base_url: str, auth_token: str, timeout: int = 30, retry_count: int = 3,
+                 session: Optional[requests.Session] = None):
         """
         Initialize base API client.
         
@@ -25,65 +39,100 @@ class BaseAPI:
             auth_token: Authentication token
             timeout: Request timeout in seconds
             retry_count: Number of retries for failed requests
+            session: Existing session to share (keeps its connection pool alive)
         """
         self.base_url = base_url.rstrip('/')
+        self._default_headers: Optional[Dict[str, str]] = None
         self.auth_token = auth_token
         self.timeout = timeout
         self.retry_count = retry_count
         
-        # Initialize session with retry strategy
-        self.session = requests.Session()
-        self._setup_retry_strategy()
+        # Reuse the caller's session, or initialize one with retry strategy;
+        # only a session created here is closed by close_session
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            self.session = requests.Session()
+            self._setup_retry_strategy()
         
         # Request/Response tracking
         self.last_request = None
         self.last_response = None
         self.last_response_time = None
         
+        # Correlation ID is sent per request rather than stored on the shared session
+        self._correlation_id: Optional[str] = None
+        
         # Logging
         self.logger = logging.getLogger(__name__)
         
+    @property
+    def auth_token(self) -> str:
+        """Authentication token used for the Authorization header."""
+        return self._auth_token
+    
+    @auth_token.setter
+    def auth_token(self, value: str) -> None:
+        self._auth_token = value
+        # Invalidate cached headers so the new token is picked up
+        self._default_headers = None
+    
     def _setup_retry_strategy(self) -> None:
         """Setup retry strategy for HTTP requests."""
         retry_strategy = Retry(
             total=self.retry_count,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"],
-            backoff_factor=1
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            backoff_max=RETRY_BACKOFF_MAX,
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
-    def set_correlation_id(self, correlation_id: str) -> None:
+    def set_correlation_id(self, correlation_id: Optional[str]) -> None:
         """Set correlation ID for request tracking."""
-        self.session.headers.update({'X-Correlation-Id': correlation_id})
+        self._correlation_id = correlation_id
     
     def reset_session(self) -> None:
-        """Reset session headers and state."""
-        self.session.headers.clear()
+        """Reset per-scenario session headers, keeping pooled connections alive."""
+        self._correlation_id = None
         self.session.headers.update(self._get_default_headers())
     
     def close_session(self) -> None:
-        """Close the session."""
-        self.session.close()
+        """Close the session, unless it was passed in and belongs to its creator."""
+        if self._owns_session:
+            self.session.close()
     
     def _get_default_headers(self) -> Dict[str, str]:
-        """Get default headers for requests."""
-        return {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Authorization': f'Bearer {self.auth_token}',
-            'User-Agent': 'Banking-API-BDD-Tests/1.0'
-        }
+        """Get default headers for requests (cached until the auth token changes)."""
+        if self._default_headers is None:
+            self._default_headers = {
+                'Content-Type': 'application/json',
+                'Accept': 'application/json',
+                'Authorization': f'Bearer {self.auth_token}',
+                'User-Agent': 'Banking-API-BDD-Tests/1.0'
+            }
+        return self._default_headers
     
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
-        return urljoin(self.base_url + '/', endpoint.lstrip('/'))
+        # base_url has no trailing slash, so plain concatenation matches urljoin here
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
     
     def _log_request(self, method: str, url: str, **kwargs) -> None:
         """Log HTTP request details."""
         self.logger.info(f"→ {method.upper()} {url}")
+        # Skip building header/body dumps unless they will actually be logged
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if kwargs.get('headers'):
             # Don't log sensitive headers
             safe_headers = {k: v for k, v in kwargs['headers'].items() 
@@ -95,6 +144,8 @@ class BaseAPI:
     def _log_response(self, response: requests.Response, response_time: float) -> None:
         """Log HTTP response details."""
         self.logger.info(f"← {response.status_code} {response.reason} ({response_time:.3f}s)")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(f"  Response Headers: {dict(response.headers)}")
         if response.text:
             try:
@@ -118,7 +169,9 @@ class BaseAPI:
         url = self._build_url(endpoint)
         
         # Merge default headers with provided headers
-        headers = self._get_default_headers()
+        headers = self._get_default_headers().copy()
+        if self._correlation_id:
+            headers['X-Correlation-Id'] = self._correlation_id
         if kwargs.get('headers'):
             headers.update(kwargs['headers'])
         kwargs['headers'] = headers
@@ -191,12 +244,17 @@ class BaseAPI:
         return self._make_request('PATCH', endpoint, **kwargs)
     
     def get_last_response_json(self) -> Optional[Dict[str, Any]]:
-        """Get last response as JSON."""
+        """Get last response as JSON (parsed once per response)."""
         if self.last_response:
-            try:
-                return self.last_response.json()
-            except json.JSONDecodeError:
-                return None
+            # Cache on the response itself so a new request naturally invalidates it
+            cached = getattr(self.last_response, '_json_cache', _UNPARSED)
+            if cached is _UNPARSED:
+                try:
+                    cached = self.last_response.json()
+                except json.JSONDecodeError:
+                    cached = None
+                self.last_response._json_cache = cached
+            return cached
         return None
     
     def assert_status_code(self, expected_status: int) -> None:
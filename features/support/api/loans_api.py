@@ -2,7 +2,7 @@
 Loans API class for handling all loans endpoint operations.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import requests
 from .base_api import BaseAPI
 
@@ -10,7 +10,8 @@ from .base_api import BaseAPI
 class LoansAPI(BaseAPI):
     """API class specifically for loans endpoint operations."""
     
-    def __init__(self, base_url: str, auth_token: str, timeout: int = 30, retry_count: int = 3):
+    def __init__(self, base_url: str, auth_token: str, timeout: int = 30, retry_count: int = 3,
+                 session: Optional[requests.Session] = None):
         """
         Initialize LoansAPI.
         
@@ -19,8 +20,9 @@ class LoansAPI(BaseAPI):
             auth_token: Authentication token
             timeout: Request timeout in seconds
             retry_count: Number of retries for failed requests
+            session: Existing session to share (keeps its connection pool alive)
         """
-        super().__init__(base_url, auth_token, timeout, retry_count)
+        super().__init__(base_url, auth_token, timeout, retry_count, session)
         self.endpoint_base = '/loans'
     
     def get_loan(self, loan_id: str) -> requests.Response:
@@ -9,7 +9,6 @@ import time
 import json
 import logging
 from typing import Dict, Any, Optional, Union
-from urllib.parse import urljoin
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -20,6 +19,17 @@ from ..api import (
     BaseAPI, AccountsAPI, CustomersAPI, BookingsAPI, 
     LoansAPI, TermDepositsAPI, HealthAPI
 )
+from ..api.base_api import (
+    POOL_SIZE, RETRY_STATUS_CODES, RETRY_METHODS,
+    RETRY_BACKOFF_FACTOR, RETRY_BACKOFF_MAX, _UNPARSED
+)
+
+# Use orjson for request/response bodies when installed; its JSONDecodeError
+# subclasses json.JSONDecodeError, so existing handlers keep working
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class APIClient:
@@ -36,6 +46,7 @@ class APIClient:
             retry_count: Number of retries for failed requests
         """
         self.base_url = base_url.rstrip('/')
+        self._default_headers: Optional[Dict[str, str]] = None
         self.auth_token = auth_token
         self.timeout = timeout
         self.retry_count = retry_count
@@ -44,63 +55,105 @@ class APIClient:
         self.session = requests.Session()
         self._setup_retry_strategy()
         
+        # Default headers live on the session; requests only carry overrides
+        self.session.headers.update(self._get_default_headers())
+        
         # Request/Response tracking
         self.last_request = None
         self.last_response = None
         self.last_response_time = None
         
+        # Correlation ID is sent per request rather than stored on the shared session
+        self._correlation_id: Optional[str] = None
+        
         # Logging
         self.logger = logging.getLogger(__name__)
         
-        # Initialize endpoint-specific API classes
-        self.accounts = AccountsAPI(base_url, auth_token, timeout, retry_count)
-        self.customers = CustomersAPI(base_url, auth_token, timeout, retry_count)
-        self.bookings = BookingsAPI(base_url, auth_token, timeout, retry_count)
-        self.loans = LoansAPI(base_url, auth_token, timeout, retry_count)
-        self.term_deposits = TermDepositsAPI(base_url, auth_token, timeout, retry_count)
-        self.health = HealthAPI(base_url, auth_token, timeout, retry_count)
+        # Initialize endpoint-specific API classes sharing this client's session
+        self.accounts = AccountsAPI(base_url, auth_token, timeout, retry_count, self.session)
+        self.customers = CustomersAPI(base_url, auth_token, timeout, retry_count, self.session)
+        self.bookings = BookingsAPI(base_url, auth_token, timeout, retry_count, self.session)
+        self.loans = LoansAPI(base_url, auth_token, timeout, retry_count, self.session)
+        self.term_deposits = TermDepositsAPI(base_url, auth_token, timeout, retry_count, self.session)
+        self.health = HealthAPI(base_url, auth_token, timeout, retry_count, self.session)
         
+    @property
+    def auth_token(self) -> str:
+        """Authentication token used for the Authorization header."""
+        return self._auth_token
+    
+    @auth_token.setter
+    def auth_token(self, value: str) -> None:
+        self._auth_token = value
+        # Invalidate cached headers so the new token is picked up
+        self._default_headers = None
+        if getattr(self, 'session', None) is not None:
+            self.session.headers['Authorization'] = f'Bearer {value}'
+    
     def _setup_retry_strategy(self) -> None:
         """Setup retry strategy for HTTP requests."""
         retry_strategy = Retry(
             total=self.retry_count,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "PUT", "DELETE", "OPTIONS", "TRACE"],
-            backoff_factor=1
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            backoff_max=RETRY_BACKOFF_MAX,
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
     
-    def set_correlation_id(self, correlation_id: str) -> None:
+    def set_correlation_id(self, correlation_id: Optional[str]) -> None:
         """Set correlation ID for request tracking."""
-        self.session.headers.update({'X-Correlation-Id': correlation_id})
+        self._correlation_id = correlation_id
+        for api in (self.accounts, self.customers, self.bookings,
+                    self.loans, self.term_deposits, self.health):
+            api.set_correlation_id(correlation_id)
     
     def reset_session(self) -> None:
-        """Reset session headers and state."""
-        self.session.headers.clear()
+        """Reset per-scenario session headers, keeping pooled connections alive."""
+        self.set_correlation_id(None)
         self.session.headers.update(self._get_default_headers())
     
+    def reset_scenario_state(self) -> None:
+        """Reset per-scenario headers and response tracking, keeping the session."""
+        self.reset_session()
+        self.last_request = None
+        self.last_response = None
+        self.last_response_time = None
+    
     def close_session(self) -> None:
-        """Close the session."""
+        """Close the session, which the endpoint APIs share; call once, when the client is done."""
         self.session.close()
     
     def _get_default_headers(self) -> Dict[str, str]:
-        """Get default headers for requests."""
-        return {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Authorization': f'Bearer {self.auth_token}',
-            'User-Agent': 'Banking-API-BDD-Tests/1.0'
-        }
+        """Get default headers for requests (cached until the auth token changes)."""
+        if self._default_headers is None:
+            self._default_headers = {
+                'Content-Type': 'application/json',
+                'Accept': 'application/json',
+                'Authorization': f'Bearer {self.auth_token}',
+                'User-Agent': 'Banking-API-BDD-Tests/1.0'
+            }
+        return self._default_headers
     
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
-        return urljoin(self.base_url + '/', endpoint.lstrip('/'))
+        # base_url has no trailing slash, so plain concatenation matches urljoin here
+        return f"{self.base_url}/{endpoint.lstrip('/')}"
     
     def _log_request(self, method: str, url: str, **kwargs) -> None:
         """Log HTTP request details."""
         self.logger.info(f"→ {method.upper()} {url}")
+        # Skip building header/body dumps unless they will actually be logged
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         if kwargs.get('headers'):
             # Don't log sensitive headers
             safe_headers = {k: v for k, v in kwargs['headers'].items() 
@@ -112,6 +165,8 @@ class APIClient:
     def _log_response(self, response: requests.Response, response_time: float) -> None:
         """Log HTTP response details."""
         self.logger.info(f"← {response.status_code} {response.reason} ({response_time:.3f}s)")
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         self.logger.debug(f"  Response Headers: {dict(response.headers)}")
         if response.text:
             try:
@@ -134,11 +189,11 @@ class APIClient:
         """
         url = self._build_url(endpoint)
         
-        # Merge default headers with provided headers
-        headers = self._get_default_headers()
-        if kwargs.get('headers'):
-            headers.update(kwargs['headers'])
-        kwargs['headers'] = headers
+        # Session headers supply the defaults; requests merges any overrides on top
+        if self._correlation_id:
+            kwargs['headers'] = {'X-Correlation-Id': self._correlation_id, **(kwargs.get('headers') or {})}
+        elif not kwargs.get('headers'):
+            kwargs.pop('headers', None)
         
         # Set timeout if not provided
         kwargs.setdefault('timeout', self.timeout)
@@ -153,10 +208,16 @@ class APIClient:
             'kwargs': kwargs
         }
         
+        # Pre-encode JSON bodies with orjson; the session already sends a JSON Content-Type
+        send_kwargs = kwargs
+        if orjson is not None and kwargs.get('json') is not None:
+            send_kwargs = dict(kwargs)
+            send_kwargs['data'] = orjson.dumps(send_kwargs.pop('json'))
+        
         # Make request and track timing
         start_time = time.time()
         try:
-            response = self.session.request(method, url, **kwargs)
+            response = self.session.request(method, url, **send_kwargs)
             response_time = time.time() - start_time
             
             # Track response
@@ -280,12 +341,20 @@ class APIClient:
         self.last_response_time = api_instance.last_response_time
     
     def get_last_response_json(self) -> Optional[Dict[str, Any]]:
-        """Get last response as JSON."""
+        """Get last response as JSON (parsed once per response)."""
         if self.last_response:
-            try:
-                return self.last_response.json()
-            except json.JSONDecodeError:
-                return None
+            # Cache on the response itself so a new request naturally invalidates it
+            cached = getattr(self.last_response, '_json_cache', _UNPARSED)
+            if cached is _UNPARSED:
+                try:
+                    if orjson is not None:
+                        cached = orjson.loads(self.last_response.content)
+                    else:
+                        cached = self.last_response.json()
+                except json.JSONDecodeError:
+                    cached = None
+                self.last_response._json_cache = cached
+            return cached
         return None
     
     def assert_status_code(self, expected_status: int) -> None:
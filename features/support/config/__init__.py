@@ -1,5 +1,5 @@
 """Configuration package for Banking API BDD tests."""
 
-from .config_manager import ConfigManager
+from .config_manager import ConfigManager, get_config
 
-__all__ = ['ConfigManager']
\ No newline at end of file
+__all__ = ['ConfigManager', 'get_config']
\ No newline at end of file
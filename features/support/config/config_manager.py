@@ -5,52 +5,57 @@ Handles environment-specific configuration and settings.
 
 import os
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from functools import lru_cache
+
+
+def _env_flag(env, key: str, default: str) -> bool:
+    """Read a 'true'/'false' environment flag."""
+    return env.get(key, default).lower() == 'true'
 
 
-@dataclass
 class ConfigManager:
     """Centralized configuration management for test framework."""
     
     def __init__(self):
         """Initialize configuration from environment variables."""
-        self.environment = os.getenv('ENVIRONMENT', 'test')
-        self.base_url = os.getenv('BASE_URL', 'https://your-wiremock-app.railway.app')
-        self.auth_token = os.getenv('AUTH_TOKEN', 'banking-api-key-2024')
-        self.timeout = int(os.getenv('TIMEOUT', '30'))
-        self.retry_count = int(os.getenv('RETRY_COUNT', '3'))
+        env = os.environ  # Read settings straight from the mapping rather than via os.getenv
+        self.environment = env.get('ENVIRONMENT', 'test')
+        self.base_url = env.get('BASE_URL', 'https://your-wiremock-app.railway.app')
+        self.auth_token = env.get('AUTH_TOKEN', 'banking-api-key-2024')
+        self.timeout = int(env.get('TIMEOUT', '30'))
+        self.retry_count = int(env.get('RETRY_COUNT', '3'))
         
         # Headers configuration
-        self.correlation_id_header = os.getenv('CORRELATION_ID_HEADER', 'X-Correlation-Id')
-        self.content_type = os.getenv('CONTENT_TYPE', 'application/json')
-        self.auth_header = os.getenv('AUTH_HEADER', 'Authorization')
-        self.auth_prefix = os.getenv('AUTH_PREFIX', 'Bearer')
+        self.correlation_id_header = env.get('CORRELATION_ID_HEADER', 'X-Correlation-Id')
+        self.content_type = env.get('CONTENT_TYPE', 'application/json')
+        self.auth_header = env.get('AUTH_HEADER', 'Authorization')
+        self.auth_prefix = env.get('AUTH_PREFIX', 'Bearer')
         
         # Test data configuration
-        self.test_data_path = os.getenv('TEST_DATA_PATH', 'test_data/test')
-        self.generate_dynamic_data = os.getenv('GENERATE_DYNAMIC_DATA', 'true').lower() == 'true'
-        self.validate_schemas = os.getenv('VALIDATE_SCHEMAS', 'true').lower() == 'true'
+        self.test_data_path = env.get('TEST_DATA_PATH', 'test_data/test')
+        self.generate_dynamic_data = _env_flag(env, 'GENERATE_DYNAMIC_DATA', 'true')
+        self.validate_schemas = _env_flag(env, 'VALIDATE_SCHEMAS', 'true')
         
         # Reporting configuration
-        self.report_path = os.getenv('REPORT_PATH', 'reports')
-        self.allure_results_path = os.getenv('ALLURE_RESULTS_PATH', 'reports/allure-results')
-        self.screenshot_on_failure = os.getenv('SCREENSHOT_ON_FAILURE', 'true').lower() == 'true'
-        self.junit_reports = os.getenv('JUNIT_REPORTS', 'false').lower() == 'true'
+        self.report_path = env.get('REPORT_PATH', 'reports')
+        self.allure_results_path = env.get('ALLURE_RESULTS_PATH', 'reports/allure-results')
+        self.screenshot_on_failure = _env_flag(env, 'SCREENSHOT_ON_FAILURE', 'true')
+        self.junit_reports = _env_flag(env, 'JUNIT_REPORTS', 'false')
         
         # Performance configuration
-        self.request_timeout = int(os.getenv('REQUEST_TIMEOUT', '10'))
-        self.concurrency_limit = int(os.getenv('CONCURRENCY_LIMIT', '5'))
-        self.performance_threshold_ms = int(os.getenv('PERFORMANCE_THRESHOLD_MS', '2000'))
+        self.request_timeout = int(env.get('REQUEST_TIMEOUT', '10'))
+        self.concurrency_limit = int(env.get('CONCURRENCY_LIMIT', '5'))
+        self.performance_threshold_ms = int(env.get('PERFORMANCE_THRESHOLD_MS', '2000'))
         
         # Debug configuration
-        self.debug_mode = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
-        self.log_level = os.getenv('LOG_LEVEL', 'INFO')
-        self.log_requests = os.getenv('LOG_REQUESTS', 'false').lower() == 'true'
+        self.debug_mode = _env_flag(env, 'DEBUG_MODE', 'false')
+        self.log_level = env.get('LOG_LEVEL', 'INFO')
+        self.log_requests = _env_flag(env, 'LOG_REQUESTS', 'false')
         
         # CI/CD specific configuration
-        self.parallel_execution = os.getenv('PARALLEL_EXECUTION', 'false').lower() == 'true'
-        self.fail_fast = os.getenv('FAIL_FAST', 'false').lower() == 'true'
-        self.verbose_output = os.getenv('VERBOSE_OUTPUT', 'false').lower() == 'true'
+        self.parallel_execution = _env_flag(env, 'PARALLEL_EXECUTION', 'false')
+        self.fail_fast = _env_flag(env, 'FAIL_FAST', 'false')
+        self.verbose_output = _env_flag(env, 'VERBOSE_OUTPUT', 'false')
     
     def get_auth_header(self) -> Dict[str, str]:
         """Get formatted authentication header."""
@@ -122,4 +127,10 @@ Banking API Test Configuration:
     Validate Schemas: {self.validate_schemas}
     CI Environment: {self.is_ci_environment()}
         """
-        return config_info.strip()
\ No newline at end of file
+        return config_info.strip()
+
+
+@lru_cache(maxsize=1)
+def get_config() -> ConfigManager:
+    """Return the shared configuration, built from the environment on first use."""
+    return ConfigManager()
@@ -4,15 +4,18 @@ This file contains before/after hooks for different test lifecycle events.
 """
 
 import os
+import json
 import logging
+from array import array
+from itertools import count
 from datetime import datetime
 from typing import Any, Dict
 
 from dotenv import load_dotenv
-from behave import fixture, use_fixture
+from behave import fixture
 from behave.runner import Context
 
-from support.config.config_manager import ConfigManager
+from support.config.config_manager import get_config
 from support.clients.api_client import APIClient
 from support.utils.logger import setup_logger
 
@@ -33,7 +36,7 @@ def load_environment_config(env_name: str = None) -> None:
 @fixture
 def api_client_fixture(context: Context) -> APIClient:
     """Create and configure API client for tests."""
-    config = ConfigManager()
+    config = get_config()
     client = APIClient(
         base_url=config.base_url,
         auth_token=config.auth_token,
@@ -59,13 +62,15 @@ def before_all(context: Context) -> None:
     context.logger.info("=" * 80)
     
     # Initialize configuration manager
-    context.config_manager = ConfigManager()
+    context.config_manager = get_config()
     
     # Create reports directory
     os.makedirs('reports', exist_ok=True)
     
     # Test execution metadata
     context.test_start_time = datetime.now()
+    context.run_timestamp = context.test_start_time.strftime('%Y%m%d-%H%M%S')
+    context.scenario_sequence = count(1)
     context.test_results = {
         'total_scenarios': 0,
         'passed_scenarios': 0,
@@ -73,8 +78,14 @@ def before_all(context: Context) -> None:
         'skipped_scenarios': 0
     }
     
-    # Performance tracking
-    context.performance_metrics = []
+    # Performance tracking: metrics are streamed to a JSON Lines file as scenarios
+    # finish, only the response times are kept in memory for the summary
+    context.performance_times = array('d')
+    context.performance_metrics_path = f"reports/performance_metrics_{context.run_timestamp}.jsonl"
+    context.performance_metrics_file = open(context.performance_metrics_path, 'w', encoding='utf-8', buffering=1 << 16)
+    
+    # One API client for the whole run so its connection pool stays warm
+    context.api_client_shared = api_client_fixture(context)
 
 
 def before_feature(context: Context, feature) -> None:
@@ -86,10 +97,6 @@ def before_feature(context: Context, feature) -> None:
     context.feature_start_time = datetime.now()
     
     # Tag-based setup
-    if 'api' in feature.tags:
-        use_fixture(api_client_fixture, context)
-        context.logger.info("API client initialized for feature")
-    
     if 'performance' in feature.tags:
         context.performance_test_mode = True
         context.logger.info("Performance testing mode enabled")
@@ -106,15 +113,13 @@ def before_scenario(context: Context, scenario) -> None:
     context.scenario_start_time = datetime.now()
     context.scenario_data = {}
     
-    # Initialize API client if not already done
-    if not hasattr(context, 'api_client'):
-        context.api_client = use_fixture(api_client_fixture, context)
+    # Reuse the suite-wide API client, clearing only per-scenario state
+    context.api_client = context.api_client_shared
+    context.api_client.reset_scenario_state()
     
-    # Reset API client session for each scenario
-    context.api_client.reset_session()
-    
-    # Generate correlation ID for tracking
-    context.correlation_id = f"test-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{hash(scenario.name) & 0x7FFFFFFF}"
+    # Generate correlation ID for tracking (run timestamp is formatted once in before_all)
+    sequence = next(context.scenario_sequence)
+    context.correlation_id = f"test-{context.run_timestamp}-{sequence}-{hash(scenario.name) & 0x7FFFFFFF}"
     context.api_client.set_correlation_id(context.correlation_id)
     
     # Tag-based scenario setup
@@ -159,13 +164,15 @@ def after_scenario(context: Context, scenario) -> None:
     
     # Performance metrics collection
     if hasattr(context, 'api_client') and context.api_client.last_response_time:
+        response_time_ms = context.api_client.last_response_time * 1000
         metric = {
             'scenario': scenario.name,
-            'response_time_ms': context.api_client.last_response_time * 1000,
+            'response_time_ms': response_time_ms,
             'timestamp': context.scenario_start_time.isoformat(),
-            'status': scenario.status
+            'status': scenario.status.name
         }
-        context.performance_metrics.append(metric)
+        context.performance_metrics_file.write(json.dumps(metric) + '\n')
+        context.performance_times.append(response_time_ms)
     
     # Cleanup scenario data
     if hasattr(context, 'scenario_data'):
@@ -179,10 +186,6 @@ def after_feature(context: Context, feature) -> None:
     """
     feature_duration = datetime.now() - context.feature_start_time
     context.logger.info(f"Completed Feature: {feature.name} (Duration: {feature_duration})")
-    
-    # Feature-specific cleanup
-    if hasattr(context, 'api_client'):
-        context.api_client.close_session()
 
 
 def after_all(context: Context) -> None:
@@ -208,18 +211,21 @@ def after_all(context: Context) -> None:
         context.logger.info(f"Pass Rate: {pass_rate:.2f}%")
     
     # Performance metrics summary
-    if context.performance_metrics:
-        avg_response_time = sum(m['response_time_ms'] for m in context.performance_metrics) / len(context.performance_metrics)
-        max_response_time = max(m['response_time_ms'] for m in context.performance_metrics)
+    context.performance_metrics_file.close()
+    times = context.performance_times
+    if times:
+        avg_response_time = sum(times) / len(times)
+        max_response_time = max(times)
         context.logger.info(f"Average Response Time: {avg_response_time:.2f}ms")
         context.logger.info(f"Max Response Time: {max_response_time:.2f}ms")
-        
-        # Save performance metrics to file
-        import json
-        metrics_file = f"reports/performance_metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(metrics_file, 'w') as f:
-            json.dump(context.performance_metrics, f, indent=2)
-        context.logger.info(f"Performance metrics saved to: {metrics_file}")
+        context.logger.info(f"Performance metrics saved to: {context.performance_metrics_path}")
+    else:
+        # Nothing was recorded, don't leave an empty metrics file behind
+        os.remove(context.performance_metrics_path)
+    
+    # Close pooled connections once the whole suite is done
+    if hasattr(context, 'api_client_shared'):
+        context.api_client_shared.close_session()
     
     context.logger.info("=" * 80)
     context.logger.info("Banking API BDD Test Suite Completed")
@@ -3,121 +3,178 @@ Data generation utilities using Faker for Banking API BDD tests.
 Provides dynamic test data generation for all banking services.
 """
 
+import os
 import random
 import uuid
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Dict, Any, List, Optional
 
 from faker import Faker
 
 
+# Number of Faker values sampled per field for bulk generation
+SAMPLE_POOL_SIZE = 1024
+
+ACCOUNT_TYPES = ['SAVINGS', 'CHECKING', 'TERM_DEPOSIT', 'CREDIT_CARD']
+CURRENCIES = ['AUD', 'USD', 'EUR', 'GBP']
+BRANCH_SUFFIXES = ['CBD', 'North', 'South', 'East', 'West']
+
+# Field values applied by generate_boundary_data, keyed by (data type, boundary type)
+BOUNDARY_OVERRIDES = {
+    ('customer', 'min'): {
+        'firstName': 'A',
+        'lastName': 'B',
+        'phone': '+61400000000'
+    },
+    ('customer', 'max'): {
+        'firstName': 'A' * 50,
+        'lastName': 'B' * 50,
+        'phone': '+614' + '9' * 9
+    },
+    ('account', 'min'): {
+        'initialBalance': 0.01,
+        'description': 'A'
+    },
+    ('account', 'max'): {
+        'initialBalance': 999999999.99,
+        'description': 'A' * 500
+    },
+}
+
+
 class BankingDataGenerator:
     """Generate realistic banking test data using Faker."""
     
+    # Faker instances are expensive to build (every provider is loaded), so one is shared per locale
+    _faker_cache: Dict[str, Faker] = {}
+    
     def __init__(self, locale: str = 'en_AU'):
         """Initialize with specific locale for Australian banking context."""
-        self.faker = Faker(locale)
-        Faker.seed(None)  # Random seed for each run
+        faker = self._faker_cache.get(locale)
+        if faker is None:
+            faker = self._faker_cache[locale] = Faker(locale)
+            Faker.seed(None)  # Random seed for each run
+        self.faker = faker
+    
+    @cached_property
+    def _sample_pools(self) -> Dict[str, List[Any]]:
+        """Faker values drawn once and reused by the bulk generators."""
+        fake = self.faker
+        size = range(SAMPLE_POOL_SIZE)
+        return {
+            'first_names': [fake.first_name() for _ in size],
+            'last_names': [fake.last_name() for _ in size],
+            'email_domains': [fake.free_email_domain() for _ in range(32)],
+            'dobs': [fake.date_of_birth(minimum_age=18, maximum_age=85).isoformat() for _ in size],
+            'streets': [fake.street_address() for _ in size],
+            'cities': [fake.city() for _ in size],
+            'states': [fake.state_abbr() for _ in range(32)],
+            'postcodes': [fake.postcode() for _ in size],
+            'words': [fake.word().capitalize() for _ in size],
+        }
     
-    def generate_customer_data(self, **overrides) -> Dict[str, Any]:
-        """Generate customer data with optional field overrides."""
+    def generate_customer_data(self, *, skip: frozenset = frozenset(), **overrides) -> Dict[str, Any]:
+        """Generate customer data with optional field overrides; fields in skip are left as None."""
+        fake = self.faker
         data = {
-            'firstName': self.faker.first_name(),
-            'lastName': self.faker.last_name(),
-            'email': self.faker.email(),
-            'phone': f"+614{self.faker.random_number(digits=8, fix_len=True)}",
-            'dob': self.faker.date_of_birth(minimum_age=18, maximum_age=85).isoformat(),
-            'address': {
-                'street': self.faker.street_address(),
-                'city': self.faker.city(),
-                'state': self.faker.state_abbr(),
-                'postcode': self.faker.postcode(),
+            'firstName': None if 'firstName' in skip else fake.first_name(),
+            'lastName': None if 'lastName' in skip else fake.last_name(),
+            'email': None if 'email' in skip else fake.email(),
+            'phone': None if 'phone' in skip else f"+614{fake.random_number(digits=8, fix_len=True)}",
+            'dob': None if 'dob' in skip else fake.date_of_birth(minimum_age=18, maximum_age=85).isoformat(),
+            'address': None if 'address' in skip else {
+                'street': fake.street_address(),
+                'city': fake.city(),
+                'state': fake.state_abbr(),
+                'postcode': fake.postcode(),
                 'country': 'Australia'
             }
         }
         data.update(overrides)
         return data
     
-    def generate_account_data(self, **overrides) -> Dict[str, Any]:
-        """Generate account data with optional field overrides."""
-        account_types = ['SAVINGS', 'CHECKING', 'TERM_DEPOSIT', 'CREDIT_CARD']
-        currencies = ['AUD', 'USD', 'EUR', 'GBP']
-        
+    def generate_account_data(self, *, skip: frozenset = frozenset(), **overrides) -> Dict[str, Any]:
+        """Generate account data with optional field overrides; fields in skip are left as None."""
+        fake = self.faker
         data = {
-            'customerId': f"CUST{self.faker.random_number(digits=6, fix_len=True)}",
-            'accountType': self.faker.random_element(account_types),
-            'currency': self.faker.random_element(currencies),
-            'initialBalance': round(self.faker.random.uniform(0, 100000), 2),
-            'description': f"{self.faker.word().capitalize()} {self.faker.random_element(account_types).lower()} account",
-            'branch': f"{self.faker.city()} {self.faker.random_element(['CBD', 'North', 'South', 'East', 'West'])}"
+            'customerId': None if 'customerId' in skip else f"CUST{fake.random_number(digits=6, fix_len=True)}",
+            'accountType': None if 'accountType' in skip else fake.random_element(ACCOUNT_TYPES),
+            'currency': None if 'currency' in skip else fake.random_element(CURRENCIES),
+            'initialBalance': None if 'initialBalance' in skip else round(fake.random.uniform(0, 100000), 2),
+            'description': None if 'description' in skip else f"{fake.word().capitalize()} {fake.random_element(ACCOUNT_TYPES).lower()} account",
+            'branch': None if 'branch' in skip else f"{fake.city()} {fake.random_element(BRANCH_SUFFIXES)}"
         }
         data.update(overrides)
         return data
     
-    def generate_booking_data(self, **overrides) -> Dict[str, Any]:
-        """Generate booking data with optional field overrides."""
+    def generate_booking_data(self, *, skip: frozenset = frozenset(), **overrides) -> Dict[str, Any]:
+        """Generate booking data with optional field overrides; fields in skip are left as None."""
+        fake = self.faker
         service_types = ['APPOINTMENT', 'CONSULTATION', 'LOAN_MEETING', 'INVESTMENT_ADVICE']
         booking_times = ['09:00', '10:00', '11:00', '14:00', '15:00', '16:00']
         
-        # Generate future date within next 30 days
-        future_date = self.faker.date_between(start_date='today', end_date='+30d')
-        
         data = {
-            'customerId': f"CUST{self.faker.random_number(digits=6, fix_len=True)}",
-            'serviceType': self.faker.random_element(service_types),
-            'bookingDate': future_date.isoformat(),
-            'bookingTime': self.faker.random_element(booking_times),
-            'branch': f"{self.faker.city()} Branch",
-            'notes': self.faker.sentence()
+            'customerId': None if 'customerId' in skip else f"CUST{fake.random_number(digits=6, fix_len=True)}",
+            'serviceType': None if 'serviceType' in skip else fake.random_element(service_types),
+            # Future date within next 30 days
+            'bookingDate': None if 'bookingDate' in skip else fake.date_between(start_date='today', end_date='+30d').isoformat(),
+            'bookingTime': None if 'bookingTime' in skip else fake.random_element(booking_times),
+            'branch': None if 'branch' in skip else f"{fake.city()} Branch",
+            'notes': None if 'notes' in skip else fake.sentence()
         }
         data.update(overrides)
         return data
     
-    def generate_loan_data(self, **overrides) -> Dict[str, Any]:
-        """Generate loan data with optional field overrides."""
+    def generate_loan_data(self, *, skip: frozenset = frozenset(), **overrides) -> Dict[str, Any]:
+        """Generate loan data with optional field overrides; fields in skip are left as None."""
+        fake = self.faker
         loan_types = ['PERSONAL', 'HOME', 'CAR', 'BUSINESS']
         terms = [12, 24, 36, 48, 60, 120, 240, 360]  # months
         
         data = {
-            'customerId': f"CUST{self.faker.random_number(digits=6, fix_len=True)}",
-            'loanType': self.faker.random_element(loan_types),
-            'amount': round(self.faker.random.uniform(5000, 500000), 2),
-            'term': self.faker.random_element(terms),
-            'interestRate': round(self.faker.random.uniform(3.5, 15.0), 2),
-            'purpose': self.faker.sentence(),
-            'employmentStatus': self.faker.random_element(['FULL_TIME', 'PART_TIME', 'SELF_EMPLOYED', 'UNEMPLOYED']),
-            'annualIncome': round(self.faker.random.uniform(30000, 200000), 2)
+            'customerId': None if 'customerId' in skip else f"CUST{fake.random_number(digits=6, fix_len=True)}",
+            'loanType': None if 'loanType' in skip else fake.random_element(loan_types),
+            'amount': None if 'amount' in skip else round(fake.random.uniform(5000, 500000), 2),
+            'term': None if 'term' in skip else fake.random_element(terms),
+            'interestRate': None if 'interestRate' in skip else round(fake.random.uniform(3.5, 15.0), 2),
+            'purpose': None if 'purpose' in skip else fake.sentence(),
+            'employmentStatus': None if 'employmentStatus' in skip else fake.random_element(['FULL_TIME', 'PART_TIME', 'SELF_EMPLOYED', 'UNEMPLOYED']),
+            'annualIncome': None if 'annualIncome' in skip else round(fake.random.uniform(30000, 200000), 2)
         }
         data.update(overrides)
         return data
     
-    def generate_term_deposit_data(self, **overrides) -> Dict[str, Any]:
-        """Generate term deposit data with optional field overrides."""
+    def generate_term_deposit_data(self, *, skip: frozenset = frozenset(), **overrides) -> Dict[str, Any]:
+        """Generate term deposit data with optional field overrides; fields in skip are left as None."""
+        fake = self.faker
         terms = [3, 6, 9, 12, 18, 24, 36, 48, 60]  # months
         
         data = {
-            'customerId': f"CUST{self.faker.random_number(digits=6, fix_len=True)}",
-            'amount': round(self.faker.random.uniform(1000, 100000), 2),
-            'term': self.faker.random_element(terms),
-            'interestRate': round(self.faker.random.uniform(2.0, 6.0), 2),
-            'compoundingFrequency': self.faker.random_element(['MONTHLY', 'QUARTERLY', 'ANNUALLY']),
-            'maturityInstructions': self.faker.random_element(['ROLLOVER', 'TRANSFER_TO_SAVINGS', 'CONTACT_CUSTOMER'])
+            'customerId': None if 'customerId' in skip else f"CUST{fake.random_number(digits=6, fix_len=True)}",
+            'amount': None if 'amount' in skip else round(fake.random.uniform(1000, 100000), 2),
+            'term': None if 'term' in skip else fake.random_element(terms),
+            'interestRate': None if 'interestRate' in skip else round(fake.random.uniform(2.0, 6.0), 2),
+            'compoundingFrequency': None if 'compoundingFrequency' in skip else fake.random_element(['MONTHLY', 'QUARTERLY', 'ANNUALLY']),
+            'maturityInstructions': None if 'maturityInstructions' in skip else fake.random_element(['ROLLOVER', 'TRANSFER_TO_SAVINGS', 'CONTACT_CUSTOMER'])
         }
         data.update(overrides)
         return data
     
     def generate_invalid_data(self, data_type: str, invalid_field: str) -> Dict[str, Any]:
         """Generate invalid data for negative testing."""
+        # The invalid field is replaced below, so don't spend Faker calls on it
+        skip = frozenset((invalid_field,))
         if data_type == 'customer':
-            data = self.generate_customer_data()
+            data = self.generate_customer_data(skip=skip)
         elif data_type == 'account':
-            data = self.generate_account_data()
+            data = self.generate_account_data(skip=skip)
         elif data_type == 'booking':
-            data = self.generate_booking_data()
+            data = self.generate_booking_data(skip=skip)
         elif data_type == 'loan':
-            data = self.generate_loan_data()
+            data = self.generate_loan_data(skip=skip)
         elif data_type == 'term_deposit':
-            data = self.generate_term_deposit_data()
+            data = self.generate_term_deposit_data(skip=skip)
         else:
             raise ValueError(f"Unknown data type: {data_type}")
         
@@ -140,37 +197,84 @@ class BankingDataGenerator:
     
     def generate_boundary_data(self, data_type: str, boundary_type: str) -> Dict[str, Any]:
         """Generate boundary condition data for testing."""
+        overrides = BOUNDARY_OVERRIDES.get((data_type, boundary_type), {})
+        skip = frozenset(overrides)
         if data_type == 'customer':
-            data = self.generate_customer_data()
-            if boundary_type == 'min':
-                data.update({
-                    'firstName': 'A',
-                    'lastName': 'B',
-                    'phone': '+61400000000'
-                })
-            elif boundary_type == 'max':
-                data.update({
-                    'firstName': 'A' * 50,
-                    'lastName': 'B' * 50,
-                    'phone': '+614' + '9' * 9
-                })
+            data = self.generate_customer_data(skip=skip, **overrides)
         elif data_type == 'account':
-            data = self.generate_account_data()
-            if boundary_type == 'min':
-                data.update({
-                    'initialBalance': 0.01,
-                    'description': 'A'
-                })
-            elif boundary_type == 'max':
-                data.update({
-                    'initialBalance': 999999999.99,
-                    'description': 'A' * 500
-                })
+            data = self.generate_account_data(skip=skip, **overrides)
         
         return data
     
+    def _generate_customer_batch(self, count: int) -> List[Dict[str, Any]]:
+        """Generate customer records from the sample pools with one draw per column."""
+        pools = self._sample_pools
+        rng = self.faker.random
+        first_names = rng.choices(pools['first_names'], k=count)
+        last_names = rng.choices(pools['last_names'], k=count)
+        domains = rng.choices(pools['email_domains'], k=count)
+        suffixes = rng.choices(range(1, 10000), k=count)
+        phones = rng.choices(range(10**7, 10**8), k=count)
+        dobs = rng.choices(pools['dobs'], k=count)
+        streets = rng.choices(pools['streets'], k=count)
+        cities = rng.choices(pools['cities'], k=count)
+        states = rng.choices(pools['states'], k=count)
+        postcodes = rng.choices(pools['postcodes'], k=count)
+        
+        return [
+            {
+                'firstName': first,
+                'lastName': last,
+                'email': f"{first}.{last}{suffix}@{domain}".lower(),
+                'phone': f"+614{phone}",
+                'dob': dob,
+                'address': {
+                    'street': street,
+                    'city': city,
+                    'state': state,
+                    'postcode': postcode,
+                    'country': 'Australia'
+                }
+            }
+            for first, last, domain, suffix, phone, dob, street, city, state, postcode in zip(
+                first_names, last_names, domains, suffixes, phones, dobs, streets, cities, states, postcodes
+            )
+        ]
+    
+    def _generate_account_batch(self, count: int) -> List[Dict[str, Any]]:
+        """Generate account records from the sample pools with one draw per column."""
+        pools = self._sample_pools
+        rng = self.faker.random
+        customer_numbers = rng.choices(range(10**5, 10**6), k=count)
+        account_types = rng.choices(ACCOUNT_TYPES, k=count)
+        currencies = rng.choices(CURRENCIES, k=count)
+        balances = [round(rng.uniform(0, 100000), 2) for _ in range(count)]
+        words = rng.choices(pools['words'], k=count)
+        description_types = rng.choices(ACCOUNT_TYPES, k=count)
+        cities = rng.choices(pools['cities'], k=count)
+        branch_suffixes = rng.choices(BRANCH_SUFFIXES, k=count)
+        
+        return [
+            {
+                'customerId': f"CUST{customer_number}",
+                'accountType': account_type,
+                'currency': currency,
+                'initialBalance': balance,
+                'description': f"{word} {description_type.lower()} account",
+                'branch': f"{city} {branch_suffix}"
+            }
+            for customer_number, account_type, currency, balance, word, description_type, city, branch_suffix in zip(
+                customer_numbers, account_types, currencies, balances, words, description_types, cities, branch_suffixes
+            )
+        ]
+    
     def generate_multiple_records(self, data_type: str, count: int) -> List[Dict[str, Any]]:
         """Generate multiple records of the same type."""
+        if data_type == 'customer':
+            return self._generate_customer_batch(count)
+        if data_type == 'account':
+            return self._generate_account_batch(count)
+        
         generators = {
             'customer': self.generate_customer_data,
             'account': self.generate_account_data,
@@ -188,6 +292,12 @@ class BankingDataGenerator:
         """Generate a unique correlation ID for request tracking."""
         return f"test-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
     
+    def generate_correlation_ids(self, count: int) -> List[str]:
+        """Generate correlation IDs in bulk from one timestamp and one random read."""
+        timestamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        random_hex = os.urandom(4 * count).hex()
+        return [f"test-{timestamp}-{random_hex[i:i + 8]}" for i in range(0, 8 * count, 8)]
+    
     def generate_test_scenario_data(self, scenario_name: str) -> Dict[str, Any]:
         """Generate data specific to test scenarios."""
         scenarios = {
@@ -209,11 +319,15 @@ class BankingDataGenerator:
         """Generate large dataset for performance testing."""
         return [
             {
-                'customer': self.generate_customer_data(),
-                'account': self.generate_account_data(),
-                'correlation_id': self.generate_correlation_id()
+                'customer': customer,
+                'account': account,
+                'correlation_id': correlation_id
             }
-            for _ in range(count)
+            for customer, account, correlation_id in zip(
+                self._generate_customer_batch(count),
+                self._generate_account_batch(count),
+                self.generate_correlation_ids(count)
+            )
         ]
 
 
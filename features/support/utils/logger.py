@@ -6,7 +6,41 @@ Provides centralized logging configuration and management.
 import logging
 import os
 from datetime import datetime
-from typing import Optional
+from logging.handlers import RotatingFileHandler
+from typing import Dict, Optional
+
+
+# Shared by every handler setup_logger creates
+FORMATTER = logging.Formatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+LOG_FILE_MAX_BYTES = 50_000_000
+LOG_FILE_BACKUP_COUNT = 5
+
+# Handlers are opened once per process and shared by every configured logger
+_console_handler: Optional[logging.Handler] = None
+_file_handlers: Dict[str, logging.Handler] = {}
+
+
+def _get_console_handler() -> logging.Handler:
+    """Return the shared console handler, creating it on first use."""
+    global _console_handler
+    if _console_handler is None:
+        _console_handler = logging.StreamHandler()
+        _console_handler.setFormatter(FORMATTER)
+    return _console_handler
+
+
+def _get_file_handler(path: str) -> logging.Handler:
+    """Return the rotating file handler for path, opening the file only once."""
+    handler = _file_handlers.get(path)
+    if handler is None:
+        handler = RotatingFileHandler(path, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT)
+        handler.setFormatter(FORMATTER)
+        _file_handlers[path] = handler
+    return handler
 
 
 def setup_logger(name: str, log_level: str = None, log_file: str = None) -> logging.Logger:
@@ -25,37 +59,31 @@ def setup_logger(name: str, log_level: str = None, log_file: str = None) -> logg
     if not log_level:
         log_level = os.getenv('LOG_LEVEL', 'INFO')
     
-    # Create logger
+    level = getattr(logging, log_level.upper())
+    
+    # Create logger, reusing it as-is if it was already set up the same way
     logger = logging.getLogger(name)
-    logger.setLevel(getattr(logging, log_level.upper()))
+    if logger.handlers and getattr(logger, '_configured_with', None) == (level, log_file):
+        return logger
+    logger.setLevel(level)
     
-    # Clear existing handlers to avoid duplicates
+    # Clear existing handlers to avoid duplicates (the shared handlers stay open)
     logger.handlers.clear()
     
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(getattr(logging, log_level.upper()))
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    # Console handler; filtering is left to the logger level since handlers are shared
+    logger.addHandler(_get_console_handler())
     
     # File handler
     if log_file or os.getenv('LOG_TO_FILE', 'true').lower() == 'true':
-        if not log_file:
+        file_path = log_file
+        if not file_path:
             # Create logs directory
             os.makedirs('logs', exist_ok=True)
-            log_file = f"logs/banking_api_tests_{datetime.now().strftime('%Y%m%d')}.log"
+            file_path = f"logs/banking_api_tests_{datetime.now().strftime('%Y%m%d')}.log"
         
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_get_file_handler(file_path))
     
+    logger._configured_with = (level, log_file)
     return logger
 
 
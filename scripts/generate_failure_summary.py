@@ -8,11 +8,28 @@ for easy debugging and analysis.
 
 import os
 import sys
-import glob
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property, lru_cache
+
+# Minimum number of XML files before parsing is fanned out across processes
+PARALLEL_PARSE_THRESHOLD = 4
+
+# Write buffer for the markdown report (1 MiB)
+REPORT_WRITE_BUFFER = 1 << 20
+
+# Recommended actions, in report order, keyed by failure category
+RECOMMENDATIONS = (
+    ('⏱️ Timeout', "- **⏱️ Timeout Issues:** Consider increasing timeout values or improving API response times\n"),
+    ('❌ Assertion', "- **❌ Assertion Failures:** Review test expectations and API response formats\n"),
+    ('🌐 Network', "- **🌐 Network Issues:** Check API connectivity and network stability\n"),
+    ('🔐 Authentication', "- **🔐 Authentication Problems:** Verify API credentials and token validity\n"),
+    ('🚨 Server Error', "- **🚨 Server Errors:** Check API server health and error logs\n"),
+)
 
 
 class TestFailure:
@@ -24,10 +41,10 @@ class TestFailure:
         self.message = message
         self.failure_type = failure_type
         self.time = time
-        self.category = self._categorize_failure()
 
-    def _categorize_failure(self) -> str:
-        """Categorize failure based on error message."""
+    @cached_property
+    def category(self) -> str:
+        """Categorize failure based on error message (computed on first access)."""
         message_lower = self.message.lower()
 
         if 'timeout' in message_lower or 'timed out' in message_lower:
@@ -50,6 +67,39 @@ class TestFailure:
             return '❓ Other'
 
 
+@lru_cache(maxsize=2048)
+def _clean_error_message(message: str) -> str:
+    """Clean and format error message for better readability."""
+    if not message:
+        return "No error message available"
+
+    # Remove excessive whitespace and newlines
+    cleaned = re.sub(r'\s+', ' ', message.strip())
+
+    # Truncate very long messages
+    if len(cleaned) > 500:
+        cleaned = cleaned[:500] + "... (truncated)"
+
+    return cleaned
+
+
+@lru_cache(maxsize=2048)
+def _feature_location(classname: str) -> str:
+    """Extract likely feature file location from classname."""
+    if not classname:
+        return ""
+
+    # Convert classname to feature file path
+    # e.g., "accounts.account_creation.Account Creation" -> "features/accounts/account_creation.feature"
+    parts = classname.split('.')
+    if len(parts) >= 2:
+        return f"features/{parts[0]}/{parts[1]}.feature"
+    elif len(parts) == 1:
+        return f"features/{parts[0]}/*.feature"
+
+    return ""
+
+
 class FailureSummaryGenerator:
     """Generates failure summary from JUnit XML reports."""
 
@@ -63,14 +113,31 @@ class FailureSummaryGenerator:
 
     def parse_junit_reports(self):
         """Parse all JUnit XML files in the reports directory."""
-        xml_files = glob.glob(os.path.join(self.reports_dir, "*.xml"))
+        xml_files = []
+        if os.path.isdir(self.reports_dir):
+            with os.scandir(self.reports_dir) as entries:
+                xml_files = [entry.path for entry in entries
+                             if entry.name.endswith('.xml') and entry.is_file()]
 
         if not xml_files:
             print(f"No JUnit XML files found in {self.reports_dir}")
             return
 
-        for xml_file in xml_files:
-            self._parse_xml_file(xml_file)
+        # Small report sets are not worth the process start-up cost
+        if len(xml_files) < PARALLEL_PARSE_THRESHOLD:
+            for xml_file in xml_files:
+                self._parse_xml_file(xml_file)
+            return
+
+        with ProcessPoolExecutor() as executor:
+            for tests, failures, errors, skipped, test_failures in executor.map(
+                _parse_report, xml_files, chunksize=4
+            ):
+                self.total_tests += tests
+                self.total_failures += failures
+                self.total_errors += errors
+                self.total_skipped += skipped
+                self.failures.extend(test_failures)
 
     def _parse_xml_file(self, xml_file: str):
         """Parse a single JUnit XML file."""
@@ -97,11 +164,19 @@ class FailureSummaryGenerator:
 
     def _parse_testsuite(self, testsuite: ET.Element, source_file: str):
         """Parse a single test suite element."""
+        attrib = testsuite.attrib
+        failures = int(attrib.get('failures', '0'))
+        errors = int(attrib.get('errors', '0'))
+
         # Update statistics
-        self.total_tests += int(testsuite.get('tests', 0))
-        self.total_failures += int(testsuite.get('failures', 0))
-        self.total_errors += int(testsuite.get('errors', 0))
-        self.total_skipped += int(testsuite.get('skipped', 0))
+        self.total_tests += int(attrib.get('tests', '0'))
+        self.total_failures += failures
+        self.total_errors += errors
+        self.total_skipped += int(attrib.get('skipped', '0'))
+
+        # Passing suites contribute no failure entries, so skip their test cases
+        if failures == 0 and errors == 0:
+            return
 
         # Process test cases
         for testcase in testsuite.findall('testcase'):
@@ -109,174 +184,171 @@ class FailureSummaryGenerator:
 
     def _process_testcase(self, testcase: ET.Element, source_file: str):
         """Process a single test case element."""
-        name = testcase.get('name', 'Unknown Test')
-        classname = testcase.get('classname', 'Unknown Class')
-        time = float(testcase.get('time', 0))
-
         # Check for failures
         failure = testcase.find('failure')
         error = testcase.find('error')
 
+        if failure is None and error is None:
+            return
+
+        attrib = testcase.attrib
+        name = attrib.get('name', 'Unknown Test')
+        classname = attrib.get('classname', 'Unknown Class')
+        time = float(attrib.get('time', '0'))
+
         if failure is not None:
             message = failure.get('message', failure.text or 'No failure message')
             failure_type = failure.get('type', 'Unknown')
             self.failures.append(TestFailure(name, classname, message, failure_type, time))
 
-        elif error is not None:
+        else:
             message = error.get('message', error.text or 'No error message')
             error_type = error.get('type', 'Unknown')
             self.failures.append(TestFailure(name, classname, message, error_type, time))
 
     def generate_summary(self, output_file: str = "failure_summary.md"):
         """Generate the failure summary markdown report."""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            self._write_header(f)
-            self._write_overview(f)
-
-            if self.failures:
-                self._write_failure_details(f)
-                self._write_failure_categories(f)
-                self._write_recommendations(f)
-            else:
-                f.write("## 🎉 All Tests Passed!\n\n")
-                f.write("No failures detected in the test run.\n\n")
+        # Collect all report fragments and write them in a single call
+        parts: List[str] = []
+        self._write_header(parts)
+        self._write_overview(parts)
+
+        if self.failures:
+            self._write_failure_details(parts)
+            self._write_failure_categories(parts)
+            self._write_recommendations(parts)
+        else:
+            parts.append("## 🎉 All Tests Passed!\n\n")
+            parts.append("No failures detected in the test run.\n\n")
 
-            self._write_footer(f)
+        self._write_footer(parts)
+
+        with open(output_file, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+            f.write(''.join(parts))
 
         print(f"Failure summary generated: {output_file}")
 
-    def _write_header(self, f):
+    def _write_header(self, parts: List[str]):
         """Write the report header."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC")
-        f.write(f"# 🚨 Test Failure Summary\n\n")
-        f.write(f"**Generated:** {timestamp}  \n")
-        f.write(f"**Reports Directory:** `{self.reports_dir}`\n\n")
-        f.write("---\n\n")
-
-    def _write_overview(self, f):
+        parts.append(
+            "# 🚨 Test Failure Summary\n\n"
+            f"**Generated:** {timestamp}  \n"
+            f"**Reports Directory:** `{self.reports_dir}`\n\n"
+            "---\n\n"
+        )
+
+    @property
+    def passed_count(self) -> int:
+        """Number of tests that neither failed nor errored."""
+        return self.total_tests - self.total_failures - self.total_errors
+
+    @property
+    def pass_rate(self) -> float:
+        """Pass rate as a percentage of total tests."""
+        return self.passed_count / max(self.total_tests, 1) * 100
+
+    def _write_overview(self, parts: List[str]):
         """Write the test overview section."""
-        pass_rate = ((self.total_tests - self.total_failures - self.total_errors) / max(self.total_tests, 1)) * 100
-
-        f.write("## 📊 Test Execution Overview\n\n")
-        f.write(f"| Metric | Count | Percentage |\n")
-        f.write(f"|--------|--------|------------|\n")
-        f.write(f"| **Total Tests** | {self.total_tests} | 100% |\n")
-        f.write(f"| **Passed** | {self.total_tests - self.total_failures - self.total_errors} | {pass_rate:.1f}% |\n")
-        f.write(f"| **Failed** | {self.total_failures} | {(self.total_failures/max(self.total_tests,1)*100):.1f}% |\n")
-        f.write(f"| **Errors** | {self.total_errors} | {(self.total_errors/max(self.total_tests,1)*100):.1f}% |\n")
-        f.write(f"| **Skipped** | {self.total_skipped} | {(self.total_skipped/max(self.total_tests,1)*100):.1f}% |\n\n")
-
-    def _write_failure_details(self, f):
+        denom = max(self.total_tests, 1)
+        fail_rate = self.total_failures / denom * 100
+        error_rate = self.total_errors / denom * 100
+        skip_rate = self.total_skipped / denom * 100
+
+        parts.append(
+            "## 📊 Test Execution Overview\n\n"
+            "| Metric | Count | Percentage |\n"
+            "|--------|--------|------------|\n"
+            f"| **Total Tests** | {self.total_tests} | 100% |\n"
+            f"| **Passed** | {self.passed_count} | {self.pass_rate:.1f}% |\n"
+            f"| **Failed** | {self.total_failures} | {fail_rate:.1f}% |\n"
+            f"| **Errors** | {self.total_errors} | {error_rate:.1f}% |\n"
+            f"| **Skipped** | {self.total_skipped} | {skip_rate:.1f}% |\n\n"
+        )
+
+    def _write_failure_details(self, parts: List[str]):
         """Write detailed failure information."""
-        f.write("## 🔍 Failed Test Details\n\n")
+        parts.append("## 🔍 Failed Test Details\n\n")
 
         for i, failure in enumerate(self.failures, 1):
-            f.write(f"### {i}. {failure.name}\n\n")
-            f.write(f"- **Category:** {failure.category}\n")
-            f.write(f"- **Class:** `{failure.classname}`\n")
-            f.write(f"- **Duration:** {failure.time:.2f}s\n")
-            f.write(f"- **Type:** `{failure.failure_type}`\n\n")
-
             # Clean and format error message
-            clean_message = self._clean_error_message(failure.message)
-            f.write(f"**Error Message:**\n```\n{clean_message}\n```\n\n")
+            clean_message = _clean_error_message(failure.message)
+
+            parts.append(
+                f"### {i}. {failure.name}\n\n"
+                f"- **Category:** {failure.category}\n"
+                f"- **Class:** `{failure.classname}`\n"
+                f"- **Duration:** {failure.time:.2f}s\n"
+                f"- **Type:** `{failure.failure_type}`\n\n"
+                f"**Error Message:**\n```\n{clean_message}\n```\n\n"
+            )
 
             # Extract feature file location if possible
-            feature_location = self._extract_feature_location(failure.classname)
+            feature_location = _feature_location(failure.classname)
             if feature_location:
-                f.write(f"**Likely Location:** `{feature_location}`\n\n")
+                parts.append(f"**Likely Location:** `{feature_location}`\n\n")
 
-            f.write("---\n\n")
+            parts.append("---\n\n")
 
-    def _write_failure_categories(self, f):
+    def _write_failure_categories(self, parts: List[str]):
         """Write failure categories summary."""
         if not self.failures:
             return
 
-        f.write("## 📋 Failure Categories\n\n")
+        parts.append("## 📋 Failure Categories\n\n")
 
-        # Count failures by category
-        categories = {}
+        # Group failing test names by category in a single pass
+        categories = defaultdict(list)
         for failure in self.failures:
-            categories[failure.category] = categories.get(failure.category, 0) + 1
+            categories[failure.category].append(failure.name)
 
         # Sort by count (descending)
-        sorted_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)
+        sorted_categories = sorted(categories.items(), key=lambda x: len(x[1]), reverse=True)
 
-        f.write("| Category | Count | Tests |\n")
-        f.write("|----------|-------|-------|\n")
+        parts.append("| Category | Count | Tests |\n")
+        parts.append("|----------|-------|-------|\n")
 
-        for category, count in sorted_categories:
-            test_names = [f.name for f in self.failures if f.category == category]
+        for category, test_names in sorted_categories:
+            count = len(test_names)
             test_list = ", ".join(test_names[:3])  # Show first 3 tests
-            if len(test_names) > 3:
-                test_list += f", ... (+{len(test_names)-3} more)"
+            if count > 3:
+                test_list += f", ... (+{count-3} more)"
 
-            f.write(f"| {category} | {count} | {test_list} |\n")
+            parts.append(f"| {category} | {count} | {test_list} |\n")
 
-        f.write("\n")
+        parts.append("\n")
 
-    def _write_recommendations(self, f):
+    def _write_recommendations(self, parts: List[str]):
         """Write recommendations based on failure patterns."""
         if not self.failures:
             return
 
-        f.write("## 💡 Recommended Actions\n\n")
-
-        # Count categories for recommendations
-        categories = [failure.category for failure in self.failures]
+        parts.append("## 💡 Recommended Actions\n\n")
 
-        if any('Timeout' in cat for cat in categories):
-            f.write("- **⏱️ Timeout Issues:** Consider increasing timeout values or improving API response times\n")
+        # Distinct categories present in this run
+        present = {failure.category for failure in self.failures}
 
-        if any('Assertion' in cat for cat in categories):
-            f.write("- **❌ Assertion Failures:** Review test expectations and API response formats\n")
+        for category, recommendation in RECOMMENDATIONS:
+            if category in present:
+                parts.append(recommendation)
 
-        if any('Network' in cat for cat in categories):
-            f.write("- **🌐 Network Issues:** Check API connectivity and network stability\n")
+        parts.append("\n")
 
-        if any('Authentication' in cat for cat in categories):
-            f.write("- **🔐 Authentication Problems:** Verify API credentials and token validity\n")
-
-        if any('Server Error' in cat for cat in categories):
-            f.write("- **🚨 Server Errors:** Check API server health and error logs\n")
-
-        f.write("\n")
-
-    def _write_footer(self, f):
+    def _write_footer(self, parts: List[str]):
         """Write the report footer."""
-        f.write("---\n\n")
-        f.write("*Generated by Banking API BDD Test Framework*\n")
-        f.write(f"*Total Analysis Time: {len(self.failures)} failures processed*\n")
-
-    def _clean_error_message(self, message: str) -> str:
-        """Clean and format error message for better readability."""
-        if not message:
-            return "No error message available"
-
-        # Remove excessive whitespace and newlines
-        cleaned = re.sub(r'\s+', ' ', message.strip())
+        parts.append(
+            "---\n\n"
+            "*Generated by Banking API BDD Test Framework*\n"
+            f"*Total Analysis Time: {len(self.failures)} failures processed*\n"
+        )
 
-        # Truncate very long messages
-        if len(cleaned) > 500:
-            cleaned = cleaned[:500] + "... (truncated)"
 
-        return cleaned
-
-    def _extract_feature_location(self, classname: str) -> str:
-        """Extract likely feature file location from classname."""
-        if not classname:
-            return ""
-
-        # Convert classname to feature file path
-        # e.g., "accounts.account_creation.Account Creation" -> "features/accounts/account_creation.feature"
-        parts = classname.split('.')
-        if len(parts) >= 2:
-            return f"features/{parts[0]}/{parts[1]}.feature"
-        elif len(parts) == 1:
-            return f"features/{parts[0]}/*.feature"
-
-        return ""
+def _parse_report(xml_file: str) -> Tuple[int, int, int, int, List[TestFailure]]:
+    """Parse a single JUnit XML file in a worker process and return its totals and failures."""
+    generator = FailureSummaryGenerator()
+    generator._parse_xml_file(xml_file)
+    return (generator.total_tests, generator.total_failures, generator.total_errors,
+            generator.total_skipped, generator.failures)
 
 
 def main():
@@ -309,7 +381,7 @@ def main():
     print(f"\n📊 Summary Generated:")
     print(f"   Total Tests: {generator.total_tests}")
     print(f"   Failed: {generator.total_failures + generator.total_errors}")
-    print(f"   Pass Rate: {((generator.total_tests - generator.total_failures - generator.total_errors) / max(generator.total_tests, 1)) * 100:.1f}%")
+    print(f"   Pass Rate: {generator.pass_rate:.1f}%")
 
 
 if __name__ == "__main__":
@@ -15,25 +15,32 @@ from pathlib import Path
 
 
 class WiremockManager:
+    HEALTH_POLL_INITIAL_DELAY = 0.05
+    HEALTH_POLL_MAX_DELAY = 1.0
+
     def __init__(self, port=8081):
         self.port = port
         self.base_url = f"http://localhost:{port}"
         self.health_endpoint = f"{self.base_url}/__admin/health"
         self.process = None
+        # Persistent session so health polls reuse the TCP connection
+        self._probe = requests.Session()
 
     def kill_existing_processes(self):
         """Kill any existing WireMock processes"""
         print("🔄 Stopping existing WireMock processes...")
         
         killed_processes = 0
-        for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+        # Only fetch the (expensive) cmdline for java processes
+        for proc in psutil.process_iter(['pid', 'name']):
+            if proc.info['name'] != 'java.exe':
+                continue
             try:
-                if proc.info['name'] == 'java.exe':
-                    cmdline = ' '.join(proc.info['cmdline'] or [])
-                    if 'wiremock-standalone.jar' in cmdline:
-                        print(f"   Killing WireMock process (PID: {proc.info['pid']})")
-                        proc.terminate()
-                        killed_processes += 1
+                cmdline = proc.cmdline()
+                if any('wiremock-standalone.jar' in arg for arg in cmdline):
+                    print(f"   Killing WireMock process (PID: {proc.info['pid']})")
+                    proc.terminate()
+                    killed_processes += 1
             except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                 pass
         
@@ -82,8 +89,7 @@ class WiremockManager:
         cmd = [
             java_exe, "-jar", str(jar_path),
             "--port", str(self.port),
-            "--global-response-templating",
-            "--verbose"
+            "--global-response-templating"
         ]
         
         if mappings_exist:
@@ -93,12 +99,13 @@ class WiremockManager:
         print(f"   JAR location: {jar_path}")
         print(f"   Working directory: {working_dir}")
         
-        # Start WireMock in background
+        # Start WireMock in background; output is discarded rather than piped
+        # so WireMock never blocks on a full, unread pipe buffer
         self.process = subprocess.Popen(
             cmd,
             cwd=working_dir,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0
         )
         
@@ -108,26 +115,37 @@ class WiremockManager:
         """Wait for WireMock to be healthy"""
         print("⏳ Waiting for WireMock to be ready...")
         
+        # Poll with exponential backoff so a fast start is detected quickly
+        delay = self.HEALTH_POLL_INITIAL_DELAY
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
-                response = requests.get(self.health_endpoint, timeout=2)
+                response = self._probe.get(self.health_endpoint, timeout=2)
                 if response.status_code == 200:
                     print(f"✅ WireMock is healthy and ready on port {self.port}")
                     return True
             except requests.RequestException:
                 pass
             
-            time.sleep(1)
-            print("   Still waiting...")
+            time.sleep(delay)
+            if delay >= self.HEALTH_POLL_MAX_DELAY:
+                print("   Still waiting...")
+            delay = min(delay * 1.7, self.HEALTH_POLL_MAX_DELAY)
         
         raise TimeoutError(f"WireMock failed to start within {timeout} seconds")
 
+    def close(self):
+        """Release the health probe connection pool"""
+        self._probe.close()
+
     def restart(self):
         """Complete restart cycle"""
         self.kill_existing_processes()
         self.start_wiremock()
-        self.wait_for_health()
+        try:
+            self.wait_for_health()
+        finally:
+            self.close()
 
 
 def run_behave_tests(format_type="pretty", tags=None):
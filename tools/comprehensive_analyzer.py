@@ -4,15 +4,91 @@ Comprehensive vector-based analyzer for pretty.output file.
 Processes the entire file as chunks and provides complete analysis.
 """
 
+import io
 import os
 import json
+import mmap
+import pickle
 import re
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass, asdict
-from collections import defaultdict, Counter
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from operator import attrgetter
 
+# orjson serializes the analysis dataclasses natively when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+# Bump when parsing/aggregation changes so stale cached analyses are ignored
+ANALYSIS_CACHE_VERSION = 1
+
+# Below this many scenario blocks parsing stays in-process
+PARALLEL_MIN_BLOCKS = 256
+
+# Patterns used while parsing every scenario block, compiled once at import.
+# The split and execution-time patterns run over the memory-mapped file, so they are bytes patterns.
+SCENARIO_SPLIT_PATTERN = re.compile(rb'(?=@\w+.*\nFeature:|Scenario:)')
+SCENARIO_PATTERN = re.compile(r'Scenario:?\s*([^#]+?)(?:\s*#\s*(.+?):\d+)?')
+FEATURE_PATTERN = re.compile(r'Feature:\s*(.+)')
+TAG_PATTERN = re.compile(r'@(\w+)')
+EXECUTION_TIME_PATTERN = re.compile(rb'Took\s+([\d\w\s\.]+)')
+
+# Everything counted in a scenario block, matched in a single pass; the named
+# group that matched tells the parser which kind of token it found
+BLOCK_TOKEN_PATTERN = re.compile(
+    r'(?P<step>^\s*(?:Given|When|Then|And)\s+)'
+    r'|(?P<undefined>#\s*None\s*$)'
+    r'|(?P<assertion>ASSERT FAILED(?=:(?P<error>[^\n]+))?)'
+    r'|(?P<failure>ERROR|FAILED)'
+    r'|(?P<duration>Duration:\s*(?P<duration_value>[0-9:\.]+))'
+    r'|(?P<api_calls>API Calls Made:\s*(?P<api_calls_value>\d+))'
+    r'|(?P<response_time>Avg Response Time:\s*(?P<response_time_value>[\d\.]+)s)',
+    re.MULTILINE
+)
+
+# Status markers in priority order: any passed marker wins, then failure markers, then undefined steps
+STATUS_MARKER_PATTERN = re.compile(
+    r'(?P<passed>Status: \[PASSED\]|\[PASSED\] SCENARIO COMPLETE)'
+    r'|(?P<failed>Status: \[FAILED\]|\[FAILED\] SCENARIO COMPLETE|ASSERT FAILED|ERROR)'
+    r'|(?P<undefined># None)'
+)
+
+# Detailed breakdown ordering and icons for the report
+SCENARIO_SORT_KEY = attrgetter('feature', 'status', 'name')
+REPORT_RULE = "=" * 100
+REPORT_HEADER = f"{REPORT_RULE}\nCOMPREHENSIVE BANKING API BDD FRAMEWORK ANALYSIS\n{REPORT_RULE}\n\n"
+FEATURE_RULE = "-" * 60 + "\n"
+STATUS_ICONS = {"passed": "✅", "failed": "❌", "undefined": "❓", "skipped": "⏭️", "unknown": "❓"}
+
+# Error message substring -> error type, checked in order; anything else is 'Other Error'
+ERROR_TYPE_RULES = (
+    ('status', 'Status Code Error'),
+    ('does not contain', 'Missing Field Error'),
+    ('json', 'JSON Error'),
+    ('timeout', 'Timeout Error'),
+)
+
+ERROR_TYPE_PATTERN = re.compile('|'.join(f'({re.escape(keyword)})' for keyword, _ in ERROR_TYPE_RULES), re.IGNORECASE)
+
+
+def _classify_error(error: str) -> str:
+    """Map an assertion error message to its error type bucket."""
+    # One scan over the message; the earliest rule that matches anywhere wins
+    best = None
+    for match in ERROR_TYPE_PATTERN.finditer(error):
+        rule_index = match.lastindex - 1
+        if best is None or rule_index < best:
+            best = rule_index
+            if best == 0:
+                break
+    return ERROR_TYPE_RULES[best][1] if best is not None else 'Other Error'
+
+
+@dataclass(slots=True)
 class ScenarioResult:
     name: str
     feature: str
@@ -29,7 +105,7 @@ class ScenarioResult:
     response_time: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameworkAnalysis:
     total_scenarios: int
     passed_scenarios: int
@@ -48,128 +124,218 @@ class FrameworkAnalysis:
     scenarios: List[ScenarioResult]
 
 
+def _parse_scenario_block(block: str) -> ScenarioResult:
+    """Parse a single scenario block comprehensively."""
+    lines = block.split('\n')
+
+    # Extract scenario name
+    scenario_name = "Unknown Scenario"
+    feature_name = "Unknown Feature"
+    location = "unknown:0"
+    tags = set()
+
+    for line in lines[:20]:  # Check first 20 lines for metadata
+        # Find scenario definition
+        scenario_match = SCENARIO_PATTERN.search(line)
+        if scenario_match:
+            scenario_name = scenario_match.group(1).strip()
+            if scenario_match.group(2):
+                location = scenario_match.group(2).strip()
+                feature_name = os.path.basename(location).replace('.feature', '').replace('_', ' ').title()
+
+        # Find feature definition
+        if 'Feature:' in line and not line.strip().startswith('#'):
+            feature_match = FEATURE_PATTERN.search(line)
+            if feature_match:
+                feature_name = feature_match.group(1).strip()
+
+        # Extract tags
+        if line.strip().startswith('@'):
+            tags.update(TAG_PATTERN.findall(line))
+
+    # Determine status by analyzing the block content
+    status = _determine_scenario_status(block)
+
+    # Count steps, collect error details and performance info in one scan
+    steps_total = steps_undefined = steps_failed = 0
+    error_details = []
+    duration = api_calls = response_time = None
+
+    for match in BLOCK_TOKEN_PATTERN.finditer(block):
+        kind = match.lastgroup
+        if kind == 'step':
+            steps_total += 1
+        elif kind == 'undefined':
+            steps_undefined += 1
+        elif kind == 'assertion':
+            steps_failed += 1
+            if match.group('error'):
+                error_details.append(match.group('error').strip())
+        elif kind == 'failure':
+            steps_failed += 1
+        elif kind == 'duration':
+            if duration is None:
+                duration = match.group('duration_value')
+        elif kind == 'api_calls':
+            if api_calls is None:
+                api_calls = int(match.group('api_calls_value'))
+        elif response_time is None:
+            response_time = float(match.group('response_time_value'))
+
+    steps_passed = max(0, steps_total - steps_undefined - steps_failed)
+    if duration is None:
+        duration = "0:00:00"
+    if api_calls is None:
+        api_calls = 0
+    if response_time is None:
+        response_time = 0.0
+
+    return ScenarioResult(
+        name=scenario_name,
+        feature=feature_name,
+        status=status,
+        location=location,
+        tags=list(tags),
+        steps_total=steps_total,
+        steps_passed=steps_passed,
+        steps_failed=steps_failed,
+        steps_undefined=steps_undefined,
+        duration=duration,
+        error_details=error_details,
+        api_calls=api_calls,
+        response_time=response_time
+    )
+
+
+def _determine_scenario_status(block: str) -> str:
+    """Determine scenario status from block content."""
+    # Look for status markers in one scan, keeping the highest-priority one seen
+    status = "unknown"
+    for match in STATUS_MARKER_PATTERN.finditer(block):
+        kind = match.lastgroup
+        if kind == "passed":
+            return "passed"
+        if kind == "failed":
+            status = "failed"
+        elif status == "unknown":
+            status = "undefined"
+    return status
+
+
+# Blocks are handed to worker processes as byte offsets; each worker maps the file itself
+_worker_content: Optional[mmap.mmap] = None
+
+
+def _init_block_worker(output_file: str) -> None:
+    """Map the output file once in each worker process."""
+    global _worker_content
+    with open(output_file, 'rb') as f:
+        _worker_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _parse_block_at(bounds: Tuple[int, int]) -> Optional[ScenarioResult]:
+    """Decode and parse the block at the given offsets in the worker's mapping."""
+    start, end = bounds
+    block = _worker_content[start:end].decode('utf-8', 'ignore')
+    if not block.strip() or len(block) < 50:
+        return None
+    return _parse_scenario_block(block)
+
+
 class ComprehensiveAnalyzer:
     def __init__(self, output_file: str):
         self.output_file = output_file
-        self.raw_content = ""
+        self.raw_content: Optional[mmap.mmap] = None
         self.analysis = None
+        self.cache_path = f"{output_file}.analysis.pkl"
+    
+    def _cache_key(self) -> Tuple[int, int, int]:
+        """Identify the current output file contents by modification time and size."""
+        stat = os.stat(self.output_file)
+        return (ANALYSIS_CACHE_VERSION, stat.st_mtime_ns, stat.st_size)
+    
+    def _load_cached_analysis(self, key: Tuple[int, int, int]) -> Optional[FrameworkAnalysis]:
+        """Return the cached analysis if it was built from the same file contents."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached_key, analysis = pickle.load(f)
+        except Exception:
+            return None
+        return analysis if cached_key == key else None
+    
+    def _save_cached_analysis(self, key: Tuple[int, int, int]) -> None:
+        """Store the analysis next to the output file for later runs."""
+        try:
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump((key, self.analysis), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            # The analysis itself succeeded; only the cache is lost. Unpicklable values surface as
+            # PicklingError, TypeError or AttributeError depending on the object.
+            print(f"Warning: could not write analysis cache: {e}")
+            # Don't leave a truncated cache file behind for the next run to trip over
+            try:
+                os.remove(self.cache_path)
+            except OSError:
+                pass
     
-    def load_entire_file(self) -> str:
-        """Load the entire pretty.output file as a single string."""
+    def load_entire_file(self) -> Optional[mmap.mmap]:
+        """Memory-map the entire pretty.output file instead of reading it into a string."""
         print(f"Loading entire file: {self.output_file}")
         
         try:
-            with open(self.output_file, 'r', encoding='utf-8', errors='ignore') as f:
-                self.raw_content = f.read()
+            with open(self.output_file, 'rb') as f:
+                self.raw_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             
-            print(f"Successfully loaded {len(self.raw_content):,} characters")
+            print(f"Successfully mapped {len(self.raw_content):,} bytes")
             return self.raw_content
         except Exception as e:
             print(f"Error loading file: {e}")
-            return ""
+            return None
+    
+    def _iter_block_bounds(self) -> Iterator[Tuple[int, int]]:
+        """Yield the (start, end) byte offsets of each scenario block in the mapped file."""
+        content = self.raw_content
+        start = 0
+        for match in SCENARIO_SPLIT_PATTERN.finditer(content):
+            if match.start() > start:
+                yield start, match.start()
+                start = match.start()
+        yield start, len(content)
     
     def parse_scenarios_from_content(self) -> List[ScenarioResult]:
         """Parse all scenarios from the raw content using comprehensive regex."""
-        scenarios = []
-        
-        # Split content into scenario blocks
-        scenario_blocks = re.split(r'(?=@\w+.*\nFeature:|Scenario:)', self.raw_content)
-        
-        for block in scenario_blocks:
-            if not block.strip() or len(block) < 50:
-                continue
-            
-            scenario = self._parse_single_scenario_block(block)
-            if scenario:
-                scenarios.append(scenario)
-        
-        return scenarios
-    
-    def _parse_single_scenario_block(self, block: str) -> ScenarioResult:
-        """Parse a single scenario block comprehensively."""
-        lines = block.split('\n')
-        
-        # Extract scenario name
-        scenario_name = "Unknown Scenario"
-        feature_name = "Unknown Feature"
-        location = "unknown:0"
-        tags = []
-        
-        for line in lines[:20]:  # Check first 20 lines for metadata
-            # Find scenario definition
-            scenario_match = re.search(r'Scenario:?\s*([^#]+?)(?:\s*#\s*(.+?):\d+)?', line)
-            if scenario_match:
-                scenario_name = scenario_match.group(1).strip()
-                if scenario_match.group(2):
-                    location = scenario_match.group(2).strip()
-                    feature_name = os.path.basename(location).replace('.feature', '').replace('_', ' ').title()
-            
-            # Find feature definition
-            if 'Feature:' in line and not line.strip().startswith('#'):
-                feature_match = re.search(r'Feature:\s*(.+)', line)
-                if feature_match:
-                    feature_name = feature_match.group(1).strip()
-            
-            # Extract tags
-            if line.strip().startswith('@'):
-                tags.extend(re.findall(r'@(\w+)', line))
-        
-        # Determine status by analyzing the block content
-        status = self._determine_scenario_status(block)
-        
-        # Count steps
-        steps_total = len(re.findall(r'^\s*(Given|When|Then|And)\s+', block, re.MULTILINE))
-        steps_undefined = len(re.findall(r'#\s*None\s*$', block, re.MULTILINE))
-        steps_failed = len(re.findall(r'ASSERT FAILED|ERROR|FAILED', block))
-        steps_passed = max(0, steps_total - steps_undefined - steps_failed)
-        
-        # Extract error details
-        error_details = []
-        error_matches = re.findall(r'ASSERT FAILED:(.+?)(?:\n|$)', block)
-        error_details.extend([err.strip() for err in error_matches])
-        
-        # Extract performance info
-        duration_match = re.search(r'Duration:\s*([0-9:\.]+)', block)
-        duration = duration_match.group(1) if duration_match else "0:00:00"
-        
-        api_calls_match = re.search(r'API Calls Made:\s*(\d+)', block)
-        api_calls = int(api_calls_match.group(1)) if api_calls_match else 0
-        
-        response_time_match = re.search(r'Avg Response Time:\s*([\d\.]+)s', block)
-        response_time = float(response_time_match.group(1)) if response_time_match else 0.0
-        
-        return ScenarioResult(
-            name=scenario_name,
-            feature=feature_name,
-            status=status,
-            location=location,
-            tags=list(set(tags)),  # Remove duplicates
-            steps_total=steps_total,
-            steps_passed=steps_passed,
-            steps_failed=steps_failed,
-            steps_undefined=steps_undefined,
-            duration=duration,
-            error_details=error_details,
-            api_calls=api_calls,
-            response_time=response_time
-        )
-    
-    def _determine_scenario_status(self, block: str) -> str:
-        """Determine scenario status from block content."""
-        # Look for explicit status markers
-        if 'Status: [PASSED]' in block or '[PASSED] SCENARIO COMPLETE' in block:
-            return "passed"
-        elif 'Status: [FAILED]' in block or '[FAILED] SCENARIO COMPLETE' in block:
-            return "failed"
-        elif 'ASSERT FAILED' in block or 'ERROR' in block:
-            return "failed"
-        elif '# None' in block:
-            return "undefined"
-        else:
-            return "unknown"
+        block_bounds = list(self._iter_block_bounds())
+        
+        # Small files are parsed inline; worker start-up would cost more than it saves
+        if len(block_bounds) < PARALLEL_MIN_BLOCKS:
+            content = self.raw_content
+            scenarios = []
+            for start, end in block_bounds:
+                block = content[start:end].decode('utf-8', 'ignore')
+                if not block.strip() or len(block) < 50:
+                    continue
+                scenarios.append(_parse_scenario_block(block))
+            return scenarios
+        
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_block_worker,
+                                 initargs=(self.output_file,)) as executor:
+            results = executor.map(_parse_block_at, block_bounds, chunksize=64)
+            return [scenario for scenario in results if scenario]
     
     def analyze_comprehensive(self) -> FrameworkAnalysis:
         """Perform comprehensive analysis of all scenarios."""
+        # Reuse the previous analysis when the output file has not changed
+        try:
+            cache_key = self._cache_key()
+        except OSError as e:
+            print(f"Error loading file: {e}")
+            return None
+        cached = self._load_cached_analysis(cache_key)
+        if cached:
+            print(f"Using cached analysis: {self.cache_path}")
+            self.analysis = cached
+            return self.analysis
+        
         # Load content
         content = self.load_entire_file()
         if not content:
@@ -178,59 +344,64 @@ class ComprehensiveAnalyzer:
         # Parse scenarios
         scenarios = self.parse_scenarios_from_content()
         
+        # Extract execution time, then release the mapping
+        execution_time_match = EXECUTION_TIME_PATTERN.search(content)
+        execution_time = execution_time_match.group(1).decode('utf-8', 'ignore') if execution_time_match else "Unknown"
+        content.close()
+        self.raw_content = None
+        
         if not scenarios:
             print("Warning: No scenarios found in analysis")
             return None
         
-        # Calculate statistics
+        # Calculate statistics in a single pass over the scenarios
         total_scenarios = len(scenarios)
-        passed_scenarios = len([s for s in scenarios if s.status == "passed"])
-        failed_scenarios = len([s for s in scenarios if s.status == "failed"])
-        skipped_scenarios = len([s for s in scenarios if s.status == "skipped"])
-        undefined_scenarios = len([s for s in scenarios if s.status == "undefined"])
-        
-        # Step statistics
-        total_steps = sum(s.steps_total for s in scenarios)
-        passed_steps = sum(s.steps_passed for s in scenarios)
-        failed_steps = sum(s.steps_failed for s in scenarios)
-        undefined_steps = sum(s.steps_undefined for s in scenarios)
-        
-        # Feature analysis
-        features = set(s.feature for s in scenarios)
-        total_features = len(features)
-        
-        # Error type analysis
+        status_counts = Counter()
+        total_steps = passed_steps = failed_steps = undefined_steps = 0
+        features = set()
         error_types = Counter()
-        for scenario in scenarios:
-            for error in scenario.error_details:
-                if 'status' in error.lower():
-                    error_types['Status Code Error'] += 1
-                elif 'does not contain' in error.lower():
-                    error_types['Missing Field Error'] += 1
-                elif 'json' in error.lower():
-                    error_types['JSON Error'] += 1
-                elif 'timeout' in error.lower():
-                    error_types['Timeout Error'] += 1
-                else:
-                    error_types['Other Error'] += 1
-        
-        # Failing features analysis
         failing_features = Counter()
-        for scenario in scenarios:
-            if scenario.status == "failed":
-                failing_features[scenario.feature] += 1
+        tag_status_counts = Counter()
+        tag_totals = Counter()
         
-        # Tag analysis
-        tag_analysis = defaultdict(lambda: {'passed': 0, 'failed': 0, 'undefined': 0, 'total': 0})
         for scenario in scenarios:
+            status = scenario.status
+            status_counts[status] += 1
+            
+            # Step statistics
+            total_steps += scenario.steps_total
+            passed_steps += scenario.steps_passed
+            failed_steps += scenario.steps_failed
+            undefined_steps += scenario.steps_undefined
+            
+            # Feature analysis
+            features.add(scenario.feature)
+            if status == "failed":
+                failing_features[scenario.feature] += 1
+            
+            # Error type analysis
+            for error in scenario.error_details:
+                error_types[_classify_error(error)] += 1
+            
+            # Tag analysis
             for tag in scenario.tags:
-                tag_analysis[tag]['total'] += 1
-                if scenario.status in tag_analysis[tag]:
-                    tag_analysis[tag][scenario.status] += 1
+                tag_totals[tag] += 1
+                tag_status_counts[tag, status] += 1
         
-        # Extract execution time
-        execution_time_match = re.search(r'Took\s+([\d\w\s\.]+)', content)
-        execution_time = execution_time_match.group(1) if execution_time_match else "Unknown"
+        passed_scenarios = status_counts["passed"]
+        failed_scenarios = status_counts["failed"]
+        skipped_scenarios = status_counts["skipped"]
+        undefined_scenarios = status_counts["undefined"]
+        total_features = len(features)
+        tag_analysis = {
+            tag: {
+                'passed': tag_status_counts[tag, 'passed'],
+                'failed': tag_status_counts[tag, 'failed'],
+                'undefined': tag_status_counts[tag, 'undefined'],
+                'total': total,
+            }
+            for tag, total in tag_totals.items()
+        }
         
         self.analysis = FrameworkAnalysis(
             total_scenarios=total_scenarios,
@@ -245,10 +416,11 @@ class ComprehensiveAnalyzer:
             total_features=total_features,
             error_types=dict(error_types),
             failing_features=dict(failing_features),
-            tag_analysis=dict(tag_analysis),
+            tag_analysis=tag_analysis,
             execution_time=execution_time,
             scenarios=scenarios
         )
+        self._save_cached_analysis(cache_key)
         
         return self.analysis
     
@@ -257,113 +429,112 @@ class ComprehensiveAnalyzer:
         if not self.analysis:
             return "No analysis available. Run analyze_comprehensive() first."
         
-        report = []
-        report.append("=" * 100)
-        report.append("COMPREHENSIVE BANKING API BDD FRAMEWORK ANALYSIS")
-        report.append("=" * 100)
-        report.append("")
+        analysis = self.analysis
+        report = io.StringIO()
+        write = report.write
+        write(REPORT_HEADER)
         
         # Executive summary
-        pass_rate = (self.analysis.passed_scenarios / self.analysis.total_scenarios * 100) if self.analysis.total_scenarios > 0 else 0
-        report.append(f"🎯 EXECUTIVE SUMMARY:")
-        report.append(f"   Total Scenarios: {self.analysis.total_scenarios}")
-        report.append(f"   Pass Rate: {pass_rate:.1f}%")
-        report.append(f"   Execution Time: {self.analysis.execution_time}")
-        report.append("")
+        pass_rate = (analysis.passed_scenarios / analysis.total_scenarios * 100) if analysis.total_scenarios > 0 else 0
+        write(f"🎯 EXECUTIVE SUMMARY:\n")
+        write(f"   Total Scenarios: {analysis.total_scenarios}\n")
+        write(f"   Pass Rate: {pass_rate:.1f}%\n")
+        write(f"   Execution Time: {analysis.execution_time}\n")
+        write("\n")
         
         # Detailed results
-        report.append(f"📊 DETAILED RESULTS:")
-        report.append(f"   ✅ Passed:     {self.analysis.passed_scenarios:3d} scenarios ({self.analysis.passed_scenarios/self.analysis.total_scenarios*100:5.1f}%)")
-        report.append(f"   ❌ Failed:     {self.analysis.failed_scenarios:3d} scenarios ({self.analysis.failed_scenarios/self.analysis.total_scenarios*100:5.1f}%)")
-        report.append(f"   ❓ Undefined:  {self.analysis.undefined_scenarios:3d} scenarios ({self.analysis.undefined_scenarios/self.analysis.total_scenarios*100:5.1f}%)")
-        report.append(f"   ⏭️  Skipped:    {self.analysis.skipped_scenarios:3d} scenarios ({self.analysis.skipped_scenarios/self.analysis.total_scenarios*100:5.1f}%)")
-        report.append("")
+        write(f"📊 DETAILED RESULTS:\n")
+        write(f"   ✅ Passed:     {analysis.passed_scenarios:3d} scenarios ({analysis.passed_scenarios/analysis.total_scenarios*100:5.1f}%)\n")
+        write(f"   ❌ Failed:     {analysis.failed_scenarios:3d} scenarios ({analysis.failed_scenarios/analysis.total_scenarios*100:5.1f}%)\n")
+        write(f"   ❓ Undefined:  {analysis.undefined_scenarios:3d} scenarios ({analysis.undefined_scenarios/analysis.total_scenarios*100:5.1f}%)\n")
+        write(f"   ⏭️  Skipped:    {analysis.skipped_scenarios:3d} scenarios ({analysis.skipped_scenarios/analysis.total_scenarios*100:5.1f}%)\n")
+        write("\n")
         
         # Step analysis
-        report.append(f"📋 STEP ANALYSIS:")
-        report.append(f"   Total Steps:     {self.analysis.total_steps}")
-        report.append(f"   Passed Steps:    {self.analysis.passed_steps}")
-        report.append(f"   Failed Steps:    {self.analysis.failed_steps}")
-        report.append(f"   Undefined Steps: {self.analysis.undefined_steps}")
-        report.append("")
+        write(f"📋 STEP ANALYSIS:\n")
+        write(f"   Total Steps:     {analysis.total_steps}\n")
+        write(f"   Passed Steps:    {analysis.passed_steps}\n")
+        write(f"   Failed Steps:    {analysis.failed_steps}\n")
+        write(f"   Undefined Steps: {analysis.undefined_steps}\n")
+        write("\n")
         
         # Error analysis
-        if self.analysis.error_types:
-            report.append(f"🚨 ERROR TYPE BREAKDOWN:")
-            for error_type, count in sorted(self.analysis.error_types.items(), key=lambda x: x[1], reverse=True):
-                report.append(f"   • {error_type}: {count} occurrences")
-            report.append("")
+        if analysis.error_types:
+            write(f"🚨 ERROR TYPE BREAKDOWN:\n")
+            for error_type, count in sorted(analysis.error_types.items(), key=lambda x: x[1], reverse=True):
+                write(f"   • {error_type}: {count} occurrences\n")
+            write("\n")
         
         # Feature analysis
-        if self.analysis.failing_features:
-            report.append(f"📁 MOST PROBLEMATIC FEATURES:")
-            for feature, count in sorted(self.analysis.failing_features.items(), key=lambda x: x[1], reverse=True):
-                report.append(f"   • {feature}: {count} failures")
-            report.append("")
+        if analysis.failing_features:
+            write(f"📁 MOST PROBLEMATIC FEATURES:\n")
+            for feature, count in sorted(analysis.failing_features.items(), key=lambda x: x[1], reverse=True):
+                write(f"   • {feature}: {count} failures\n")
+            write("\n")
         
         # Tag analysis - top failing tags
-        report.append(f"🏷️  TAG PASS RATES (Showing tags with >2 scenarios):")
+        write(f"🏷️  TAG PASS RATES (Showing tags with >2 scenarios):\n")
         tag_rates = []
-        for tag, stats in self.analysis.tag_analysis.items():
+        for tag, stats in analysis.tag_analysis.items():
             if stats['total'] >= 2:
                 pass_rate = (stats.get('passed', 0) / stats['total'] * 100) if stats['total'] > 0 else 0
                 tag_rates.append((tag, pass_rate, stats['total'], stats.get('failed', 0)))
         
         # Sort by pass rate (ascending) to show most problematic tags first
         for tag, pass_rate, total, failed in sorted(tag_rates, key=lambda x: x[1]):
-            report.append(f"   @{tag:20s}: {pass_rate:5.1f}% ({total} scenarios, {failed} failed)")
-        report.append("")
+            write(f"   @{tag:20s}: {pass_rate:5.1f}% ({total} scenarios, {failed} failed)\n")
+        write("\n")
         
         # Detailed scenario breakdown
-        report.append(f"📝 DETAILED SCENARIO BREAKDOWN:")
-        report.append("")
+        write(f"📝 DETAILED SCENARIO BREAKDOWN:\n")
+        write("\n")
         
         current_feature = ""
-        for scenario in sorted(self.analysis.scenarios, key=lambda x: (x.feature, x.status, x.name)):
+        for scenario in sorted(analysis.scenarios, key=SCENARIO_SORT_KEY):
             if scenario.feature != current_feature:
                 current_feature = scenario.feature
-                report.append(f"🗂️  FEATURE: {current_feature}")
-                report.append("-" * 60)
+                write(f"🗂️  FEATURE: {current_feature}\n")
+                write(FEATURE_RULE)
             
-            status_icon = {"passed": "✅", "failed": "❌", "undefined": "❓", "skipped": "⏭️", "unknown": "❓"}.get(scenario.status, "❓")
+            status_icon = STATUS_ICONS.get(scenario.status, "❓")
             
-            report.append(f"   {status_icon} {scenario.name}")
+            write(f"   {status_icon} {scenario.name}\n")
             if scenario.tags:
-                report.append(f"       Tags: {', '.join(scenario.tags[:5])}")  # Limit to first 5 tags
+                write(f"       Tags: {', '.join(scenario.tags[:5])}\n")  # Limit to first 5 tags
             
             if scenario.steps_total > 0:
-                report.append(f"       Steps: {scenario.steps_total} total, {scenario.steps_passed} passed, {scenario.steps_failed} failed, {scenario.steps_undefined} undefined")
+                write(f"       Steps: {scenario.steps_total} total, {scenario.steps_passed} passed, {scenario.steps_failed} failed, {scenario.steps_undefined} undefined\n")
             
             if scenario.error_details:
-                report.append(f"       Errors: {len(scenario.error_details)} error(s)")
+                write(f"       Errors: {len(scenario.error_details)} error(s)\n")
                 for error in scenario.error_details[:2]:  # Show first 2 errors
-                    report.append(f"         • {error[:100]}{'...' if len(error) > 100 else ''}")
+                    write(f"         • {error[:100]}{'...' if len(error) > 100 else ''}\n")
             
             if scenario.api_calls > 0:
-                report.append(f"       Performance: {scenario.api_calls} API calls, {scenario.response_time:.3f}s avg response time")
+                write(f"       Performance: {scenario.api_calls} API calls, {scenario.response_time:.3f}s avg response time\n")
             
-            report.append("")
+            write("\n")
         
         # Recommendations
-        report.append("🎯 PRIORITY RECOMMENDATIONS:")
-        report.append("")
+        write("🎯 PRIORITY RECOMMENDATIONS:\n")
+        write("\n")
         
-        if self.analysis.undefined_steps > 0:
-            report.append(f"1. 🔧 IMPLEMENT UNDEFINED STEPS: {self.analysis.undefined_steps} steps need implementation")
-            report.append(f"   This affects {self.analysis.undefined_scenarios} scenarios and is blocking progress")
+        if analysis.undefined_steps > 0:
+            write(f"1. 🔧 IMPLEMENT UNDEFINED STEPS: {analysis.undefined_steps} steps need implementation\n")
+            write(f"   This affects {analysis.undefined_scenarios} scenarios and is blocking progress\n")
         
-        if self.analysis.failing_features:
-            top_failing = max(self.analysis.failing_features.items(), key=lambda x: x[1])
-            report.append(f"2. 🚨 FIX TOP FAILING FEATURE: '{top_failing[0]}' has {top_failing[1]} failures")
+        if analysis.failing_features:
+            top_failing = max(analysis.failing_features.items(), key=lambda x: x[1])
+            write(f"2. 🚨 FIX TOP FAILING FEATURE: '{top_failing[0]}' has {top_failing[1]} failures\n")
         
-        if self.analysis.error_types:
-            top_error = max(self.analysis.error_types.items(), key=lambda x: x[1])
-            report.append(f"3. 🔍 ADDRESS TOP ERROR TYPE: '{top_error[0]}' causes {top_error[1]} failures")
+        if analysis.error_types:
+            top_error = max(analysis.error_types.items(), key=lambda x: x[1])
+            write(f"3. 🔍 ADDRESS TOP ERROR TYPE: '{top_error[0]}' causes {top_error[1]} failures\n")
         
-        report.append("")
-        report.append("=" * 100)
+        write("\n")
+        write(REPORT_RULE)
         
-        return "\n".join(report)
+        return report.getvalue()
     
     def save_report(self, report_path: str = None) -> str:
         """Save the comprehensive report to file."""
@@ -376,6 +547,20 @@ class ComprehensiveAnalyzer:
             f.write(report)
         
         return report_path
+    
+    def save_json(self, json_path: str = None) -> str:
+        """Save the raw analysis data as JSON."""
+        if not json_path:
+            json_path = "comprehensive_analysis.json"
+        
+        if orjson is not None:
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(self.analysis, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(asdict(self.analysis), f, indent=2, ensure_ascii=False)
+        
+        return json_path
 
 
 def main():
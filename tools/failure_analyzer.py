@@ -6,10 +6,142 @@ Extracts and consolidates all failure information from test runs into a compact,
 
 import re
 import json
+import mmap
 import os
+import sys
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+
+# Default pretty.output file location when no path is given on the command line
+DEFAULT_PRETTY_OUTPUT = "/mnt/c/Users/D/python api automation framework/pretty.output"
+
+# Where behave writes its JUnit reports (see behave.ini)
+DEFAULT_JUNIT_DIR = "reports/junit"
+
+# behave names each feature's report after its path under the features directory
+JUNIT_REPORT_NAME = "TESTS-{}.xml"
+
+# Upper bound on threads parsing JUnit reports concurrently
+JUNIT_MAX_WORKERS = 8
+
+# Scenario counters filled in from the JUnit testcases
+JUNIT_STAT_KEYS = ('scenarios_passed', 'scenarios_failed', 'scenarios_error', 'scenarios_skipped')
+
+# Patterns compiled once at import. They run over the memory-mapped pretty.output
+# (or slices of it), so they are all bytes patterns; only matched text is decoded.
+SUMMARY_PATTERN = re.compile(rb'(\d+)\s+(feature|scenario|step)s?\s+passed,\s+(\d+)\s+failed,\s+(\d+)\s+error,\s+(\d+)\s+skipped')
+ASSERTION_PATTERN = re.compile(rb'ASSERT FAILED: (.*?)\. Response: (.*?)(?=\n|$)', re.DOTALL)
+FEATURE_LOCATION_PATTERN = re.compile(rb'# (features/.*?\.feature:\d+)')
+TAGS_PATTERN = re.compile(rb'@.*?(?=\n|Scenario)')
+FAILURE_REASON_PATTERN = re.compile(rb'ASSERT FAILED: (.*?)(?=\n|$)')
+# Tag line directly above the scenario header in a JUnit testcase's captured output
+JUNIT_TAGS_PATTERN = re.compile(rb'^[ \t]*(@[^\n]*?)[ \t]*\n[ \t]*Scenario', re.MULTILINE)
+
+# Assertion message substring -> assertion type, checked in order (case-sensitive)
+ASSERTION_TYPE_RULES = (
+    ('Expected status', 'HTTP_STATUS_MISMATCH'),
+    ('Content-Length', 'CONTENT_LENGTH_ERROR'),
+    ('JSON', 'JSON_PARSING_ERROR'),
+    ('Response is not valid', 'INVALID_RESPONSE_FORMAT'),
+    ('IllegalArgumentException', 'WIREMOCK_CONFIG_ERROR'),
+)
+
+# Failure category rules, checked in order against the lowercased reason. Each rule
+# lists keyword groups; every group must have at least one keyword in the reason.
+FAILURE_CATEGORY_RULES = (
+    ('CONTENT_LENGTH_VALIDATION', (('content-length',),)),
+    ('HTTP_STATUS_VALIDATION', (('status',), ('400', '201'))),
+    ('RESPONSE_FORMAT_ERROR', (('json',), ('not valid',))),
+    ('BUSINESS_LOGIC_ERROR', (('conflict', '409'),)),
+    ('AUTHENTICATION_ERROR', (('unauthorized', '401'),)),
+    ('WIREMOCK_CONFIGURATION_ERROR', (('enum constant', 'illegalargumentexception'),)),
+)
+
+
+
+def _iter_scenario_blocks(content: bytes):
+    """
+    Yield the text after each tagged 'Scenario: ' header, up to the next '@' that
+    precedes another scenario (or the end of the output).
+    
+    Linear-time equivalent of re.findall(r'@.*?Scenario: (.*?)(?=@.*?Scenario:|$)', content, re.DOTALL),
+    which rescans the rest of the file from every '@' in the last block.
+    """
+    end_of_content = len(content) - 1 if content[-1:] == b'\n' else len(content)
+    position = 0
+    while True:
+        tag = content.find(b'@', position)
+        if tag == -1:
+            return
+        header = content.find(b'Scenario: ', tag)
+        if header == -1:
+            return
+        start = header + len(b'Scenario: ')
+        
+        next_tag = content.find(b'@', start)
+        if next_tag != -1 and content.find(b'Scenario:', next_tag) != -1:
+            end = next_tag
+        else:
+            end = max(start, end_of_content)
+        
+        yield content[start:end]
+        position = end
+
+
+def _report_started_at(path: str) -> datetime:
+    """When the feature behind a JUnit report started: its testsuite timestamp, else the file's mtime."""
+    try:
+        for _, elem in ET.iterparse(path, events=('start',)):
+            return datetime.fromisoformat(elem.get('timestamp'))
+    except (ET.ParseError, TypeError, ValueError):
+        pass
+    return datetime.fromtimestamp(os.path.getmtime(path))
+
+
+def _run_report_path(pretty_output_file: str, junit_dir: str) -> Optional[str]:
+    """The JUnit report of the first feature in pretty_output_file (None if there is no such feature)."""
+    if not os.path.exists(pretty_output_file):
+        return None
+    with open(pretty_output_file, 'rb') as f:
+        for line in f:
+            if line.startswith(b'Feature:'):
+                location = FEATURE_LOCATION_PATTERN.search(line)
+                if not location:
+                    return None
+                # features/accounts/account_creation.feature:2 -> TESTS-accounts.account_creation.xml
+                feature = location.group(1).decode('utf-8', 'replace').rsplit(':', 1)[0]
+                name = os.path.splitext(feature[len('features/'):])[0].replace('/', '.')
+                return os.path.join(junit_dir, JUNIT_REPORT_NAME.format(name))
+    return None
+
+
+def _list_junit_files(junit_dir: str, run_started_at: Optional[datetime] = None) -> List[str]:
+    """Return the JUnit XML reports in junit_dir, sorted by name (empty if there are none).
+    
+    With run_started_at, only the reports of features started at or after it are returned.
+    """
+    try:
+        with os.scandir(junit_dir) as entries:
+            reports = [entry.path for entry in entries if entry.is_file() and entry.name.endswith('.xml')]
+    except FileNotFoundError:
+        return []
+    
+    # behave only rewrites the reports of the features it ran, so a report of a feature
+    # started before this run is left over from an earlier one
+    if run_started_at is not None:
+        reports = [path for path in reports if _report_started_at(path) >= run_started_at]
+    return sorted(reports)
+
+
+def _empty_junit_results() -> Dict[str, Any]:
+    """Per-file JUnit results with nothing recorded yet."""
+    return {'stats': dict.fromkeys(JUNIT_STAT_KEYS, 0), 'failures': [], 'assertion_failures': []}
+
+
 class TestFailureAnalyzer:
     def __init__(self):
         self.failures = []
@@ -31,123 +163,216 @@ class TestFailureAnalyzer:
             print(f"ERROR: File not found: {pretty_output_file}")
             return {}
             
-        with open(pretty_output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Map the file instead of reading it into memory; pages are loaded as the scans reach them
+        with open(pretty_output_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = b''
         
-        # Extract summary statistics
-        self._extract_summary_stats(content)
+        try:
+            # Extract summary statistics
+            self._extract_summary_stats(content)
+            
+            # A green run has nothing else to extract
+            if self._summary_reports_failures():
+                # Extract assertion failures
+                self._extract_assertion_failures(content)
+                
+                # Extract failed scenarios
+                self._extract_failed_scenarios(content)
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
         
-        # Extract assertion failures
-        self._extract_assertion_failures(content)
+        return self._finish_analysis()
+    
+    def analyze_junit_reports(self, junit_dir: str = DEFAULT_JUNIT_DIR,
+                              run_started_at: Optional[datetime] = None) -> Dict[str, Any]:
+        """Analyze behave's JUnit XML reports, which carry the failure data already structured."""
+        print(f"Analyzing JUnit reports from: {junit_dir}")
         
-        # Extract failed scenarios
-        self._extract_failed_scenarios(content)
+        if not self._analyze_junit(junit_dir, run_started_at):
+            print(f"ERROR: No JUnit reports found in: {junit_dir}")
+            return {}
         
+        return self._finish_analysis()
+    
+    def analyze_test_results(self, pretty_output_file: str, junit_dir: str = DEFAULT_JUNIT_DIR) -> Dict[str, Any]:
+        """Prefer the JUnit reports of the run that wrote pretty_output_file; scrape it when they are missing."""
+        # The run started with the first feature in pretty.output, so that feature's report
+        # dates the run; without one this run wrote no JUnit reports
+        run_report = _run_report_path(pretty_output_file, junit_dir)
+        if run_report and os.path.isfile(run_report):
+            return self.analyze_junit_reports(junit_dir, _report_started_at(run_report))
+        if not os.path.exists(pretty_output_file) and _list_junit_files(junit_dir):
+            # Nothing to date the run by; use whatever reports there are
+            return self.analyze_junit_reports(junit_dir)
+        return self.analyze_pretty_output(pretty_output_file)
+    
+    def _finish_analysis(self) -> Dict[str, Any]:
+        """Build the report from the extracted failures and save the compact version."""
         # Generate analysis report
-        analysis_report = self._generate_analysis_report()
+        analyzed_at = datetime.now()
+        analysis_report = self._generate_analysis_report(analyzed_at)
         
         # Save the compact analysis
-        self._save_analysis_report(analysis_report)
+        self._save_analysis_report(analysis_report, analyzed_at)
         
         return analysis_report
     
-    def _extract_summary_stats(self, content: str):
-        """Extract test execution summary statistics."""
-        # Look for summary line pattern: "X features passed, Y failed, Z error, W skipped"
-        summary_pattern = r'(\d+)\s+features?\s+passed,\s+(\d+)\s+failed,\s+(\d+)\s+error,\s+(\d+)\s+skipped'
-        match = re.search(summary_pattern, content)
-        if match:
-            self.summary_stats.update({
-                'features_passed': int(match.group(1)),
-                'features_failed': int(match.group(2)), 
-                'features_error': int(match.group(3)),
-                'features_skipped': int(match.group(4))
-            })
+    def _analyze_junit(self, junit_dir: str, run_started_at: Optional[datetime] = None) -> bool:
+        """Collect summary statistics and failures from the JUnit reports in junit_dir (of one run, if given)."""
+        junit_files = _list_junit_files(junit_dir, run_started_at)
+        if not junit_files:
+            return False
         
-        # Look for scenarios summary: "X scenarios passed, Y failed, Z error, W skipped"  
-        scenario_pattern = r'(\d+)\s+scenarios?\s+passed,\s+(\d+)\s+failed,\s+(\d+)\s+error,\s+(\d+)\s+skipped'
-        match = re.search(scenario_pattern, content)
-        if match:
-            self.summary_stats.update({
-                'scenarios_passed': int(match.group(1)),
-                'scenarios_failed': int(match.group(2)),
-                'scenarios_error': int(match.group(3)), 
-                'scenarios_skipped': int(match.group(4))
-            })
+        self.summary_stats.update(dict.fromkeys(JUNIT_STAT_KEYS, 0))
+        # One report per feature (or per parallel tag group); parsing is mostly file reads and
+        # expat, so the reports are parsed on a few threads and merged back in file order
+        with ThreadPoolExecutor(max_workers=min(JUNIT_MAX_WORKERS, len(junit_files))) as executor:
+            for file_results in executor.map(self._parse_junit_file, junit_files):
+                self._merge(file_results)
+        return True
+    
+    def _parse_junit_file(self, path: str) -> Dict[str, Any]:
+        """Parse one JUnit report into its own scenario counts, failures and assertion failures."""
+        results = _empty_junit_results()
+        stats = results['stats']
         
-        # Look for steps summary: "X steps passed, Y failed, Z error, W skipped"
-        steps_pattern = r'(\d+)\s+steps?\s+passed,\s+(\d+)\s+failed,\s+(\d+)\s+error,\s+(\d+)\s+skipped'
-        match = re.search(steps_pattern, content)
-        if match:
+        try:
+            # Stream the testcases; each one is cleared once handled so large reports stay small in memory
+            for _, elem in ET.iterparse(path, events=('end',)):
+                if elem.tag != 'testcase':
+                    continue
+                problem = elem.find('failure')
+                if problem is None:
+                    problem = elem.find('error')
+                
+                if problem is not None:
+                    stats['scenarios_failed' if problem.tag == 'failure' else 'scenarios_error'] += 1
+                    self._record_junit_failure(elem, problem, results)
+                elif elem.find('skipped') is not None:
+                    stats['scenarios_skipped'] += 1
+                else:
+                    stats['scenarios_passed'] += 1
+                elem.clear()
+        except ET.ParseError as e:
+            # A truncated report (e.g. from a killed run) is skipped; the other reports still count
+            print(f"Error parsing {path}: {e}")
+            return _empty_junit_results()
+        
+        return results
+    
+    def _merge(self, results: Dict[str, Any]):
+        """Fold one report's results into the analyzer's totals."""
+        for key, total in results['stats'].items():
+            self.summary_stats[key] += total
+        self.failures.extend(results['failures'])
+        self.assertion_failures.extend(results['assertion_failures'])
+    
+    def _record_junit_failure(self, testcase: ET.Element, problem: ET.Element, results: Dict[str, Any]):
+        """Turn a JUnit <failure>/<error> element into the same records the pretty parser produces."""
+        details = f"{problem.get('message', '')}\n{problem.text or ''}".encode('utf-8')
+        system_out = (testcase.findtext('system-out') or '').encode('utf-8')
+        
+        results['assertion_failures'].extend(self._parse_assertion_failures(details))
+        
+        if b'ASSERT FAILED' in details:
+            failure_reason = self._extract_failure_reason(details)
+        elif problem.get('message'):
+            failure_reason = problem.get('message').strip()
+        else:
+            failure_reason = 'Test execution error' if problem.tag == 'error' else 'Unknown failure'
+        
+        feature_match = FEATURE_LOCATION_PATTERN.search(system_out)
+        tags_match = JUNIT_TAGS_PATTERN.search(system_out)
+        
+        results['failures'].append({
+            'scenario': testcase.get('name', 'Unknown Scenario'),
+            'location': feature_match.group(1).decode('utf-8', 'replace') if feature_match else testcase.get('classname', 'Unknown Location'),
+            'tags': tags_match.group(1).decode('utf-8', 'replace') if tags_match else '',
+            'failure_reason': failure_reason,
+            'category': self._categorize_failure(failure_reason)
+        })
+    
+    def _extract_summary_stats(self, content: bytes):
+        """Extract test execution summary statistics."""
+        # Summary lines look like "X features|scenarios|steps passed, Y failed, Z error, W skipped";
+        # all three are picked up in one scan, keeping the first line seen for each
+        seen = set()
+        for match in SUMMARY_PATTERN.finditer(content):
+            unit = match.group(2).decode()
+            if unit in seen:
+                continue
+            seen.add(unit)
             self.summary_stats.update({
-                'steps_passed': int(match.group(1)),
-                'steps_failed': int(match.group(2)),
-                'steps_error': int(match.group(3)),
-                'steps_skipped': int(match.group(4))
+                f'{unit}s_passed': int(match.group(1)),
+                f'{unit}s_failed': int(match.group(3)),
+                f'{unit}s_error': int(match.group(4)),
+                f'{unit}s_skipped': int(match.group(5))
             })
+            if len(seen) == 3:
+                break
+    
+    def _summary_reports_failures(self) -> bool:
+        """Whether the scenario summary line reports failures (assumed so when it is missing)."""
+        if 'scenarios_failed' not in self.summary_stats:
+            return True
+        return self.summary_stats['scenarios_failed'] + self.summary_stats['scenarios_error'] > 0
     
-    def _extract_assertion_failures(self, content: str):
+    def _extract_assertion_failures(self, content: bytes):
         """Extract detailed assertion failure information."""
-        # Pattern to match ASSERT FAILED lines
-        assert_pattern = r'ASSERT FAILED: (.*?)\. Response: (.*?)(?=\n|$)'
-        matches = re.findall(assert_pattern, content, re.DOTALL)
+        self.assertion_failures.extend(self._parse_assertion_failures(content))
+    
+    def _parse_assertion_failures(self, content: bytes) -> List[Dict[str, str]]:
+        """Parse every ASSERT FAILED line in content into an assertion failure record."""
+        # Green runs have no assertion failures; skip the DOTALL scan entirely
+        if content.find(b'ASSERT FAILED') == -1:
+            return []
         
-        for match in matches:
-            assertion_msg = match[0].strip()
-            response_data = match[1].strip()
+        assertion_failures = []
+        # Match ASSERT FAILED lines
+        for match in ASSERTION_PATTERN.finditer(content):
+            assertion_msg = match.group(1).decode('utf-8', 'replace').strip()
+            # Kept as logged; neither report renders the body, so it isn't parsed and re-indented here
+            response_data = match.group(2).decode('utf-8', 'replace').strip()
             
-            # Try to parse response as JSON for better formatting
-            try:
-                if response_data.startswith('{') or response_data.startswith('['):
-                    response_json = json.loads(response_data)
-                    formatted_response = json.dumps(response_json, indent=2)
-                else:
-                    formatted_response = response_data
-            except:
-                formatted_response = response_data
-                
-            self.assertion_failures.append({
+            assertion_failures.append({
                 'assertion': assertion_msg,
-                'response': formatted_response,
+                'response': response_data,
                 'type': self._categorize_assertion_failure(assertion_msg)
             })
+        return assertion_failures
     
     def _categorize_assertion_failure(self, assertion: str) -> str:
         """Categorize assertion failures by type."""
-        if 'Expected status' in assertion:
-            return 'HTTP_STATUS_MISMATCH'
-        elif 'Content-Length' in assertion:
-            return 'CONTENT_LENGTH_ERROR' 
-        elif 'JSON' in assertion:
-            return 'JSON_PARSING_ERROR'
-        elif 'Response is not valid' in assertion:
-            return 'INVALID_RESPONSE_FORMAT'
-        elif 'IllegalArgumentException' in assertion:
-            return 'WIREMOCK_CONFIG_ERROR'
-        else:
-            return 'GENERAL_ASSERTION_ERROR'
+        for keyword, assertion_type in ASSERTION_TYPE_RULES:
+            if keyword in assertion:
+                return assertion_type
+        return 'GENERAL_ASSERTION_ERROR'
     
-    def _extract_failed_scenarios(self, content: str):
+    def _extract_failed_scenarios(self, content: bytes):
         """Extract failed scenario information."""
-        # Split content into scenarios
-        scenario_pattern = r'@.*?Scenario: (.*?)(?=@.*?Scenario:|$)'
-        scenarios = re.findall(scenario_pattern, content, re.DOTALL)
-        
-        for scenario_content in scenarios:
-            if '@FAILED' in scenario_content or 'ASSERT FAILED' in scenario_content:
-                scenario_lines = scenario_content.strip().split('\n')
-                scenario_name = scenario_lines[0] if scenario_lines else 'Unknown Scenario'
+        # A scenario only counts as failed if it contains one of these markers
+        if content.find(b'@FAILED') == -1 and content.find(b'ASSERT FAILED') == -1:
+            return
+        
+        # Walk scenarios one at a time; only the fields kept in the report are decoded
+        for block in _iter_scenario_blocks(content):
+            if b'@FAILED' in block or b'ASSERT FAILED' in block:
+                scenario_name = block.strip().split(b'\n', 1)[0].decode('utf-8', 'replace')
                 
                 # Extract feature file info
-                feature_match = re.search(r'# (features/.*?\.feature:\d+)', scenario_content)
-                feature_location = feature_match.group(1) if feature_match else 'Unknown Location'
+                feature_match = FEATURE_LOCATION_PATTERN.search(block)
+                feature_location = feature_match.group(1).decode('utf-8', 'replace') if feature_match else 'Unknown Location'
                 
                 # Extract tags
-                tags_match = re.search(r'@.*?(?=\n|Scenario)', scenario_content)
-                tags = tags_match.group(0) if tags_match else ''
+                tags_match = TAGS_PATTERN.search(block)
+                tags = tags_match.group(0).decode('utf-8', 'replace') if tags_match else ''
                 
                 # Extract failure reason
-                failure_reason = self._extract_failure_reason(scenario_content)
+                failure_reason = self._extract_failure_reason(block)
                 
                 self.failures.append({
                     'scenario': scenario_name.strip(),
@@ -157,12 +382,12 @@ class TestFailureAnalyzer:
                     'category': self._categorize_failure(failure_reason)
                 })
     
-    def _extract_failure_reason(self, scenario_content: str) -> str:
+    def _extract_failure_reason(self, scenario_content: bytes) -> str:
         """Extract the specific failure reason from scenario content."""
-        if 'ASSERT FAILED' in scenario_content:
-            assert_match = re.search(r'ASSERT FAILED: (.*?)(?=\n|$)', scenario_content)
-            return assert_match.group(1) if assert_match else 'Assertion failure'
-        elif 'ERROR' in scenario_content:
+        if b'ASSERT FAILED' in scenario_content:
+            assert_match = FAILURE_REASON_PATTERN.search(scenario_content)
+            return assert_match.group(1).decode('utf-8', 'replace') if assert_match else 'Assertion failure'
+        elif b'ERROR' in scenario_content:
             return 'Test execution error'
         else:
             return 'Unknown failure'
@@ -171,40 +396,26 @@ class TestFailureAnalyzer:
         """Categorize failures for easier grouping and fixing."""
         reason_lower = failure_reason.lower()
         
-        if 'content-length' in reason_lower:
-            return 'CONTENT_LENGTH_VALIDATION'
-        elif 'status' in reason_lower and ('400' in reason_lower or '201' in reason_lower):
-            return 'HTTP_STATUS_VALIDATION'
-        elif 'json' in reason_lower and 'not valid' in reason_lower:
-            return 'RESPONSE_FORMAT_ERROR'
-        elif 'conflict' in reason_lower or '409' in reason_lower:
-            return 'BUSINESS_LOGIC_ERROR'
-        elif 'unauthorized' in reason_lower or '401' in reason_lower:
-            return 'AUTHENTICATION_ERROR'
-        elif 'enum constant' in reason_lower or 'illegalargumentexception' in reason_lower:
-            return 'WIREMOCK_CONFIGURATION_ERROR'
-        else:
-            return 'GENERAL_ERROR'
+        for category, keyword_groups in FAILURE_CATEGORY_RULES:
+            if all(any(keyword in reason_lower for keyword in group) for group in keyword_groups):
+                return category
+        return 'GENERAL_ERROR'
     
-    def _generate_analysis_report(self) -> Dict[str, Any]:
+    def _generate_analysis_report(self, analyzed_at: datetime) -> Dict[str, Any]:
         """Generate comprehensive analysis report."""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = analyzed_at.strftime('%Y-%m-%d %H:%M:%S')
         
         # Group failures by category
-        failures_by_category = {}
+        failures_by_category = defaultdict(list)
         for failure in self.failures:
-            category = failure['category']
-            if category not in failures_by_category:
-                failures_by_category[category] = []
-            failures_by_category[category].append(failure)
+            failures_by_category[failure['category']].append(failure)
+        failures_by_category = dict(failures_by_category)
         
         # Group assertion failures by type
-        assertions_by_type = {}
+        assertions_by_type = defaultdict(list)
         for assertion in self.assertion_failures:
-            assert_type = assertion['type']
-            if assert_type not in assertions_by_type:
-                assertions_by_type[assert_type] = []
-            assertions_by_type[assert_type].append(assertion)
+            assertions_by_type[assertion['type']].append(assertion)
+        assertions_by_type = dict(assertions_by_type)
         
         return {
             'analysis_timestamp': timestamp,
@@ -258,9 +469,9 @@ class TestFailureAnalyzer:
         
         return recommendations
     
-    def _save_analysis_report(self, report: Dict[str, Any]):
+    def _save_analysis_report(self, report: Dict[str, Any], analyzed_at: datetime):
         """Save the analysis report to a file."""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = analyzed_at.strftime('%Y%m%d_%H%M%S')
         report_file = f"test_failure_analysis_{timestamp}.json"
         compact_report_file = f"COMPACT_FAILURE_ANALYSIS_{timestamp}.txt"
         
@@ -277,66 +488,73 @@ class TestFailureAnalyzer:
     
     def _save_compact_report(self, report: Dict[str, Any], filename: str):
         """Save a compact, human-readable report."""
+        parts = []
+        write = parts.append
+        
+        write("=" * 80 + "\n")
+        write("BANKING API TEST FAILURE ANALYSIS - COMPACT REPORT\n") 
+        write("=" * 80 + "\n")
+        write(f"Analysis Timestamp: {report['analysis_timestamp']}\n\n")
+        
+        # Summary Statistics
+        write("SUMMARY STATISTICS:\n")
+        write("-" * 40 + "\n")
+        stats = report['summary_statistics']
+        if 'scenarios_passed' in stats:
+            write(f"Scenarios: {stats['scenarios_passed']} passed, {stats['scenarios_failed']} failed, {stats['scenarios_error']} error\n")
+        if 'steps_passed' in stats:
+            write(f"Steps: {stats['steps_passed']} passed, {stats['steps_failed']} failed, {stats['steps_error']} error\n")
+        write(f"Total Failures: {report['total_failures']}\n")
+        write(f"Assertion Failures: {report['total_assertion_failures']}\n\n")
+        
+        # Recommended Actions
+        write("PRIORITY FIXES NEEDED:\n")
+        write("-" * 40 + "\n")
+        for i, rec in enumerate(report['recommended_actions'], 1):
+            write(f"{i}. {rec['category']} ({rec['count']} failures)\n")
+            write(f"   Action: {rec['action']}\n")
+            write(f"   Check: {rec['file_to_check']}\n")
+            write(f"   Issue: {rec['specific_issue']}\n\n")
+        
+        # Assertion Failures by Type
+        write("ASSERTION FAILURES BY TYPE:\n")
+        write("-" * 40 + "\n")
+        for assert_type, assertions in report['assertion_failures_by_type'].items():
+            write(f"{assert_type}: {len(assertions)} failures\n")
+            for assertion in assertions[:3]:  # Show first 3 examples
+                write(f"  - {assertion['assertion']}\n")
+            if len(assertions) > 3:
+                write(f"  ... and {len(assertions) - 3} more\n")
+            write("\n")
+        
+        # Failed Scenarios Summary
+        write("FAILED SCENARIOS SUMMARY:\n")
+        write("-" * 40 + "\n")
+        for category, failures in report['failures_by_category'].items():
+            write(f"{category}: {len(failures)} scenarios\n")
+            for failure in failures[:2]:  # Show first 2 examples
+                write(f"  - {failure['scenario']} ({failure['location']})\n")
+            if len(failures) > 2:
+                write(f"  ... and {len(failures) - 2} more\n")
+            write("\n")
+        
         with open(filename, 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("BANKING API TEST FAILURE ANALYSIS - COMPACT REPORT\n") 
-            f.write("=" * 80 + "\n")
-            f.write(f"Analysis Timestamp: {report['analysis_timestamp']}\n\n")
-            
-            # Summary Statistics
-            f.write("SUMMARY STATISTICS:\n")
-            f.write("-" * 40 + "\n")
-            stats = report['summary_statistics']
-            if 'scenarios_passed' in stats:
-                f.write(f"Scenarios: {stats['scenarios_passed']} passed, {stats['scenarios_failed']} failed, {stats['scenarios_error']} error\n")
-            if 'steps_passed' in stats:
-                f.write(f"Steps: {stats['steps_passed']} passed, {stats['steps_failed']} failed, {stats['steps_error']} error\n")
-            f.write(f"Total Failures: {report['total_failures']}\n")
-            f.write(f"Assertion Failures: {report['total_assertion_failures']}\n\n")
-            
-            # Recommended Actions
-            f.write("PRIORITY FIXES NEEDED:\n")
-            f.write("-" * 40 + "\n")
-            for i, rec in enumerate(report['recommended_actions'], 1):
-                f.write(f"{i}. {rec['category']} ({rec['count']} failures)\n")
-                f.write(f"   Action: {rec['action']}\n")
-                f.write(f"   Check: {rec['file_to_check']}\n")
-                f.write(f"   Issue: {rec['specific_issue']}\n\n")
-            
-            # Assertion Failures by Type
-            f.write("ASSERTION FAILURES BY TYPE:\n")
-            f.write("-" * 40 + "\n")
-            for assert_type, assertions in report['assertion_failures_by_type'].items():
-                f.write(f"{assert_type}: {len(assertions)} failures\n")
-                for assertion in assertions[:3]:  # Show first 3 examples
-                    f.write(f"  - {assertion['assertion']}\n")
-                if len(assertions) > 3:
-                    f.write(f"  ... and {len(assertions) - 3} more\n")
-                f.write("\n")
-            
-            # Failed Scenarios Summary
-            f.write("FAILED SCENARIOS SUMMARY:\n")
-            f.write("-" * 40 + "\n")
-            for category, failures in report['failures_by_category'].items():
-                f.write(f"{category}: {len(failures)} scenarios\n")
-                for failure in failures[:2]:  # Show first 2 examples
-                    f.write(f"  - {failure['scenario']} ({failure['location']})\n")
-                if len(failures) > 2:
-                    f.write(f"  ... and {len(failures) - 2} more\n")
-                f.write("\n")
+            f.write("".join(parts))
 
 def main():
     """Main execution function."""
     analyzer = TestFailureAnalyzer()
     
-    # Default pretty.output file location
-    pretty_output_file = "/mnt/c/Users/D/python api automation framework/pretty.output"
-    
-    if len(os.sys.argv) > 1:
-        pretty_output_file = os.sys.argv[1]
+    results_path = sys.argv[1] if len(sys.argv) > 1 else None
     
-    # Analyze the test results
-    analysis_report = analyzer.analyze_pretty_output(pretty_output_file)
+    # Analyze the test results: an explicit directory is read as JUnit reports, an explicit
+    # file as pretty output; with no argument the JUnit reports are preferred when present
+    if results_path and os.path.isdir(results_path):
+        analysis_report = analyzer.analyze_junit_reports(results_path)
+    elif results_path:
+        analysis_report = analyzer.analyze_pretty_output(results_path)
+    else:
+        analysis_report = analyzer.analyze_test_results(DEFAULT_PRETTY_OUTPUT)
     
     if analysis_report:
         print("\n" + "=" * 60)
@@ -5,6 +5,15 @@ Reset WireMock scenario states to ensure clean test runs.
 
 import requests
 import sys
+from requests.adapters import HTTPAdapter
+
+# Seconds to wait for the WireMock admin API before giving up, so a hung server can't block test start-up
+ADMIN_TIMEOUT = 5
+
+# One keep-alive connection reused for every WireMock admin call from this process
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
+_session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1))
 
 def reset_wiremock_scenarios(wiremock_url="http://localhost:8081"):
     """Reset all WireMock scenario states to 'Started'."""
@@ -14,7 +23,7 @@ def reset_wiremock_scenarios(wiremock_url="http://localhost:8081"):
     try:
         # Reset all scenarios to Started state
         reset_url = f"{wiremock_url}/__admin/scenarios/reset"
-        response = requests.post(reset_url)
+        response = _session.post(reset_url, timeout=ADMIN_TIMEOUT)
         
         if response.status_code == 200:
             print("✅ Successfully reset all WireMock scenarios")
@@ -27,6 +36,9 @@ def reset_wiremock_scenarios(wiremock_url="http://localhost:8081"):
     except requests.exceptions.ConnectionError:
         print("❌ Could not connect to WireMock. Make sure it's running on port 8081")
         return False
+    except requests.exceptions.Timeout:
+        print(f"❌ WireMock did not respond within {ADMIN_TIMEOUT}s")
+        return False
     except Exception as e:
         print(f"❌ Error resetting scenarios: {e}")
         return False
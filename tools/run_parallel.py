@@ -8,42 +8,73 @@ import os
 import sys
 import subprocess
 import argparse
-from concurrent.futures import ProcessPoolExecutor, as_completed
 import time
+import threading
 from datetime import datetime
 
 
-def run_tag_group(tag_group, output_dir):
-    """Run a specific tag group in a separate process."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    output_file = os.path.join(output_dir, f'output_{tag_group.replace("@", "")}_{timestamp}.txt')
-    
-    cmd = [
-        sys.executable, '-m', 'behave',
-        '--tags', tag_group,
-        '--format', 'pretty',
-        '--no-capture',
-        '--junit',
-        '--junit-directory', 'reports/junit'
-    ]
+# Behave invocation shared by every tag group; only the tag is appended per run
+BEHAVE_COMMAND = (
+    sys.executable, '-m', 'behave',
+    '--format', 'pretty',
+    '--no-capture',
+    '--junit',
+    '--junit-directory', 'reports/junit'
+)
+
+# How often to check running tag groups for completion (seconds)
+POLL_INTERVAL = 0.1
+
+# Marker the step definitions print for every failed assertion
+ASSERT_FAILED_MARKER = 'ASSERT FAILED'
+
+
+def pump_output(run):
+    """Copy a tag group's piped output to its file, counting failed assertions on the way."""
+    output = run['output']
+    stdout = run['process'].stdout
+    try:
+        for line in stdout:
+            output.write(line)
+            if ASSERT_FAILED_MARKER in line:
+                run['assert_failures'] += 1
+    except Exception as e:
+        run['reader_error'] = str(e)
+        # Keep draining so the child never blocks on a full pipe
+        for _ in stdout:
+            pass
+    finally:
+        stdout.close()
+
+
+def start_tag_group(tag_group, output_dir, run_timestamp, index):
+    """Start a tag group as a child behave process writing to its own output file."""
+    # The index keeps file names unique when groups start within the same second
+    output_file = os.path.join(output_dir, f'output_{tag_group.replace("@", "")}_{run_timestamp}_{index}.txt')
     
     try:
         print(f"[PARALLEL] Starting execution for {tag_group}")
-        start_time = time.time()
+        output = open(output_file, 'w', encoding='utf-8')
+        try:
+            process = subprocess.Popen([*BEHAVE_COMMAND, '--tags', tag_group], stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, cwd=os.getcwd(), text=True, bufsize=1,
+                                       encoding='utf-8', errors='replace')
+        except Exception:
+            output.close()
+            raise
         
-        with open(output_file, 'w') as f:
-            result = subprocess.run(cmd, stdout=f, stderr=subprocess.STDOUT, 
-                                  cwd=os.getcwd(), text=True)
-        
-        duration = time.time() - start_time
-        print(f"[PARALLEL] Completed {tag_group} in {duration:.2f}s - Exit code: {result.returncode}")
-        
-        return {
+        run = {
             'tag_group': tag_group,
-            'exit_code': result.returncode,
-            'duration': duration,
+            'process': process,
+            'output': output,
+            'assert_failures': 0,
+            'start_time': time.time(),
             'output_file': output_file
         }
+        # A reader thread per group keeps the pipe drained (select() can't wait on pipes on Windows)
+        run['reader'] = threading.Thread(target=pump_output, args=(run,), daemon=True)
+        run['reader'].start()
+        return run
         
     except Exception as e:
         print(f"[ERROR] Failed to run {tag_group}: {e}")
@@ -56,6 +87,26 @@ def run_tag_group(tag_group, output_dir):
         }
 
 
+def finish_tag_group(run):
+    """Close a finished tag group's output file and build its result."""
+    run['reader'].join()
+    run['output'].close()
+    duration = time.time() - run['start_time']
+    exit_code = run['process'].returncode
+    print(f"[PARALLEL] Completed {run['tag_group']} in {duration:.2f}s - Exit code: {exit_code}")
+    
+    result = {
+        'tag_group': run['tag_group'],
+        'exit_code': exit_code,
+        'duration': duration,
+        'assert_failures': run['assert_failures'],
+        'output_file': run['output_file']
+    }
+    if 'reader_error' in run:
+        result['reader_error'] = run['reader_error']
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(description='Run Banking API BDD tests in parallel')
     parser.add_argument('--processes', '-p', type=int, default=4,
@@ -68,9 +119,9 @@ def main():
     
     args = parser.parse_args()
     
-    # Create output directory
-    os.makedirs(args.output_dir, exist_ok=True)
-    os.makedirs('reports/junit', exist_ok=True)
+    # Create output directories
+    for directory in (args.output_dir, 'reports/junit'):
+        os.makedirs(directory, exist_ok=True)
     
     print(f"[PARALLEL] Banking API BDD Framework - Parallel Execution")
     print(f"[PARALLEL] Processes: {args.processes}")
@@ -79,30 +130,32 @@ def main():
     print("=" * 80)
     
     start_time = time.time()
+    run_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     results = []
     
-    # Run tag groups in parallel
-    with ProcessPoolExecutor(max_workers=args.processes) as executor:
-        # Submit all tasks
-        future_to_tag = {
-            executor.submit(run_tag_group, tag, args.output_dir): tag 
-            for tag in args.tags
-        }
+    # Run tag groups in parallel, keeping at most args.processes behave processes alive
+    pending = list(enumerate(args.tags, 1))
+    running = []
+    while pending or running:
+        while pending and len(running) < args.processes:
+            index, tag_group = pending.pop(0)
+            run = start_tag_group(tag_group, args.output_dir, run_timestamp, index)
+            if 'process' in run:
+                running.append(run)
+            else:
+                results.append(run)
         
         # Collect results as they complete
-        for future in as_completed(future_to_tag):
-            tag = future_to_tag[future]
-            try:
-                result = future.result()
-                results.append(result)
-            except Exception as e:
-                print(f"[ERROR] Tag group {tag} generated an exception: {e}")
-                results.append({
-                    'tag_group': tag,
-                    'exit_code': -1,
-                    'duration': 0,
-                    'error': str(e)
-                })
+        still_running = []
+        for run in running:
+            if run['process'].poll() is None:
+                still_running.append(run)
+            else:
+                results.append(finish_tag_group(run))
+        running = still_running
+        
+        if running:
+            time.sleep(POLL_INTERVAL)
     
     total_duration = time.time() - start_time
     
@@ -119,8 +172,12 @@ def main():
         print(f"{status} {result['tag_group']} - {result['duration']:.2f}s")
         if 'output_file' in result:
             print(f"   📄 Output: {result['output_file']}")
+        if result.get('assert_failures'):
+            print(f"   ⚠️ Failed assertions: {result['assert_failures']}")
         if 'error' in result:
             print(f"   ❌ Error: {result['error']}")
+        if 'reader_error' in result:
+            print(f"   ⚠️ Output incomplete: {result['reader_error']}")
         
         if result['exit_code'] == 0:
             successful += 1
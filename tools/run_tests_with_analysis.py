@@ -9,6 +9,48 @@ import sys
 import os
 from datetime import datetime
 
+# Sibling tools are imported up front so they load while nothing else is running,
+# not after a long test run (the script's own directory is already on sys.path)
+from failure_analyzer import TestFailureAnalyzer
+from reset_wiremock_scenarios import reset_wiremock_scenarios
+
+# Flag that runs behave alone, without the wrapper or the failure analysis
+NO_ANALYSIS_FLAG = '--no-analysis'
+
+def build_behave_command(pretty_output_file, timestamp):
+    """Build the behave command line, including any extra arguments passed to this script."""
+    # Run behave tests with pretty output and JUnit reporting
+    cmd = [
+        'behave',
+        '--format=pretty',
+        f'--outfile={pretty_output_file}',
+        '--format=junit',
+        f'--outdir=reports',
+        '--junit-directory=reports',
+        f'--junit-filename=junit_results_{timestamp}.xml',
+        '--no-capture',
+        '--no-capture-stderr',
+        '--show-timings',
+        '--verbose'
+    ]
+    
+    # Add any additional arguments passed to this script
+    if len(sys.argv) > 1:
+        cmd.extend(sys.argv[1:])
+    
+    return cmd
+
+def reset_wiremock_before_run():
+    """Reset WireMock scenarios so the run starts from a clean state; failures are only reported."""
+    print("Resetting WireMock scenarios for clean test state...")
+    try:
+        if reset_wiremock_scenarios():
+            print("✅ WireMock scenarios reset successfully")
+        else:
+            print("⚠️  Failed to reset WireMock scenarios - tests may have stateful issues")
+    except Exception as e:
+        print(f"⚠️  Could not reset WireMock scenarios: {e}")
+
 def run_tests_with_analysis():
     """Run behave tests and generate failure analysis."""
     
@@ -32,36 +74,11 @@ def run_tests_with_analysis():
     print("-" * 80)
     
     # Reset WireMock scenarios before running tests
-    print("Resetting WireMock scenarios for clean test state...")
-    try:
-        from reset_wiremock_scenarios import reset_wiremock_scenarios
-        if reset_wiremock_scenarios():
-            print("✅ WireMock scenarios reset successfully")
-        else:
-            print("⚠️  Failed to reset WireMock scenarios - tests may have stateful issues")
-    except Exception as e:
-        print(f"⚠️  Could not reset WireMock scenarios: {e}")
+    reset_wiremock_before_run()
     print("-" * 80)
     
     try:
-        # Run behave tests with pretty output and JUnit reporting
-        cmd = [
-            'behave',
-            '--format=pretty',
-            f'--outfile={pretty_output_file}',
-            '--format=junit',
-            f'--outdir=reports',
-            '--junit-directory=reports',
-            f'--junit-filename=junit_results_{timestamp}.xml',
-            '--no-capture',
-            '--no-capture-stderr',
-            '--show-timings',
-            '--verbose'
-        ]
-        
-        # Add any additional arguments passed to this script
-        if len(sys.argv) > 1:
-            cmd.extend(sys.argv[1:])
+        cmd = build_behave_command(pretty_output_file, timestamp)
         
         print(f"Running command: {' '.join(cmd)}")
         print("-" * 80)
@@ -83,9 +100,7 @@ def run_tests_with_analysis():
     print("=" * 80)
     
     try:
-        # Import and run the failure analyzer
-        from failure_analyzer import TestFailureAnalyzer
-        
+        # Run the failure analyzer
         analyzer = TestFailureAnalyzer()
         analysis_report = analyzer.analyze_pretty_output(pretty_output_file)
         
@@ -120,5 +135,12 @@ def run_tests_with_analysis():
     return result.returncode
 
 if __name__ == "__main__":
+    if NO_ANALYSIS_FLAG in sys.argv:
+        # Run behave alone after the same WireMock reset, and exit with its exit code
+        sys.argv.remove(NO_ANALYSIS_FLAG)
+        os.makedirs('reports', exist_ok=True)
+        reset_wiremock_before_run()
+        sys.exit(subprocess.call(build_behave_command("pretty.output", datetime.now().strftime('%Y%m%d_%H%M%S'))))
+    
     exit_code = run_tests_with_analysis()
     sys.exit(exit_code)
\ No newline at end of file
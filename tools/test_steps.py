@@ -12,22 +12,41 @@ def test_step_discovery():
     # Import behave components
     try:
         from behave import step_registry
-        from behave.step_registry import StepRegistry
         
         print("✅ Behave imports successful")
         
-        # Create a test registry
-        registry = StepRegistry()
+        # Step modules register into behave's global registry
+        registry = step_registry.registry
         
         # Import step modules to register steps
         from features.steps import common_steps
         from features.steps import auth_steps  
-        from features.steps import data_steps
+        from features.steps import data_generation_steps
+        from features.steps import environment_steps
+        from features.steps import http_steps
+        from features.steps import assertion_steps
         
         print("✅ Step modules imported")
         
         # Check what steps are registered
-        print(f"📊 Steps registered in registry: {len(registry.steps)}")
+        print(f"📊 Steps registered in registry: {sum(len(matchers) for matchers in registry.steps.values())}")
+        
+        # Candidate matchers per step type, gathered once; generic @step definitions apply to every type
+        generic_steps = registry.steps.get('step', [])
+        candidates = {step_type: matchers + generic_steps if step_type != 'step' else matchers
+                      for step_type, matchers in registry.steps.items()}
+        # Plain-text patterns can be found by lookup before trying any matcher
+        exact_patterns = {(step_type, matcher.pattern): matcher
+                          for step_type, matchers in candidates.items() for matcher in matchers}
+        found = {}
+        
+        def find_step_definition(step_type, step_text):
+            """Find the first matcher for a step, remembering the answer for repeated probes."""
+            key = (step_type, step_text)
+            if key not in found:
+                found[key] = exact_patterns.get(key) or next(
+                    (matcher for matcher in candidates.get(step_type, []) if matcher.match(step_text)), None)
+            return found[key]
         
         # Test specific step patterns
         test_patterns = [
@@ -39,9 +58,14 @@ def test_step_discovery():
             "Then I should receive an unauthorized error"
         ]
         
+        step_type = 'given'
         for pattern in test_patterns:
             try:
-                step_def = registry.find_step_definition(pattern)
+                keyword, step_text = pattern.split(' ', 1)
+                # "And" continues the previous step's type, as in a feature file
+                if keyword.lower() != 'and':
+                    step_type = keyword.lower()
+                step_def = find_step_definition(step_type, step_text)
                 if step_def:
                     print(f"✅ Found: {pattern}")
                 else:
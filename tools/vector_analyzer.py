@@ -7,24 +7,100 @@ Uses sentence transformers and similarity search to analyze the entire test outp
 import os
 import json
 import re
+import hashlib
+import io
+import mmap
+import sys
+import logging
+import logging.handlers
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
+from functools import lru_cache
+from collections import Counter, defaultdict, deque
+
+# Progress and summary output goes through a memory-buffered handler so it reaches stdout
+# in batches rather than one write per line; errors flush the buffer immediately
+REPORT_LOG_CAPACITY = 200
+
+logger = logging.getLogger('vector_analyzer')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_stdout_handler = logging.StreamHandler(sys.stdout)
+_stdout_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_buffer = logging.handlers.MemoryHandler(REPORT_LOG_CAPACITY, flushLevel=logging.ERROR, target=_stdout_handler)
+logger.addHandler(_log_buffer)
 
 # Note: These would need to be installed if not available
-# pip install sentence-transformers numpy scikit-learn
+# pip install sentence-transformers numpy
 
 try:
     from sentence_transformers import SentenceTransformer
     import numpy as np
-    from sklearn.metrics.pairwise import cosine_similarity
     VECTOR_SUPPORT = True
 except ImportError:
-    print("Vector libraries not available. Using text-based analysis instead.")
+    logger.info("Vector libraries not available. Using text-based analysis instead.")
     VECTOR_SUPPORT = False
 
+# Classifies a stripped pretty.output line in one match. Alternatives are tried in the same
+# order the parser used to test them: scenario header, step, error marker, success marker.
+LINE_PATTERN = re.compile(
+    r'(?P<scenario>.*?Scenario:\s*(?P<name>.+?)(?:\s*#\s*(?P<location>.+?):\d+)?$)'
+    r'|(?P<step>(?P<keyword>Given|When|Then|And) \s*(?P<text>.+?)(?:\s*#|$))'
+    r'|(?P<error>.*?(?:ERROR|FAILED))'
+    r'|(?P<success>.*?(?:PASSED|SUCCESS))'
+)
+TAG_PATTERN = re.compile(r'@(\w+)')
+SCENARIO_COMPLETE_PATTERN = re.compile(rb'^[^\n]*?SCENARIO COMPLETE:(?P<name>[^\n]*)', re.MULTILINE)
+EXPECTED_PATTERN = re.compile(r'Expected\s+(.+?),\s+got\s+(.+?)\.')
+
+# Error message keyword -> error type, in priority order (matched case-insensitively)
+ERROR_TYPE_RULES = (
+    ('status', "Status Code Error"),
+    ('does not contain', "Missing Field Error"),
+    ('json', "JSON Parsing Error"),
+    ('request was not matched', "Endpoint Not Found"),
+)
+ERROR_TYPE_PATTERN = re.compile('|'.join(f'({re.escape(keyword)})' for keyword, _ in ERROR_TYPE_RULES), re.IGNORECASE)
+
+# Search queries whose embeddings are kept for reuse
+QUERY_CACHE_SIZE = 256
+
+# Read buffer for streaming pretty.output
+READ_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Write buffer for the saved report
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# How many lines above a scenario header are searched for its tags
+TAG_LOOKBACK_LINES = 10
+
+# Sentence embedding model; its name is also part of the embedding cache file name
+EMBEDDING_MODEL = 'all-MiniLM-L6-v2'
+
+# Precision the embeddings are kept (and cached) in
+EMBEDDING_DTYPE = 'float16'
+
+# Sentences per forward pass when embedding scenarios and failures
+EMBEDDING_BATCH_SIZE = 64
+
+
+@lru_cache(maxsize=None)
+def _get_model(model_name: str) -> "SentenceTransformer":
+    """Load a sentence embedding model once per process; analyzers and the query cache share it."""
+    return SentenceTransformer(model_name)
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _encode_query(model_name: str, query: str) -> "np.ndarray":
+    """Embed a search query, remembering recent ones so repeated searches skip the forward pass."""
+    # Keyed on the model name rather than the model, so cached entries don't keep models alive
+    query_embedding = _get_model(model_name).encode([query], convert_to_numpy=True, normalize_embeddings=True)[0]
+    # Shared between callers through the cache, so it must not be modified in place
+    query_embedding.setflags(write=False)
+    return query_embedding
 
-@dataclass
+
+@dataclass(slots=True)
 class TestScenario:
     name: str
     feature: str
@@ -38,7 +114,7 @@ class TestScenario:
     line_end: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class TestFailure:
     scenario: str
     error_type: str
@@ -53,198 +129,189 @@ class VectorTestAnalyzer:
         self.output_file = output_file
         self.scenarios: List[TestScenario] = []
         self.failures: List[TestFailure] = []
-        self.lines: List[str] = []
+        self.line_count = 0
+        
+        # Parser state while streaming the output file
+        self._current_scenario = None
+        self._recent_lines = deque(maxlen=TAG_LOOKBACK_LINES)
         
         if VECTOR_SUPPORT:
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
             self.embeddings = None
+            # Vectors from earlier runs, keyed by text hash; one file per model so switching models starts fresh
+            self.embedding_cache_file = os.path.join(os.path.dirname(output_file), f'.embed_cache_{EMBEDDING_MODEL}.npz')
         
+    @property
+    def model(self) -> "SentenceTransformer":
+        """Sentence embedding model, loaded on first use so report-only runs never pay for it."""
+        return _get_model(EMBEDDING_MODEL)
+    
     def load_and_parse(self) -> None:
-        """Load the entire pretty.output file and parse it comprehensively."""
-        print(f"Loading and parsing {self.output_file}...")
-        
-        with open(self.output_file, 'r', encoding='utf-8', errors='ignore') as f:
-            self.lines = f.readlines()
+        """Stream the pretty.output file and parse it comprehensively."""
+        logger.info(f"Loading and parsing {self.output_file}...")
         
-        print(f"Loaded {len(self.lines)} lines")
+        # Parse scenarios and failures line by line; only the last few lines are kept for tag lookback
+        with open(self.output_file, 'rb', buffering=READ_BUFFER_SIZE) as f:
+            for i, raw_line in enumerate(io.TextIOWrapper(f, encoding='utf-8', errors='ignore')):
+                self._process_line(i, raw_line)
+                self.line_count = i + 1
+        self._close_scenario(self.line_count - 1)
         
-        # Parse scenarios and failures
-        self._parse_scenarios()
-        self._parse_failures()
+        logger.info(f"Loaded {self.line_count} lines")
         
         # Also parse log files for better accuracy
         self._parse_log_files()
         
-        print(f"Found {len(self.scenarios)} scenarios and {len(self.failures)} failures")
+        logger.info(f"Found {len(self.scenarios)} scenarios and {len(self.failures)} failures")
     
-    def _parse_scenarios(self) -> None:
-        """Extract all test scenarios from the output."""
-        current_scenario = None
-        i = 0
+    def _process_line(self, i: int, raw_line: str) -> None:
+        """Update the scenario being parsed (and the failure list) with one output line."""
+        line = raw_line.strip()
+        match = LINE_PATTERN.match(line)
+        current_scenario = self._current_scenario
         
-        while i < len(self.lines):
-            line = self.lines[i].strip()
+        # Look for scenario definitions
+        if match and match.lastgroup == 'scenario':
+            self._close_scenario(i - 1)
             
-            # Look for scenario definitions - improved regex
-            scenario_match = re.search(r'Scenario:\s*(.+?)(?:\s*#\s*(.+?):\d+)?$', line)
-            if scenario_match:
-                if current_scenario:
-                    current_scenario.line_end = i - 1
-                    self.scenarios.append(current_scenario)
-                
-                scenario_name = scenario_match.group(1).strip()
-                location = scenario_match.group(2).strip() if scenario_match.group(2) else "unknown"
-                
-                # Extract feature name from location
-                feature_name = os.path.basename(location).replace('.feature', '').replace('_', ' ').title() if location != "unknown" else "Unknown Feature"
-                
-                current_scenario = TestScenario(
-                    name=scenario_name,
-                    feature=feature_name,
-                    status="unknown",
-                    location=location,
-                    tags=[],
-                    steps=[],
-                    errors=[],
-                    line_start=i
-                )
-                
-                # Look for tags in previous lines (expanded search)
-                for j in range(max(0, i-10), i):
-                    if '@' in self.lines[j]:
-                        tags = re.findall(r'@(\w+)', self.lines[j])
-                        current_scenario.tags.extend(tags)
+            scenario_name = match.group('name').strip()
+            location = match.group('location').strip() if match.group('location') else "unknown"
             
-            # Look for step definitions
-            elif current_scenario and (
-                line.startswith('Given ') or 
-                line.startswith('When ') or 
-                line.startswith('Then ') or 
-                line.startswith('And ')
-            ):
-                step_match = re.search(r'(Given|When|Then|And)\s+(.+?)(?:\s*#|$)', line)
-                if step_match:
-                    current_scenario.steps.append(f"{step_match.group(1)} {step_match.group(2)}")
+            # Extract feature name from location
+            feature_name = os.path.basename(location).replace('.feature', '').replace('_', ' ').title() if location != "unknown" else "Unknown Feature"
             
-            # Look for errors - improved error detection
-            elif current_scenario and ('ASSERT FAILED' in line or 'ERROR' in line or 'FAILED' in line):
-                current_scenario.errors.append(line.strip())
-                current_scenario.status = "failed"
+            current_scenario = self._current_scenario = TestScenario(
+                name=scenario_name,
+                feature=feature_name,
+                status="unknown",
+                location=location,
+                tags=[],
+                steps=[],
+                errors=[],
+                line_start=i
+            )
             
-            # Look for success indicators - improved success detection
-            elif current_scenario and ('PASSED' in line or 'SUCCESS' in line or 'Status: [PASSED]' in line):
-                if current_scenario.status != "failed":
-                    current_scenario.status = "passed"
+            # Look for tags in previous lines (expanded search)
+            for previous_line in self._recent_lines:
+                if '@' in previous_line:
+                    current_scenario.tags.extend(TAG_PATTERN.findall(previous_line))
+        
+        elif match and current_scenario:
+            kind = match.lastgroup
             
-            # Look for scenario completion markers from logs
-            elif current_scenario and ('SCENARIO COMPLETE' in line):
-                if 'PASSED' in line:
-                    current_scenario.status = "passed"
-                elif 'FAILED' in line:
-                    current_scenario.status = "failed"
+            # Look for step definitions
+            if kind == 'step':
+                current_scenario.steps.append(f"{match.group('keyword')} {match.group('text')}")
+            
+            # Look for errors (ASSERT FAILED, ERROR, FAILED, "[FAILED] SCENARIO COMPLETE")
+            elif kind == 'error':
+                current_scenario.errors.append(line)
+                current_scenario.status = "failed"
             
-            i += 1
+            # Look for success indicators (PASSED, SUCCESS, "Status: [PASSED]", "[PASSED] SCENARIO COMPLETE")
+            elif current_scenario.status != "failed":
+                current_scenario.status = "passed"
         
-        # Don't forget the last scenario
-        if current_scenario:
-            current_scenario.line_end = len(self.lines) - 1
-            self.scenarios.append(current_scenario)
+        if 'ASSERT FAILED' in raw_line:
+            self._record_failure(i, line)
+        
+        self._recent_lines.append(raw_line)
+    
+    def _close_scenario(self, line_end: int) -> None:
+        """Finish the scenario being parsed, if any, at line_end."""
+        if self._current_scenario:
+            self._current_scenario.line_end = line_end
+            self.scenarios.append(self._current_scenario)
+            self._current_scenario = None
+    
+    def _apply_log_statuses(self, content: bytes, scenarios_by_name: Dict[str, TestScenario]) -> None:
+        """Set scenario statuses from the "[PASSED|FAILED] SCENARIO COMPLETE: <name>" log lines."""
+        for match in SCENARIO_COMPLETE_PATTERN.finditer(content):
+            line = match.group(0)
+            if b'[PASSED]' in line:
+                status = "passed"
+            elif b'[FAILED]' in line:
+                status = "failed"
+            else:
+                continue
+            scenario = scenarios_by_name.get(match.group('name').decode('utf-8', 'ignore').strip())
+            if scenario:
+                scenario.status = status
+    
+    def _record_failure(self, i: int, error_message: str) -> None:
+        """Record an ASSERT FAILED line against the scenario being parsed."""
+        # Try to extract expected vs actual
+        expected_match = EXPECTED_PATTERN.search(error_message)
+        if expected_match:
+            expected = expected_match.group(1)
+            actual = expected_match.group(2)
+        else:
+            expected = ""
+            actual = ""
+        
+        # The scenario still open is the one this line belongs to
+        scenario_name = self._current_scenario.name if self._current_scenario else "Unknown"
+        
+        failure = TestFailure(
+            scenario=scenario_name,
+            error_type=self._classify_error(error_message),
+            error_message=error_message,
+            expected=expected,
+            actual=actual,
+            line_number=i
+        )
+        self.failures.append(failure)
     
     def _parse_log_files(self) -> None:
         """Parse log files to get more accurate scenario status information."""
         log_dir = os.path.dirname(self.output_file)
-        log_files = []
         
-        # Look for recent log files
-        for filename in os.listdir(log_dir):
-            if filename.startswith('banking_api_tests_') and filename.endswith('.log'):
-                log_files.append(os.path.join(log_dir, filename))
+        # Find the most recent log file in one directory scan
+        latest_log = None
+        latest_mtime = None
+        with os.scandir(log_dir or '.') as entries:
+            for entry in entries:
+                if entry.name.startswith('banking_api_tests_') and entry.name.endswith('.log') and entry.is_file():
+                    mtime = entry.stat().st_mtime
+                    if latest_mtime is None or mtime > latest_mtime:
+                        latest_log, latest_mtime = os.path.join(log_dir, entry.name), mtime
         
-        # Get the most recent log file
-        if log_files:
-            log_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            latest_log = log_files[0]
+        if latest_log:
+            # A log line updates the first scenario parsed with that name
+            scenarios_by_name = {}
+            for scenario in self.scenarios:
+                scenarios_by_name.setdefault(scenario.name, scenario)
             
             try:
-                with open(latest_log, 'r', encoding='utf-8', errors='ignore') as f:
-                    log_lines = f.readlines()
-                
-                # Update scenario statuses based on log entries
-                for line in log_lines:
-                    if 'SCENARIO COMPLETE:' in line:
-                        if '[PASSED]' in line:
-                            scenario_name = line.split('SCENARIO COMPLETE:')[1].split('\n')[0].strip()
-                            for scenario in self.scenarios:
-                                if scenario.name == scenario_name:
-                                    scenario.status = "passed"
-                                    break
-                        elif '[FAILED]' in line:
-                            scenario_name = line.split('SCENARIO COMPLETE:')[1].split('\n')[0].strip()
-                            for scenario in self.scenarios:
-                                if scenario.name == scenario_name:
-                                    scenario.status = "failed"
-                                    break
+                # Update scenario statuses based on log entries; the log is memory-mapped and only
+                # the SCENARIO COMPLETE lines are picked out (and decoded) by the regex engine
+                with open(latest_log, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                            self._apply_log_statuses(content, scenarios_by_name)
                 
-                print(f"Updated scenario statuses from log file: {latest_log}")
+                logger.info(f"Updated scenario statuses from log file: {latest_log}")
             except Exception as e:
-                print(f"Warning: Could not parse log file {latest_log}: {e}")
-    
-    def _parse_failures(self) -> None:
-        """Extract all failure details from the output."""
-        for i, line in enumerate(self.lines):
-            if 'ASSERT FAILED' in line:
-                # Extract error details
-                error_message = line.strip()
-                
-                # Try to extract expected vs actual
-                expected_match = re.search(r'Expected\s+(.+?),\s+got\s+(.+?)\.', error_message)
-                if expected_match:
-                    expected = expected_match.group(1)
-                    actual = expected_match.group(2)
-                else:
-                    expected = ""
-                    actual = ""
-                
-                # Find which scenario this belongs to
-                scenario_name = "Unknown"
-                for scenario in self.scenarios:
-                    if scenario.line_start <= i <= scenario.line_end:
-                        scenario_name = scenario.name
-                        break
-                
-                # Classify error type
-                error_type = self._classify_error(error_message)
-                
-                failure = TestFailure(
-                    scenario=scenario_name,
-                    error_type=error_type,
-                    error_message=error_message,
-                    expected=expected,
-                    actual=actual,
-                    line_number=i
-                )
-                self.failures.append(failure)
+                logger.warning(f"Warning: Could not parse log file {latest_log}: {e}")
     
     def _classify_error(self, error_message: str) -> str:
         """Classify the type of error."""
-        if 'status' in error_message.lower():
-            return "Status Code Error"
-        elif 'does not contain' in error_message.lower():
-            return "Missing Field Error"
-        elif 'json' in error_message.lower():
-            return "JSON Parsing Error"
-        elif 'request was not matched' in error_message.lower():
-            return "Endpoint Not Found"
-        else:
-            return "Other Error"
+        # One scan over the message; the earliest rule that matches anywhere wins
+        best = None
+        for match in ERROR_TYPE_PATTERN.finditer(error_message):
+            rule_index = match.lastindex - 1
+            if best is None or rule_index < best:
+                best = rule_index
+                if best == 0:
+                    break
+        return ERROR_TYPE_RULES[best][1] if best is not None else "Other Error"
     
     def create_embeddings(self) -> None:
         """Create vector embeddings for all content if vector support is available."""
         if not VECTOR_SUPPORT:
-            print("Vector support not available, skipping embeddings")
+            logger.info("Vector support not available, skipping embeddings")
             return
         
-        print("Creating vector embeddings...")
+        logger.info("Creating vector embeddings...")
         
         # Combine all text content
         all_text = []
@@ -256,22 +323,71 @@ class VectorTestAnalyzer:
             failure_text = f"{failure.scenario} {failure.error_type} {failure.error_message}"
             all_text.append(failure_text)
         
-        # Create embeddings
-        self.embeddings = self.model.encode(all_text)
-        print(f"Created {len(self.embeddings)} embeddings")
+        # Create embeddings, reusing cached vectors for texts seen in earlier runs
+        self.embeddings = self._embed_with_cache(all_text)
+        logger.info(f"Created {len(self.embeddings)} embeddings")
+    
+    def _embed_with_cache(self, texts: List[str]) -> "np.ndarray":
+        """Embed texts, encoding only the ones missing from the on-disk cache."""
+        keys = [hashlib.sha256(text.encode('utf-8')).hexdigest() for text in texts]
+        cache = self._load_embedding_cache()
+        misses = {key: text for key, text in zip(keys, texts) if key not in cache}
+        
+        if misses or not keys:
+            # encode() already length-sorts its input into batches (SBERT's smart batching) and
+            # restores the order; vectors come back unit-length so similarity is a dot product
+            vectors = self.model.encode(list(misses.values()), batch_size=EMBEDDING_BATCH_SIZE, show_progress_bar=False,
+                                        convert_to_numpy=True, normalize_embeddings=True)
+            # Unit vectors lose nothing that matters for ranking in half precision, and take half the memory
+            vectors = vectors.astype(EMBEDDING_DTYPE)
+            if not keys:
+                return vectors
+            cache.update(zip(misses, vectors))
+            # Only this run's texts are kept, so vectors of texts that no longer occur drop out
+            self._save_embedding_cache({key: cache[key] for key in keys})
+        
+        logger.info(f"Reused {len(keys) - len(misses)} cached embeddings, encoded {len(misses)}")
+        return np.stack([cache[key] for key in keys]).astype(EMBEDDING_DTYPE, copy=False)
+    
+    def _load_embedding_cache(self) -> Dict[str, Any]:
+        """Load the text-hash -> vector cache, or start an empty one."""
+        if not os.path.exists(self.embedding_cache_file):
+            return {}
+        try:
+            with np.load(self.embedding_cache_file) as data:
+                return dict(zip(data['keys'].tolist(), data['vectors']))
+        except Exception as e:
+            logger.warning(f"Warning: Ignoring unreadable embedding cache {self.embedding_cache_file}: {e}")
+            return {}
+    
+    def _save_embedding_cache(self, cache: Dict[str, Any]) -> None:
+        """Write the text-hash -> vector cache back to disk."""
+        try:
+            np.savez_compressed(self.embedding_cache_file, keys=np.array(list(cache)), vectors=np.stack(list(cache.values())))
+        except OSError as e:
+            # The embeddings are already computed; only the cache is lost
+            logger.warning(f"Warning: Could not write embedding cache {self.embedding_cache_file}: {e}")
+            # Don't leave a truncated cache file behind for the next run to trip over
+            try:
+                os.remove(self.embedding_cache_file)
+            except OSError:
+                pass
     
     def analyze_patterns(self) -> Dict[str, Any]:
         """Analyze patterns in test results."""
+        # Scenario statuses overall and per tag, counted in one pass over the scenarios
+        status_counts = Counter(scenario.status for scenario in self.scenarios)
+        
         analysis = {
             "total_scenarios": len(self.scenarios),
-            "passed_scenarios": len([s for s in self.scenarios if s.status == "passed"]),
-            "failed_scenarios": len([s for s in self.scenarios if s.status == "failed"]),
-            "unknown_scenarios": len([s for s in self.scenarios if s.status == "unknown"]),
+            "passed_scenarios": status_counts["passed"],
+            "failed_scenarios": status_counts["failed"],
+            "unknown_scenarios": status_counts["unknown"],
             "total_failures": len(self.failures),
-            "failure_types": defaultdict(int),
-            "failing_features": defaultdict(int),
-            "common_errors": defaultdict(int),
-            "tag_analysis": defaultdict(list)
+            "failure_types": Counter(),
+            "failing_features": Counter(),
+            "common_errors": Counter(),
+            "tag_analysis": defaultdict(Counter)
         }
         
         # Analyze failures
@@ -285,14 +401,13 @@ class VectorTestAnalyzer:
                 analysis["failing_features"][scenario.feature] += 1
             
             for tag in scenario.tags:
-                analysis["tag_analysis"][tag].append(scenario.status)
+                analysis["tag_analysis"][tag][scenario.status] += 1
         
         # Calculate pass rates by tag
         tag_pass_rates = {}
         for tag, statuses in analysis["tag_analysis"].items():
-            total = len(statuses)
-            passed = len([s for s in statuses if s == "passed"])
-            tag_pass_rates[tag] = round((passed / total * 100), 2) if total > 0 else 0
+            total = statuses.total()
+            tag_pass_rates[tag] = round((statuses["passed"] / total * 100), 2) if total > 0 else 0
         
         analysis["tag_pass_rates"] = tag_pass_rates
         analysis["overall_pass_rate"] = round((analysis["passed_scenarios"] / analysis["total_scenarios"] * 100), 2)
@@ -304,11 +419,17 @@ class VectorTestAnalyzer:
         if not VECTOR_SUPPORT or self.embeddings is None:
             return []
         
-        query_embedding = self.model.encode([query])
-        similarities = cosine_similarity(query_embedding, self.embeddings)[0]
+        # Embeddings and query are both unit-length, so cosine similarity is a plain dot product
+        query_embedding = _encode_query(EMBEDDING_MODEL, query)
+        # Stored vectors are half precision; the product is taken in float32 since NumPy has no BLAS path for float16
+        similarities = self.embeddings.astype(np.float32) @ query_embedding
         
-        # Get top k similar items
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        # Get top k similar items: partition out the k best, then sort only those
+        top_k = min(top_k, len(similarities))
+        if top_k <= 0:
+            return []
+        top_indices = np.argpartition(-similarities, top_k - 1)[:top_k]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
         
         results = []
         for idx in top_indices:
@@ -325,54 +446,65 @@ class VectorTestAnalyzer:
     
     def generate_report(self) -> str:
         """Generate a comprehensive analysis report."""
+        return "\n".join(self._iter_report_lines())
+    
+    def save_report(self, out_path: str) -> None:
+        """Write the analysis report straight to out_path without building it in memory first."""
+        with open(out_path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            write = f.write
+            separator = ""
+            for line in self._iter_report_lines():
+                write(separator)
+                write(line)
+                separator = "\n"
+    
+    def _iter_report_lines(self):
+        """Yield the lines of the analysis report."""
         analysis = self.analyze_patterns()
         
-        report = []
-        report.append("=" * 80)
-        report.append("COMPREHENSIVE TEST ANALYSIS REPORT")
-        report.append("=" * 80)
-        report.append("")
+        yield "=" * 80
+        yield "COMPREHENSIVE TEST ANALYSIS REPORT"
+        yield "=" * 80
+        yield ""
         
         # Overall summary
-        report.append(f"📊 OVERALL RESULTS:")
-        report.append(f"   • Total Scenarios: {analysis['total_scenarios']}")
-        report.append(f"   • Passed: {analysis['passed_scenarios']} ({analysis['overall_pass_rate']}%)")
-        report.append(f"   • Failed: {analysis['failed_scenarios']}")
-        report.append(f"   • Unknown: {analysis['unknown_scenarios']}")
-        report.append(f"   • Total Failures: {analysis['total_failures']}")
-        report.append("")
+        yield f"📊 OVERALL RESULTS:"
+        yield f"   • Total Scenarios: {analysis['total_scenarios']}"
+        yield f"   • Passed: {analysis['passed_scenarios']} ({analysis['overall_pass_rate']}%)"
+        yield f"   • Failed: {analysis['failed_scenarios']}"
+        yield f"   • Unknown: {analysis['unknown_scenarios']}"
+        yield f"   • Total Failures: {analysis['total_failures']}"
+        yield ""
         
         # Failure type breakdown
-        report.append("🚨 FAILURE TYPE BREAKDOWN:")
-        for error_type, count in sorted(analysis['failure_types'].items(), key=lambda x: x[1], reverse=True):
-            report.append(f"   • {error_type}: {count} occurrences")
-        report.append("")
+        yield "🚨 FAILURE TYPE BREAKDOWN:"
+        for error_type, count in analysis['failure_types'].most_common():
+            yield f"   • {error_type}: {count} occurrences"
+        yield ""
         
         # Failing features
-        report.append("📁 FAILING FEATURES:")
-        for feature, count in sorted(analysis['failing_features'].items(), key=lambda x: x[1], reverse=True):
-            report.append(f"   • {feature}: {count} failures")
-        report.append("")
+        yield "📁 FAILING FEATURES:"
+        for feature, count in analysis['failing_features'].most_common():
+            yield f"   • {feature}: {count} failures"
+        yield ""
         
         # Tag analysis
-        report.append("🏷️  TAG PASS RATES:")
+        yield "🏷️  TAG PASS RATES:"
         for tag, pass_rate in sorted(analysis['tag_pass_rates'].items(), key=lambda x: x[1], reverse=True):
-            total_scenarios = len(analysis['tag_analysis'][tag])
-            report.append(f"   • @{tag}: {pass_rate}% ({total_scenarios} scenarios)")
-        report.append("")
+            total_scenarios = analysis['tag_analysis'][tag].total()
+            yield f"   • @{tag}: {pass_rate}% ({total_scenarios} scenarios)"
+        yield ""
         
         # Detailed scenario list
-        report.append("📝 SCENARIO DETAILS:")
+        yield "📝 SCENARIO DETAILS:"
         for scenario in self.scenarios:
             status_icon = "✅" if scenario.status == "passed" else "❌" if scenario.status == "failed" else "❓"
-            report.append(f"   {status_icon} {scenario.name}")
-            report.append(f"       Feature: {scenario.feature}")
-            report.append(f"       Tags: {', '.join(scenario.tags) if scenario.tags else 'None'}")
+            yield f"   {status_icon} {scenario.name}"
+            yield f"       Feature: {scenario.feature}"
+            yield f"       Tags: {', '.join(scenario.tags) if scenario.tags else 'None'}"
             if scenario.errors:
-                report.append(f"       Errors: {len(scenario.errors)} errors found")
-            report.append("")
-        
-        return "\n".join(report)
+                yield f"       Errors: {len(scenario.errors)} errors found"
+            yield ""
 
 
 def main():
@@ -380,7 +512,7 @@ def main():
     output_file = "/mnt/c/Users/D/python api automation framework/pretty.output"
     
     if not os.path.exists(output_file):
-        print(f"Error: {output_file} not found")
+        logger.error(f"Error: {output_file} not found")
         return
     
     # Create analyzer
@@ -392,25 +524,22 @@ def main():
     # Create embeddings if possible
     analyzer.create_embeddings()
     
-    # Generate comprehensive report
-    report = analyzer.generate_report()
-    
-    # Save report
+    # Generate and save comprehensive report
     report_file = "/mnt/c/Users/D/python api automation framework/vector_analysis_report.txt"
-    with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(report)
+    analyzer.save_report(report_file)
     
-    print(f"Analysis complete! Report saved to: {report_file}")
-    print("\n" + "="*50)
-    print("QUICK SUMMARY:")
-    print("="*50)
+    logger.info(f"Analysis complete! Report saved to: {report_file}")
+    logger.info("\n" + "="*50)
+    logger.info("QUICK SUMMARY:")
+    logger.info("="*50)
     
     # Print quick summary
     analysis = analyzer.analyze_patterns()
-    print(f"Total Scenarios: {analysis['total_scenarios']}")
-    print(f"Pass Rate: {analysis['overall_pass_rate']}%")
-    print(f"Most Common Failure: {max(analysis['failure_types'].items(), key=lambda x: x[1])[0] if analysis['failure_types'] else 'None'}")
-    print(f"Most Problematic Feature: {max(analysis['failing_features'].items(), key=lambda x: x[1])[0] if analysis['failing_features'] else 'None'}")
+    logger.info(f"Total Scenarios: {analysis['total_scenarios']}")
+    logger.info(f"Pass Rate: {analysis['overall_pass_rate']}%")
+    logger.info(f"Most Common Failure: {analysis['failure_types'].most_common(1)[0][0] if analysis['failure_types'] else 'None'}")
+    logger.info(f"Most Problematic Feature: {analysis['failing_features'].most_common(1)[0][0] if analysis['failing_features'] else 'None'}")
+    _log_buffer.flush()
 
 
 if __name__ == "__main__":